@@ -0,0 +1,266 @@
+"""
+Lazily read, sliceable mono views of audio files.
+
+`open_audio(path)` returns an AudioSource that behaves like a read-only 1-D
+float32 array: `len()`, slicing and `np.asarray()` work, but samples are only
+read for the range that is asked for. Plain PCM/float WAV files are
+memory-mapped straight from their data chunk; other formats libsndfile can
+seek in exactly (FLAC, OGG, 24-bit WAV, ...) are read with seek + block
+reads. MP3, whose frame count and seeking are only approximate in
+libsndfile, is decoded once with soundfile, or with `sequential=True`
+decoded front to back block by block whenever it is read (for one pass
+over a long file, as the batch tool makes). Anything libsndfile cannot
+open falls back to decoding the whole file with librosa.
+
+Channels are averaged to mono and integer samples scaled to [-1, 1), matching
+`librosa.load(path, sr=None)`. `read` and `blocks` with `mono=False` keep
+the channels of multichannel files instead, shaped (channels, samples).
+"""
+import struct
+import threading
+
+import numpy as np
+
+BLOCK_SIZE = 65536
+
+WAV_FORMAT_PCM = 1
+WAV_FORMAT_FLOAT = 3
+WAV_FORMAT_EXTENSIBLE = 0xFFFE
+
+# libsndfile formats whose frame count and seek positions are approximate
+INEXACT_FORMATS = {"MP3", "MPEG"}
+
+WAV_DTYPES = {
+    (WAV_FORMAT_PCM, 8): np.dtype("u1"),
+    (WAV_FORMAT_PCM, 16): np.dtype("<i2"),
+    (WAV_FORMAT_PCM, 32): np.dtype("<i4"),
+    (WAV_FORMAT_FLOAT, 32): np.dtype("<f4"),
+    (WAV_FORMAT_FLOAT, 64): np.dtype("<f8"),
+}
+
+
+class AudioSource:
+    """
+    Base class: subclasses implement `_read(start, stop, mono)` returning float32
+    mono samples, or (channels, samples) for `mono=False` and more than one channel.
+    """
+    dtype = np.dtype(np.float32)
+    ndim = 1
+
+    def __init__(self, path, fs, frames, channels):
+        self.path = path
+        self.fs = fs
+        self.frames = frames
+        self.channels = channels
+
+    def __len__(self):
+        return self.frames
+
+    @property
+    def shape(self):
+        return (self.frames,)
+
+    @property
+    def duration(self):
+        return self.frames / self.fs
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.frames)
+            if stop <= start:
+                return np.zeros(0, dtype=self.dtype)
+            samples = self._read(start, stop)
+            return samples if step == 1 else samples[::step]
+        index = key + self.frames if key < 0 else key
+        if not 0 <= index < self.frames:
+            raise IndexError("sample index out of range")
+        return self._read(index, index + 1)[0]
+
+    def __array__(self, dtype=None, copy=None):
+        samples = self.read()
+        return samples if dtype is None else samples.astype(dtype)
+
+    def channel_shape(self, frames, mono=True):
+        """Shape of `frames` samples as `read(..., mono)` returns them."""
+        return (frames,) if mono or self.channels == 1 else (self.channels, frames)
+
+    def read(self, start=0, stop=None, mono=True):
+        """Materialise [start, stop) block by block into one float32 array."""
+        stop = self.frames if stop is None else min(stop, self.frames)
+        out = np.empty(self.channel_shape(max(stop - start, 0), mono), dtype=self.dtype)
+        for offset in range(start, stop, BLOCK_SIZE):
+            end = min(offset + BLOCK_SIZE, stop)
+            out[..., offset - start:end - start] = self._read(offset, end, mono)
+        return out
+
+    def blocks(self, block_size=BLOCK_SIZE, start=0, stop=None, mono=True):
+        stop = self.frames if stop is None else min(stop, self.frames)
+        for offset in range(start, stop, block_size):
+            yield self._read(offset, min(offset + block_size, stop), mono)
+
+    def _read(self, start, stop, mono=True):
+        raise NotImplementedError
+
+
+class WavMemmapSource(AudioSource):
+    """PCM or float WAV mapped directly from its data chunk."""
+
+    def __init__(self, path, fs, channels, dtype, offset, data_bytes):
+        frames = data_bytes // (dtype.itemsize * channels)
+        super().__init__(path, fs, frames, channels)
+        self._data = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(frames, channels))
+        if dtype.kind == "u":
+            self._shift, self._scale = 128, 1 / 128
+        elif dtype.kind == "i":
+            self._shift, self._scale = 0, 1 / 2 ** (8 * dtype.itemsize - 1)
+        else:
+            self._shift, self._scale = 0, 1
+
+    def _read(self, start, stop, mono=True):
+        block = self._data[start:stop]
+        if self.channels == 1:
+            samples = block[:, 0].astype(np.float32)
+        elif mono:
+            samples = block.mean(axis=1, dtype=np.float32)
+        else:
+            samples = block.T.astype(np.float32)
+        if self._shift:
+            samples -= self._shift
+        if self._scale != 1:
+            samples *= self._scale
+        return samples
+
+
+class SoundFileSource(AudioSource):
+    """Any format libsndfile can seek in, read block by block."""
+
+    def __init__(self, path):
+        import soundfile as sf
+
+        self._file = sf.SoundFile(path)
+        self._lock = threading.Lock()
+        super().__init__(path, self._file.samplerate, self._file.frames, self._file.channels)
+
+    def _read(self, start, stop, mono=True):
+        with self._lock:
+            self._file.seek(start)
+            block = self._file.read(stop - start, dtype="float32", always_2d=True)
+        if len(block) < stop - start:
+            block = np.pad(block, ((0, stop - start - len(block)), (0, 0)))
+        if self.channels == 1:
+            return block[:, 0].copy()
+        return block.mean(axis=1, dtype=np.float32) if mono else block.T.copy()
+
+
+class SequentialSource(AudioSource):
+    """
+    A format libsndfile decodes exactly only from the start (MP3), decoded again on every read.
+
+    `len()` is libsndfile's estimate of the frame count; `blocks` without
+    `stop` yields every decoded sample, however many there turn out to be.
+    Cheap for one pass through `blocks` or `read`, slow for random access.
+    """
+
+    def __init__(self, path, info):
+        super().__init__(path, info.samplerate, info.frames, info.channels)
+
+    def read(self, start=0, stop=None, mono=True):
+        blocks = list(self.blocks(BLOCK_SIZE, start, stop, mono))
+        return np.concatenate(blocks, axis=-1) if blocks else np.zeros(self.channel_shape(0, mono), np.float32)
+
+    def blocks(self, block_size=BLOCK_SIZE, start=0, stop=None, mono=True):
+        import soundfile as sf
+
+        position = 0
+        with sf.SoundFile(self.path) as file:
+            # Decode and drop everything before `start` rather than seek
+            for block in file.blocks(block_size, dtype="float32", always_2d=True):
+                block = block[max(start - position, 0):len(block) if stop is None else max(stop - position, 0)]
+                position += block_size
+                if len(block):
+                    if self.channels == 1:
+                        yield block[:, 0].copy()
+                    else:
+                        yield block.mean(axis=1, dtype=np.float32) if mono else block.T.copy()
+                if stop is not None and position >= stop:
+                    return
+
+    def _read(self, start, stop, mono=True):
+        samples = self.read(start, stop, mono)
+        if samples.shape[-1] < stop - start:
+            samples = np.pad(samples, [(0, 0)] * (samples.ndim - 1) + [(0, stop - start - samples.shape[-1])])
+        return samples
+
+
+class ArraySource(AudioSource):
+    """Already decoded samples, mono or (channels, samples), for formats that can only be decoded whole."""
+
+    def __init__(self, path, samples, fs):
+        samples = np.asarray(samples, dtype=np.float32)
+        super().__init__(path, fs, samples.shape[-1], 1 if samples.ndim == 1 else samples.shape[0])
+        self._samples = samples
+
+    def _read(self, start, stop, mono=True):
+        block = self._samples[..., start:stop]
+        return block.mean(axis=0) if mono and block.ndim == 2 else block
+
+
+def parse_wav_header(path):
+    """
+    Locate the sample layout of a WAV file.
+
+    Returns (fs, channels, dtype, data_offset, data_bytes), with dtype None
+    when the encoding cannot be memory-mapped (e.g. 24-bit PCM), or None if
+    the file is not a RIFF/WAVE file.
+    """
+    with open(path, "rb") as file:
+        riff = file.read(12)
+        if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+            return None
+        file_size = file.seek(0, 2)
+        position = 12
+        fmt = None
+        while position + 8 <= file_size:
+            file.seek(position)
+            chunk_id, chunk_size = struct.unpack("<4sI", file.read(8))
+            if chunk_id == b"fmt ":
+                fmt = file.read(min(chunk_size, 40))
+            elif chunk_id == b"data" and fmt is not None:
+                audio_format, channels, fs = struct.unpack("<HHI", fmt[:8])
+                bits = struct.unpack("<H", fmt[14:16])[0]
+                if audio_format == WAV_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+                    audio_format = struct.unpack("<H", fmt[24:26])[0]
+                # Streamed writers may leave the size unset; trust the file length instead
+                data_bytes = min(chunk_size, file_size - position - 8)
+                return fs, channels, WAV_DTYPES.get((audio_format, bits)), position + 8, data_bytes
+            position += 8 + chunk_size + (chunk_size & 1)
+    return None
+
+
+def open_audio(path, sequential=False):
+    """
+    Open an audio file as the cheapest lazily-read AudioSource available.
+
+    With `sequential`, MP3 is opened as a SequentialSource instead of being
+    decoded whole up front.
+    """
+    if path.lower().endswith(".wav"):
+        layout = parse_wav_header(path)
+        if layout is not None and layout[2] is not None and layout[1] > 0:
+            fs, channels, dtype, offset, data_bytes = layout
+            return WavMemmapSource(path, fs, channels, dtype, offset, data_bytes)
+    import soundfile as sf
+
+    try:
+        info = sf.info(path)
+    except RuntimeError:
+        import librosa
+
+        samples, fs = librosa.load(path, sr=None, mono=False)
+        return ArraySource(path, samples, fs)
+    if info.format not in INEXACT_FORMATS:
+        return SoundFileSource(path)
+    if sequential:
+        return SequentialSource(path, info)
+    data, fs = sf.read(path, dtype="float32", always_2d=True)
+    return ArraySource(path, data[:, 0] if info.channels == 1 else data.T, fs)
@@ -0,0 +1,238 @@
+"""
+Apply a saved EQ preset to whole directories without the GUI.
+
+    python -m batch preset.json "animalsSounds/*.mp3" "Signals/ECG Signals/*.csv" -o out [-j 4]
+
+A preset is the JSON written by Tools > Save EQ Preset:
+
+    {"mode": "Animal Sounds Mode",
+     "bands": [{"band": 0, "gain": 0},
+               {"band": 2, "gain": 3, "window": "gaussian", "mu": 3000, "std": 1.5}]}
+
+Bands are applied in list order, like slider moves, so later entries win where
+bands overlap; `window` is one of the smoothing windows of the smoother tab
+(rectangle if omitted). Multichannel audio keeps its channels. Each file runs through EqualizerEngine, the same DSP
+as the GUI, when its whole-file analysis fits in --max-memory-mb. Longer
+audio files are decoded and equalized block by block instead (tolerance in
+streaming.py), MP3 included, so a worker never needs much more than that
+budget. The exceptions are formats libsndfile cannot read (m4a, wma, ...),
+which librosa can only decode whole; such files are listed as "(decoded
+whole)" when they were too long for the engine. CSV records over the
+budget (e.g. Holter ECG) are equalized one overlapping analysis window at
+a time (holter.py) and written as they go. With --engine iir every file is
+streamed through the causal biquad filter bank of iir.py instead. Audio is
+written as WAV, CSV signals as CSV with their original time column.
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from engine import (MODE_FREQUENCY_RANGES, UNIFORM_MODE, WINDOW_NAMES, EqualizerEngine, band_count,
+                    band_gain_curve, mode_frequency_ranges)
+
+MAX_MEMORY_MB = 512
+# Signal, spectrum, gains, magnitudes and output of an EqualizerEngine per input sample
+ENGINE_BYTES_PER_SAMPLE = 64
+MODES = [UNIFORM_MODE] + list(MODE_FREQUENCY_RANGES)
+
+
+def save_preset(file_path, mode, band_settings):
+    """Write `band_settings` (band -> (value, window spec or None), in write order) as a preset."""
+    bands = []
+    for band_index, (value, window) in band_settings.items():
+        entry = {"band": band_index, "gain": value}
+        if window is not None:
+            index, mu, std = window
+            entry["window"] = WINDOW_NAMES[index]
+            if mu is not None:
+                entry.update(mu=mu, std=std)
+        bands.append(entry)
+    with open(file_path, "w") as file:
+        json.dump({"mode": mode, "bands": bands}, file, indent=2)
+
+
+def load_preset(file_path):
+    """Read a preset into (mode, band_settings) as the engine's set_gain expects them."""
+    with open(file_path) as file:
+        preset = json.load(file)
+    mode = preset.get("mode")
+    if mode not in MODES:
+        raise ValueError(f"Unknown mode {mode!r}, expected one of {MODES}")
+    band_settings = OrderedDict()
+    for entry in preset.get("bands", []):
+        band_index = int(entry["band"])
+        if not 0 <= band_index < band_count(mode):
+            raise ValueError(f"{mode} has no band {band_index}")
+        window = entry.get("window", WINDOW_NAMES[0])
+        if window not in WINDOW_NAMES:
+            raise ValueError(f"Unknown window {window!r}, expected one of {WINDOW_NAMES}")
+        index = WINDOW_NAMES.index(window)
+        spec = (index, float(entry["mu"]), float(entry["std"])) if index == 3 else (index, None, None)
+        band_settings.pop(band_index, None)
+        band_settings[band_index] = (float(entry["gain"]), spec)
+    return mode, band_settings
+
+
+def expand_inputs(patterns):
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        paths.extend(path for path in matches if os.path.isfile(path))
+    return list(dict.fromkeys(paths))
+
+
+def output_paths(paths, out_dir):
+    """Output file of every input, made unique when inputs share a name."""
+    used = set()
+    outputs = []
+    for path in paths:
+        stem, extension = os.path.splitext(os.path.basename(path))
+        extension = ".csv" if extension.lower() == ".csv" else ".wav"
+        name, suffix = stem + extension, 1
+        while name in used:
+            name = f"{stem}_{suffix}{extension}"
+            suffix += 1
+        used.add(name)
+        outputs.append(os.path.join(out_dir, name))
+    return outputs
+
+
+def equalize_csv(path, out_path, mode, band_settings, dtype, max_bytes=MAX_MEMORY_MB * 2**20, engine="fft"):
+    import pandas as pd
+
+    from csv_io import read_csv, read_header
+
+    time_column, value_column = read_header(path)
+    t, signal, fs = read_csv(path)
+    if engine == "fft" and len(signal) * ENGINE_BYTES_PER_SAMPLE > max_bytes:
+        return _equalize_windows(t, signal, fs, out_path, (time_column, value_column), mode, band_settings)
+    if engine == "iir":
+        from iir import IirEqualizer
+
+        n = len(signal)
+        curve = band_gain_curve(mode, n, fs, mode_frequency_ranges(mode, n), band_settings)
+        output = IirEqualizer(fs, curve).process(signal)
+    else:
+        output = _equalize(signal, fs, mode, band_settings, dtype)
+    pd.DataFrame({time_column: t, value_column: np.real(output)}).to_csv(out_path, index=False)
+    return len(signal) / fs, engine if engine == "iir" else "engine"
+
+
+def equalize_audio(path, out_path, mode, band_settings, dtype, max_bytes, engine="fft"):
+    import soundfile as sf
+
+    from audio_io import ArraySource, open_audio
+    from streaming import equalize_blocks
+
+    source = open_audio(path, sequential=True)
+    n = len(source)
+    # soundfile reads and writes (frames, channels); the engine works on (channels, frames)
+    if engine == "fft" and n * source.channels * ENGINE_BYTES_PER_SAMPLE <= max_bytes:
+        output = _equalize(source.read(mono=False), source.fs, mode, band_settings, dtype)
+        sf.write(out_path, output.T, source.fs)
+        return source.duration, "engine"
+
+    curve = band_gain_curve(mode, n, source.fs, mode_frequency_ranges(mode, n), band_settings)
+    if engine == "iir":
+        from iir import equalize_blocks as equalize_blocks_iir
+
+        blocks = equalize_blocks_iir(source.blocks(mono=False), source.fs, curve)
+    else:
+        blocks = equalize_blocks(source.blocks(mono=False), source.fs, curve)
+    with sf.SoundFile(out_path, "w", samplerate=source.fs, channels=source.channels) as out:
+        for block in blocks:
+            out.write(block.T)
+    method = engine if engine == "iir" else "stream"
+    # Bounded memory only holds for sources read block by block
+    return source.duration, method + " (decoded whole)" if isinstance(source, ArraySource) else method
+
+
+def _equalize_windows(t, signal, fs, out_path, columns, mode, band_settings):
+    import pandas as pd
+
+    from holter import HolterRecord
+
+    n = len(signal)
+    record = HolterRecord(t, signal, fs, mode, mode_frequency_ranges(mode, n), summary=False)
+    # Bands are laid out for the whole record, gains sampled on the window frames
+    curve = band_gain_curve(mode, n, fs, record.frequency_ranges, band_settings)
+    gains = record.frame_gains(curve)
+    with open(out_path, "w", newline="") as out:
+        out.write(",".join(columns) + "\n")
+        for start, block in record.equalized_blocks(gains):
+            pd.DataFrame({columns[0]: t[start:start + len(block)], columns[1]: block}).to_csv(
+                out, header=False, index=False)
+    return n / fs, "windows"
+
+
+def _equalize(signal, fs, mode, band_settings, dtype):
+    engine = EqualizerEngine(dtype=dtype)
+    engine.load(signal, fs, mode, mode_frequency_ranges(mode, signal.shape[-1]))
+    for band_index, (value, window) in band_settings.items():
+        engine.set_gain(band_index, value, window)
+    return engine.reconstruct()
+
+
+def process_file(path, out_path, mode, band_settings, dtype="float64", max_bytes=MAX_MEMORY_MB * 2**20,
+                 engine="fft"):
+    """Equalize one file into `out_path`; returns (seconds of signal, method used)."""
+    if path.lower().endswith(".csv"):
+        return equalize_csv(path, out_path, mode, band_settings, dtype, max_bytes, engine)
+    return equalize_audio(path, out_path, mode, band_settings, dtype, max_bytes, engine)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m batch", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("preset", help="EQ preset JSON saved from the equalizer")
+    parser.add_argument("inputs", nargs="+", help="input files or glob patterns (** recurses)")
+    parser.add_argument("-o", "--output-dir", required=True)
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--max-memory-mb", type=float, default=MAX_MEMORY_MB,
+                        help="per-file engine budget; longer audio is streamed, longer CSV records windowed")
+    parser.add_argument("--precision", choices=["float64", "float32"], default="float64")
+    parser.add_argument("--engine", choices=["fft", "iir"], default="fft",
+                        help="fft: whole-file masking as in the GUI; iir: causal biquad bank, always streamed")
+    args = parser.parse_args(argv)
+
+    mode, band_settings = load_preset(args.preset)
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        parser.error("no input files matched")
+    os.makedirs(args.output_dir, exist_ok=True)
+    outputs = output_paths(paths, args.output_dir)
+    max_bytes = int(args.max_memory_mb * 2**20)
+
+    start = time.perf_counter()
+    seconds = 0.0
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {executor.submit(process_file, path, out_path, mode, band_settings, args.precision, max_bytes,
+                                   args.engine): path
+                   for path, out_path in zip(paths, outputs)}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                duration, method = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"failed  {path}: {e}", file=sys.stderr)
+                continue
+            seconds += duration
+            print(f"{method:7} {path} ({duration:.1f} s)")
+    elapsed = time.perf_counter() - start
+
+    done = len(paths) - failures
+    print(f"{done} files, {seconds:.1f} s of signal in {elapsed:.2f} s: "
+          f"{done / elapsed:.2f} files/s, {seconds / elapsed:.1f} signal-s/s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
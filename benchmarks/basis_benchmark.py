@@ -0,0 +1,68 @@
+"""
+Slider-tick latency of the band-basis reconstruction against the IFFT path.
+
+Runs Musical Instruments Mode over the bundled music/*.wav tracks:
+
+    python benchmarks/basis_benchmark.py [--ticks 50] [--budget-mb 512]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+import numpy as np
+import soundfile as sf
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from engine import EqualizerEngine, MUSIC_MODE, make_window  # noqa: E402
+
+INSTRUMENT_RANGES = [[0, 1000], [1000, 2000], [2000, 3000], [4000, 5000]]
+
+
+def load_mono(file_path):
+    data, fs = sf.read(file_path, dtype="float32", always_2d=True)
+    return data.mean(axis=1), fs
+
+
+def time_ticks(engine, ticks, seed=0):
+    rng = np.random.default_rng(seed)
+    samples = []
+    for _ in range(ticks):
+        band = int(rng.integers(len(engine.bands)))
+        window = make_window(0, engine.band_frequencies(band))
+        start = time.perf_counter()
+        engine.set_gain(band, int(rng.integers(0, 6)), window)
+        engine.reconstruct()
+        samples.append(time.perf_counter() - start)
+    return np.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=50)
+    parser.add_argument("--budget-mb", type=float, default=512)
+    args = parser.parse_args()
+
+    root = os.path.join(os.path.dirname(__file__), os.pardir, "music")
+    print(f"{'track':32} {'seconds':>8} {'ifft ms':>8} {'basis ms':>9} {'speedup':>8} {'build ms':>9} {'basis MB':>9} {'max err':>9}")
+    for file_path in sorted(glob.glob(os.path.join(root, "*.wav"))):
+        signal, fs = load_mono(file_path)
+
+        fft_engine = EqualizerEngine()
+        fft_engine.load(signal, fs, MUSIC_MODE, INSTRUMENT_RANGES)
+        fft_ms = time_ticks(fft_engine, args.ticks)
+
+        basis_engine = EqualizerEngine(basis_budget=int(args.budget_mb * 2**20))
+        start = time.perf_counter()
+        basis_engine.load(signal, fs, MUSIC_MODE, INSTRUMENT_RANGES)
+        build_ms = (time.perf_counter() - start) * 1000
+        basis_ms = time_ticks(basis_engine, args.ticks)
+
+        error = np.max(np.abs(basis_engine.reconstruct() - fft_engine.reconstruct()))
+        print(f"{os.path.basename(file_path)[:32]:32} {len(signal) / fs:8.1f} {fft_ms:8.2f} {basis_ms:9.2f} "
+              f"{fft_ms / basis_ms:7.1f}x {build_ms:9.1f} {basis_engine.basis_bytes / 2**20:9.1f} {error:9.1e}")
+
+
+if __name__ == "__main__":
+    main()
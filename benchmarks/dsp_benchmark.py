@@ -0,0 +1,221 @@
+"""
+Headless DSP benchmark over the bundled recordings and synthetic long signals.
+
+Times every stage the equalizer runs for a file, in every mode:
+
+- load: decode the audio (open_audio) or read the CSV (read_csv), as the GUI does;
+  repeats of a CSV case read its binary sidecar, so compare the min with the median
+- fft: EqualizerEngine.load (spectrum and band table)
+- gain: one slider move (set_gain with a hanning window)
+- reconstruct: EqualizerEngine.reconstruct
+- spectrogram: compute_spectrogram of the original
+- export: write the reconstruction as 16-bit WAV (export.write_audio) or CSV (signals)
+
+    python benchmarks/dsp_benchmark.py [--repeat 5] [--quick] [--filter music] \\
+        [--output results.json] [--baseline baseline.json] [--tolerance 0.25]
+
+Results are JSON (environment plus median/min ms per case and stage). With
+--baseline the medians are compared against an earlier results file and the
+script exits non-zero when any stage got slower than the tolerance allows.
+Synthetic signals use fixed seeds and are written to temporary WAV/CSV files
+first, so runs are comparable across machines and commits.
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np  # noqa: E402
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+sys.path.insert(0, ROOT)
+from engine import (ANIMAL_MODE, ECG_MODE, MUSIC_MODE, UNIFORM_MODE, EqualizerEngine,  # noqa: E402
+                    channel_view, mode_frequency_ranges)
+
+STAGES = ["load", "fft", "gain", "reconstruct", "spectrogram", "export"]
+# Modes each kind of input is benchmarked in
+AUDIO_MODES = [MUSIC_MODE, ANIMAL_MODE, UNIFORM_MODE]
+CSV_MODES = [ECG_MODE, UNIFORM_MODE]
+
+
+def audio_loader(file_path):
+    def load():
+        from audio_io import open_audio
+
+        source = open_audio(file_path)
+        return source.read(mono=False), source.fs
+    return load
+
+
+def csv_loader(file_path):
+    def load():
+        from csv_io import read_csv
+
+        _, samples, fs = read_csv(file_path)
+        return samples, fs
+    return load
+
+
+def synthetic_file(work_dir, kind, seconds, fs, seed, channels=1):
+    """Write a tone-plus-noise signal once, so its load stage times the real WAV/CSV readers."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(seconds * fs)) / fs
+    signal = 0.05 * rng.standard_normal((len(t), channels))
+    for frequency in rng.uniform(1, fs / 4, 8):
+        signal += 0.1 * np.sin(2 * np.pi * frequency * t)[:, None]
+    if channels == 1:
+        signal = signal[:, 0]
+    file_path = os.path.join(work_dir, f"synthetic_{seed}.{'wav' if kind == 'audio' else 'csv'}")
+    if kind == "audio":
+        import soundfile as sf
+
+        sf.write(file_path, signal.astype(np.float32), fs, subtype="FLOAT")
+    else:
+        np.savetxt(file_path, np.column_stack([t, signal]), delimiter=",", header="time,amplitude", comments="")
+    return file_path
+
+
+def cases(quick, work_dir):
+    """(name, loader, kind, modes) for every benchmarked input."""
+    found = []
+    for file_path in sorted(glob.glob(os.path.join(ROOT, "music", "*.wav"))):
+        found.append((f"music/{os.path.basename(file_path)}", audio_loader(file_path), "audio", [MUSIC_MODE]))
+    found.append(("animalsSounds/animals.wav", audio_loader(os.path.join(ROOT, "animalsSounds", "animals.wav")),
+                  "audio", [ANIMAL_MODE]))
+    for file_path in sorted(glob.glob(os.path.join(ROOT, "Signals", "ECG Signals", "*.csv"))):
+        found.append((f"ecg/{os.path.basename(file_path)}", csv_loader(file_path), "csv", [ECG_MODE]))
+    found.append(("uniform/synthetic_signal.csv",
+                  csv_loader(os.path.join(ROOT, "Signals", "Uniform Signal", "synthetic_signal.csv")),
+                  "csv", [UNIFORM_MODE]))
+    if not quick:
+        found.append(("synthetic/10min_44k", audio_loader(synthetic_file(work_dir, "audio", 600, 44100, 1)),
+                      "audio", AUDIO_MODES))
+        found.append(("synthetic/10min_44k_stereo",
+                      audio_loader(synthetic_file(work_dir, "audio", 600, 44100, 3, channels=2)), "audio", AUDIO_MODES))
+        found.append(("synthetic/1h_ecg_500hz", csv_loader(synthetic_file(work_dir, "csv", 3600, 500, 2)),
+                      "csv", CSV_MODES))
+    return found
+
+
+def timed(results, stage, function, *args):
+    start = time.perf_counter()
+    value = function(*args)
+    results[stage].append((time.perf_counter() - start) * 1000)
+    return value
+
+
+def export(kind, output_dir, signal, fs):
+    if kind == "audio":
+        from export import write_audio
+
+        write_audio(os.path.join(output_dir, "export.wav"), signal, fs, "wav16")
+    else:
+        import pandas as pd
+
+        pd.DataFrame({"time": np.arange(len(signal)) / fs, "amplitude": signal}).to_csv(
+            os.path.join(output_dir, "export.csv"), index=False)
+
+
+def run_case(loader, kind, mode, repeat, output_dir):
+    from spectrogram import compute_spectrogram
+
+    results = {stage: [] for stage in STAGES}
+    samples = 0
+    for run in range(repeat):
+        signal, fs = timed(results, "load", loader)
+        samples = signal.size
+        engine = EqualizerEngine()
+        timed(results, "fft", engine.load, signal, fs, mode, mode_frequency_ranges(mode, signal.shape[-1]))
+        band = run % len(engine.bands)
+        timed(results, "gain", engine.set_gain, band, 2, (2, None, None))
+        output = timed(results, "reconstruct", engine.reconstruct)
+        timed(results, "spectrogram", compute_spectrogram, channel_view(signal), fs)
+        timed(results, "export", export, kind, output_dir, output, fs)
+    return samples, results
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                                text=True).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(rows, baseline_path, tolerance):
+    with open(baseline_path) as file:
+        baseline = {(row["case"], row["mode"], row["stage"]): row for row in json.load(file)["results"]}
+    regressions = 0
+    print(f"\n{'case':40} {'mode':26} {'stage':12} {'base ms':>9} {'now ms':>9} {'ratio':>6}")
+    for row in rows:
+        before = baseline.get((row["case"], row["mode"], row["stage"]))
+        if before is None or row.get("error") or before.get("error") or not before["median_ms"]:
+            continue
+        ratio = row["median_ms"] / before["median_ms"]
+        slower = ratio > 1 + tolerance
+        regressions += slower
+        print(f"{row['case']:40} {row['mode']:26} {row['stage']:12} {before['median_ms']:9.2f} "
+              f"{row['median_ms']:9.2f} {ratio:6.2f}{'  SLOWER' if slower else ''}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="skip the synthetic long signals")
+    parser.add_argument("--filter", default="", help="only cases whose name contains this")
+    parser.add_argument("--output", help="write results JSON here")
+    parser.add_argument("--baseline", help="results JSON to compare medians against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'case':40} {'mode':26} {'samples':>10} " + " ".join(f"{stage:>11}" for stage in STAGES))
+    with tempfile.TemporaryDirectory() as output_dir:
+        for name, loader, kind, modes in cases(args.quick, output_dir):
+            if args.filter not in name:
+                continue
+            for mode in modes:
+                try:
+                    samples, results = run_case(loader, kind, mode, args.repeat, output_dir)
+                except Exception as e:
+                    rows.append({"case": name, "mode": mode, "stage": "load", "error": str(e)})
+                    print(f"{name:40} {mode:26} failed: {e}")
+                    continue
+                for stage in STAGES:
+                    rows.append({"case": name, "mode": mode, "stage": stage, "samples": samples,
+                                 "median_ms": float(np.median(results[stage])), "min_ms": float(np.min(results[stage])),
+                                 "runs": len(results[stage])})
+                medians = " ".join(f"{np.median(results[stage]):11.2f}" for stage in STAGES)
+                print(f"{name:40} {mode:26} {samples:10d} {medians}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"environment": environment(), "repeat": args.repeat, "results": rows}, file, indent=2)
+
+    if args.baseline:
+        regressions = compare(rows, args.baseline, args.tolerance)
+        if regressions:
+            print(f"{regressions} stage(s) slower than the baseline by more than {args.tolerance:.0%}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Latency and memory of one slider update per FFT backend (see fft_backend).
+
+For every installed backend and every case (fixed-seed noise; the first is
+as long as the Normal ECG record, whose length 3341 = 13 * 257 has no fast
+FFT), the engine loads the signal and then repeatedly applies one slider
+move and reconstructs, as the recompute worker does. Reported per update:
+
+- median and min latency in ms
+- peak memory numpy allocated (tracemalloc), also in units of the output
+  size; 1.0 means the update allocated nothing but its output
+- for comparison, the same update with the spectrum product allocated
+  afresh every time, as the engine did before its work buffer ("fresh")
+
+plus, for the Holter rows, the frame transform at the raw and at the
+fast_length-padded frame length.
+
+    python benchmarks/fft_benchmark.py [--repeat 20] [--workers N] [--quick] [--output results.json]
+
+The scipy and pyfftw backends only differ from numpy in latency on machines
+with more than one core (and with --workers unset or above 1).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+import fft_backend  # noqa: E402
+from engine import (ECG_MODE, ECG_NORMAL_LENGTH, MUSIC_MODE, EqualizerEngine,  # noqa: E402
+                    mode_frequency_ranges)
+from fft_backend import available_backends, fast_length, set_backend  # noqa: E402
+from holter import OVERLAP_SECONDS, WINDOW_SECONDS  # noqa: E402
+
+
+def cases(quick):
+    """(name, shape, fs, mode) of every benchmarked signal."""
+    found = [("ecg_normal_3341", (ECG_NORMAL_LENGTH,), 500, ECG_MODE),
+             ("audio_1min_mono", (60 * 44100,), 44100, MUSIC_MODE)]
+    if not quick:
+        found.append(("audio_10min_stereo", (2, 600 * 44100), 44100, MUSIC_MODE))
+    return found
+
+
+def fresh_update(engine):
+    # The pre-work-buffer path: spectrum * gains allocated on every update
+    return fft_backend.irfft(engine.spectrum * engine.gains, n=engine.length, axis=-1)
+
+
+def timed_updates(engine, update, repeat):
+    """(latencies ms, peak MB) of `repeat` slider moves each followed by `update`."""
+    times = []
+    peak = 0
+    for run in range(repeat):
+        engine.set_gain(run % len(engine.bands), 0.5 + run % 3)
+        tracemalloc.start()
+        start = time.perf_counter()
+        update()
+        times.append((time.perf_counter() - start) * 1000)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return times, peak / 2**20
+
+
+def run_case(shape, fs, mode, repeat):
+    rng = np.random.default_rng(len(shape) * shape[-1])
+    signal = rng.standard_normal(shape)
+    engine = EqualizerEngine()
+    engine.load(signal, fs, mode, mode_frequency_ranges(mode, shape[-1]))
+    output_mb = signal.nbytes / 2**20
+    # First update builds the work buffer (and FFTW plans), like the first slider move after a load
+    engine.reconstruct()
+    times, peak = timed_updates(engine, engine.reconstruct, repeat)
+    fresh_times, fresh_peak = timed_updates(engine, lambda: fresh_update(engine), repeat)
+    return {"samples": signal.size, "median_ms": float(np.median(times)), "min_ms": float(np.min(times)),
+            "peak_mb": peak, "peak_outputs": peak / output_mb,
+            "fresh_median_ms": float(np.median(fresh_times)), "fresh_peak_mb": fresh_peak,
+            "fresh_peak_outputs": fresh_peak / output_mb}
+
+
+def holter_frames(fs, repeat):
+    """Median ms of one frame's rfft + irfft at the raw and the padded Holter frame length."""
+    rows = {}
+    raw = int(round(WINDOW_SECONDS * fs)) + 2 * int(round(OVERLAP_SECONDS * fs))
+    for label, n in (("raw", raw), ("padded", fast_length(raw))):
+        frame = np.random.default_rng(n).standard_normal(n)
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fft_backend.irfft(fft_backend.rfft(frame), n=n)
+            times.append((time.perf_counter() - start) * 1000)
+        rows[label] = {"length": n, "median_ms": float(np.median(times))}
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--workers", type=int, help="threads for scipy and pyfftw (default: every core)")
+    parser.add_argument("--quick", action="store_true", help="skip the 10 minute stereo case")
+    parser.add_argument("--output", help="write results JSON here")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'backend':8} {'case':22} {'samples':>10} {'median ms':>10} {'min ms':>9} {'peak MB':>9} "
+          f"{'outputs':>8} {'fresh ms':>9} {'fresh MB':>9} {'outputs':>8}")
+    for backend in available_backends():
+        set_backend(backend, args.workers)
+        for name, shape, fs, mode in cases(args.quick):
+            row = {"backend": backend, "case": name, **run_case(shape, fs, mode, args.repeat)}
+            rows.append(row)
+            print(f"{backend:8} {name:22} {row['samples']:10d} {row['median_ms']:10.2f} {row['min_ms']:9.2f} "
+                  f"{row['peak_mb']:9.1f} {row['peak_outputs']:8.2f} {row['fresh_median_ms']:9.2f} "
+                  f"{row['fresh_peak_mb']:9.1f} {row['fresh_peak_outputs']:8.2f}")
+        # CSV sample rates are estimated from the time column, so a frame can have large prime factors
+        for fs in (250, 499.87):
+            frames = holter_frames(fs, args.repeat)
+            rows.append({"backend": backend, "case": f"holter_frame_{fs}hz", **frames})
+            print(f"{backend:8} {'holter_frame_' + str(fs) + 'hz':22} raw {frames['raw']['length']} "
+                  f"{frames['raw']['median_ms']:.2f} ms, padded {frames['padded']['length']} "
+                  f"{frames['padded']['median_ms']:.2f} ms")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"cpu_count": os.cpu_count(), "results": rows}, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""
+Throughput of window-by-window ECG processing on synthetic 24-hour Holter records.
+
+For every sample rate a single-lead record (beats at a jittered ~75 bpm,
+baseline wander, mains hum and noise; fixed seed) is written straight into
+a memory-mapped .npy file laid out like a CSV sidecar (see csv_io) and
+opened read-only, as the GUI opens a record after its first parse. Then:
+
+- summary: HolterRecord construction, i.e. the LOD pyramid (one pass over the record)
+- view: analysing and equalizing one window as the viewer does when it moves
+  to it (SignalAnalysis of the frame, one slider move, reconstruct), median
+  over windows spread across the record
+- export: equalizing every window in order (HolterRecord.equalized_blocks)
+
+with the peak memory numpy allocated in each stage (tracemalloc; the mapped
+record itself is not counted), which should stay near one frame for view
+and export whatever the record length.
+
+    python benchmarks/holter_benchmark.py [--hours 24] [--rates 250 500 1000] [--views 20] [--output results.json]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+from engine import ECG_MODE, EqualizerEngine, mode_frequency_ranges  # noqa: E402
+from holter import HolterRecord  # noqa: E402
+# Imported up front so the summary stage does not time pyqtgraph's import
+import lod  # noqa: E402,F401
+
+# Samples synthesised at a time while writing a record
+CHUNK_SECONDS = 600
+# (amplitude mV, offset s, width s) of the P, Q, R, S and T waves around each R peak
+BEAT_WAVES = [(0.15, -0.2, 0.025), (-0.1, -0.03, 0.01), (1.0, 0.0, 0.012), (-0.25, 0.03, 0.01), (0.3, 0.25, 0.04)]
+
+
+def beat(phase):
+    out = np.zeros_like(phase)
+    for amplitude, offset, width in BEAT_WAVES:
+        out += amplitude * np.exp(-0.5 * ((phase - offset) / width) ** 2)
+    return out
+
+
+def synthetic_record(file_path, hours, fs, seed):
+    """Write a (2, n) float64 time/amplitude .npy record and return it memory-mapped read-only."""
+    rng = np.random.default_rng(seed)
+    n = int(hours * 3600 * fs)
+    beats = np.cumsum(rng.normal(0.8, 0.05, int(hours * 3600 / 0.6) + 2)) - 0.5
+    data = np.lib.format.open_memmap(file_path, mode="w+", dtype=np.float64, shape=(2, n))
+    step = int(CHUNK_SECONDS * fs)
+    for start in range(0, n, step):
+        t = np.arange(start, min(start + step, n)) / fs
+        following = np.minimum(np.searchsorted(beats, t), len(beats) - 1)
+        signal = beat(t - beats[np.maximum(following - 1, 0)]) + beat(t - beats[following])
+        signal += 0.2 * np.sin(2 * np.pi * 0.3 * t) + 0.05 * np.sin(2 * np.pi * 50 * t)
+        signal += 0.02 * rng.standard_normal(len(t))
+        data[0, start:start + len(t)] = t
+        data[1, start:start + len(t)] = signal
+    data.flush()
+    del data
+    return np.load(file_path, mmap_mode="r")
+
+
+def measured(function, *args):
+    """(result, seconds, peak MB allocated) of one call."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = function(*args)
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return result, seconds, peak
+
+
+def view_window(record, index):
+    engine = EqualizerEngine()
+    engine.load_analysis(record.analysis(index))
+    engine.set_gain(2, 0)
+    return record.window_output(index, engine.reconstruct())
+
+
+def view_windows(record, count):
+    times = []
+    for index in np.linspace(0, record.window_count - 1, count).astype(int):
+        start = time.perf_counter()
+        view_window(record, index)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def export(record, gains):
+    for _ in record.equalized_blocks(gains):
+        pass
+
+
+def run_rate(work_dir, hours, fs, views):
+    data = synthetic_record(os.path.join(work_dir, f"holter_{fs}.npy"), hours, fs, seed=fs)
+    n = data.shape[1]
+    ranges = mode_frequency_ranges(ECG_MODE, n)
+    record, summary_s, summary_mb = measured(HolterRecord, data[0], data[1], fs, ECG_MODE, ranges)
+    view_times, _, view_mb = measured(view_windows, record, views)
+    engine = EqualizerEngine()
+    engine.load_analysis(record.analysis(0))
+    engine.set_gain(2, 0)
+    _, export_s, export_mb = measured(export, record, engine.gains)
+    return {
+        "fs": fs, "hours": hours, "samples": n, "windows": record.window_count,
+        "summary_s": summary_s, "summary_peak_mb": summary_mb, "summary_resident_mb": record.nbytes / 2**20,
+        "view_median_ms": float(np.median(view_times)) * 1000, "view_max_ms": float(np.max(view_times)) * 1000,
+        "view_peak_mb": view_mb,
+        "export_s": export_s, "export_msamples_per_s": n / export_s / 1e6, "export_peak_mb": export_mb,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--hours", type=float, default=24)
+    parser.add_argument("--rates", type=int, nargs="+", default=[250, 500, 1000])
+    parser.add_argument("--views", type=int, default=20, help="windows timed for the view stage")
+    parser.add_argument("--output", help="write results JSON here")
+    args = parser.parse_args()
+
+    rows = []
+    print(f"{'fs':>5} {'samples':>11} {'windows':>8} {'summary s':>10} {'summary MB':>11} {'view ms':>8} "
+          f"{'view MB':>8} {'export s':>9} {'Msamples/s':>11} {'export MB':>10}")
+    with tempfile.TemporaryDirectory() as work_dir:
+        for fs in args.rates:
+            row = run_rate(work_dir, args.hours, fs, args.views)
+            rows.append(row)
+            print(f"{fs:5d} {row['samples']:11d} {row['windows']:8d} {row['summary_s']:10.2f} "
+                  f"{row['summary_resident_mb']:11.1f} {row['view_median_ms']:8.1f} {row['view_peak_mb']:8.1f} "
+                  f"{row['export_s']:9.2f} {row['export_msamples_per_s']:11.1f} {row['export_peak_mb']:10.1f}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump({"results": rows}, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
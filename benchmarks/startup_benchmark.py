@@ -0,0 +1,89 @@
+"""
+Cold-start time of the equalizer window.
+
+Each run starts a fresh interpreter that imports main.py and then builds and
+shows MainApp, reporting the median import and window-ready times:
+
+    python benchmarks/startup_benchmark.py [--runs 5] [--max-import-ms 1500] [--max-ready-ms 3000]
+
+With a limit given, the script exits non-zero when the median exceeds it, so
+it can guard against import-time regressions. --slowest N lists the modules
+with the largest cumulative import time (from `python -X importtime`).
+Use QT_QPA_PLATFORM=offscreen on machines without a display.
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+import numpy as np
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+
+CHILD = r"""
+import sys, time
+start = time.perf_counter()
+import main
+imported = time.perf_counter()
+app = main.QApplication(sys.argv[:1])
+window = main.MainApp()
+window.show()
+app.processEvents()
+ready = time.perf_counter()
+print(imported - start, ready - start)
+"""
+
+
+def run_once(load_ui):
+    env = dict(os.environ, EQUALIZER_LOAD_UI="1" if load_ui else "0")
+    result = subprocess.run([sys.executable, "-c", CHILD], cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode:
+        sys.exit(f"Starting the equalizer failed:\n{result.stderr}")
+    imported, ready = map(float, result.stdout.split()[-2:])
+    return imported * 1000, ready * 1000
+
+
+def slowest_imports(count):
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative), name.rstrip()))
+    # Only top-level packages, so a package is not listed again for each submodule
+    top = [(us, name) for us, name in rows if "." not in name.strip()]
+    return sorted(top, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-import-ms", type=float)
+    parser.add_argument("--max-ready-ms", type=float)
+    parser.add_argument("--slowest", type=int, default=0, metavar="N")
+    args = parser.parse_args()
+
+    print(f"{'form':12} {'import ms':>10} {'ready ms':>10}")
+    medians = {}
+    for label, load_ui in (("design_ui", False), ("design.ui", True)):
+        times = np.array([run_once(load_ui) for _ in range(args.runs)])
+        medians[label] = np.median(times, axis=0)
+        print(f"{label:12} {medians[label][0]:10.0f} {medians[label][1]:10.0f}")
+
+    if args.slowest:
+        print(f"\n{'module':32} {'cumulative ms':>14}")
+        for us, name in slowest_imports(args.slowest):
+            print(f"{name.strip():32} {us / 1000:14.1f}")
+
+    imported, ready = medians["design_ui"]
+    failed = (args.max_import_ms is not None and imported > args.max_import_ms) or \
+             (args.max_ready_ms is not None and ready > args.max_ready_ms)
+    if failed:
+        print("startup time over the limit", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
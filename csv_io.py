@@ -0,0 +1,131 @@
+"""
+Two-column (time, amplitude) CSV signals of the Uniform and ECG modes.
+
+Parsing a long CSV is far slower than anything done with it afterwards, so
+`read_csv` keeps a binary sidecar next to each file it parses:
+`<name>.csv.npy` holds the time and amplitude columns as float64 rows and
+`<name>.csv.npy.json` the stamp of the CSV it came from (size, mtime and a
+hash of its first and last bytes) plus the estimated sample rate. Later
+reads of an unchanged file memory-map the sidecar instead of parsing; a
+changed or unreadable sidecar is rebuilt. The read that builds a sidecar
+returns it memory-mapped too, so a multi-hour record only stays resident
+while it is parsed. Directories that cannot be written to simply get no
+sidecar.
+"""
+import csv
+import hashlib
+import json
+import os
+from contextlib import suppress
+
+import numpy as np
+
+SIDECAR_SUFFIX = ".npy"
+STAMP_SUFFIX = ".npy.json"
+SIDECAR_VERSION = 1
+# Bytes hashed from each end of the CSV, catching rewrites that keep size and mtime
+HASH_BYTES = 1 << 20
+
+
+def read_csv(file_path, sidecar=True):
+    """
+    Read a CSV signal as (time, samples, fs).
+
+    The first column is time in seconds and the second the samples; fs is
+    the reciprocal of the median sample interval, so jittery timestamps do
+    not skew it. With `sidecar` the binary sidecar is used or (re)built.
+    """
+    if not sidecar:
+        time, samples = parse_csv(file_path)
+        return time, samples, estimate_fs(time)
+
+    stamp = file_stamp(file_path)
+    cached = _read_sidecar(file_path, stamp)
+    if cached is not None:
+        return cached
+    time, samples = parse_csv(file_path)
+    fs = estimate_fs(time)
+    _write_sidecar(file_path, stamp, time, samples, fs)
+    # Hand out the new sidecar's memory map, so the parsed columns can be freed right away
+    cached = _read_sidecar(file_path, stamp)
+    if cached is not None:
+        return cached
+    return time, samples, fs
+
+
+def read_header(file_path):
+    """
+    Names of the time and amplitude columns, taken like pandas takes them
+    in parse_csv: from the first line that is not blank.
+    """
+    with open(file_path, newline="") as file:
+        for row in csv.reader(file):
+            if any(cell.strip() for cell in row):
+                if len(row) < 2:
+                    raise ValueError(f"{file_path} needs a time and an amplitude column")
+                return row[0], row[1]
+    raise ValueError(f"{file_path} is empty")
+
+
+def parse_csv(file_path):
+    """Parse the first two columns as float64 (time, samples) with pandas' C parser."""
+    import pandas as pd
+
+    df = pd.read_csv(file_path, usecols=[0, 1], dtype=np.float64, engine="c")
+    return df.iloc[:, 0].to_numpy(), df.iloc[:, 1].to_numpy()
+
+
+def estimate_fs(time):
+    if len(time) < 2:
+        raise ValueError("A CSV signal needs at least two samples to derive its sample rate")
+    return 1 / float(np.median(np.diff(time)))
+
+
+def sidecar_paths(file_path):
+    return file_path + SIDECAR_SUFFIX, file_path + STAMP_SUFFIX
+
+
+def file_stamp(file_path):
+    stat = os.stat(file_path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as file:
+        digest.update(file.read(HASH_BYTES))
+        if stat.st_size > HASH_BYTES:
+            file.seek(max(stat.st_size - HASH_BYTES, HASH_BYTES))
+            digest.update(file.read(HASH_BYTES))
+    return {"version": SIDECAR_VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            "hash": digest.hexdigest()}
+
+
+def _read_sidecar(file_path, stamp):
+    data_path, stamp_path = sidecar_paths(file_path)
+    try:
+        with open(stamp_path) as file:
+            saved = json.load(file)
+        if {key: saved.get(key) for key in stamp} != stamp:
+            return None
+        data = np.load(data_path, mmap_mode="r")
+        if data.dtype != np.float64 or data.shape != (2, saved.get("samples")):
+            return None
+        return data[0], data[1], float(saved["fs"])
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _write_sidecar(file_path, stamp, time, samples, fs):
+    data_path, stamp_path = sidecar_paths(file_path)
+    data_temp, stamp_temp = data_path + ".tmp", stamp_path + ".tmp"
+    try:
+        # Drop the old stamp first, so an interrupted rebuild leaves no valid-looking pair
+        if os.path.exists(stamp_path):
+            os.remove(stamp_path)
+        with open(data_temp, "wb") as file:
+            np.save(file, np.stack([time, samples]))
+        os.replace(data_temp, data_path)
+        with open(stamp_temp, "w") as file:
+            json.dump(dict(stamp, samples=len(time), fs=fs), file)
+        os.replace(stamp_temp, stamp_path)
+    except OSError:
+        for temp in (data_temp, stamp_temp):
+            with suppress(OSError):
+                os.remove(temp)
@@ -0,0 +1,1159 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'design.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1055, 611)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("../../hp/hp/.designer/backup/titleIcon2.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        MainWindow.setWindowIcon(icon)
+        MainWindow.setToolTip("")
+        self.centralWidget = QtWidgets.QWidget(MainWindow)
+        self.centralWidget.setObjectName("centralWidget")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.centralWidget)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.label = QtWidgets.QLabel(self.centralWidget)
+        font = QtGui.QFont()
+        font.setPointSize(25)
+        font.setBold(True)
+        self.label.setFont(font)
+        self.label.setAlignment(QtCore.Qt.AlignCenter)
+        self.label.setObjectName("label")
+        self.gridLayout_3.addWidget(self.label, 0, 0, 1, 1)
+        self.tabWidget = QtWidgets.QTabWidget(self.centralWidget)
+        self.tabWidget.setStyleSheet("")
+        self.tabWidget.setTabPosition(QtWidgets.QTabWidget.North)
+        self.tabWidget.setTabShape(QtWidgets.QTabWidget.Rounded)
+        self.tabWidget.setElideMode(QtCore.Qt.ElideRight)
+        self.tabWidget.setUsesScrollButtons(False)
+        self.tabWidget.setDocumentMode(False)
+        self.tabWidget.setTabsClosable(False)
+        self.tabWidget.setMovable(True)
+        self.tabWidget.setTabBarAutoHide(False)
+        self.tabWidget.setObjectName("tabWidget")
+        self.equalizerTab = QtWidgets.QWidget()
+        self.equalizerTab.setAutoFillBackground(False)
+        self.equalizerTab.setStyleSheet("gridline-color: rgb(66, 111, 111);\n"
+"selection-background-color: rgb(83, 74, 65);\n"
+"background-color: rgb(83, 74, 65);\n"
+"color: rgb(66, 111, 111);")
+        self.equalizerTab.setObjectName("equalizerTab")
+        self.gridLayout_7 = QtWidgets.QGridLayout(self.equalizerTab)
+        self.gridLayout_7.setObjectName("gridLayout_7")
+        self.frequencyGroupBox = QtWidgets.QGroupBox(self.equalizerTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Maximum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.frequencyGroupBox.sizePolicy().hasHeightForWidth())
+        self.frequencyGroupBox.setSizePolicy(sizePolicy)
+        self.frequencyGroupBox.setMaximumSize(QtCore.QSize(16777215, 350))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.frequencyGroupBox.setFont(font)
+        self.frequencyGroupBox.setStyleSheet("color: rgb(238, 238, 238);")
+        self.frequencyGroupBox.setObjectName("frequencyGroupBox")
+        self.gridLayout = QtWidgets.QGridLayout(self.frequencyGroupBox)
+        self.gridLayout.setSizeConstraint(QtWidgets.QLayout.SetMaximumSize)
+        self.gridLayout.setObjectName("gridLayout")
+        self.frequencyLayout = QtWidgets.QVBoxLayout()
+        self.frequencyLayout.setContentsMargins(-1, -1, -1, 0)
+        self.frequencyLayout.setObjectName("frequencyLayout")
+        self.frequencyWidget = QtWidgets.QWidget(self.frequencyGroupBox)
+        self.frequencyWidget.setStyleSheet("background-color:rgb(4, 4, 4)")
+        self.frequencyWidget.setObjectName("frequencyWidget")
+        self.frequencyLayout.addWidget(self.frequencyWidget)
+        self.gridLayout.addLayout(self.frequencyLayout, 0, 0, 1, 1)
+        self.slidersLayout = QtWidgets.QHBoxLayout()
+        self.slidersLayout.setSizeConstraint(QtWidgets.QLayout.SetMinimumSize)
+        self.slidersLayout.setContentsMargins(-1, -1, -1, 0)
+        self.slidersLayout.setObjectName("slidersLayout")
+        spacerItem = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.slidersLayout.addItem(spacerItem)
+        self.layout_1 = QtWidgets.QVBoxLayout()
+        self.layout_1.setSpacing(6)
+        self.layout_1.setObjectName("layout_1")
+        self.label_1 = QtWidgets.QLabel(self.frequencyGroupBox)
+        self.label_1.setMaximumSize(QtCore.QSize(16777215, 15))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.label_1.setFont(font)
+        self.label_1.setIndent(7)
+        self.label_1.setObjectName("label_1")
+        self.layout_1.addWidget(self.label_1)
+        self.horizontalLayout_6 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_6.setContentsMargins(-1, 0, -1, -1)
+        self.horizontalLayout_6.setObjectName("horizontalLayout_6")
+        spacerItem1 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_6.addItem(spacerItem1)
+        self.slider_1 = QtWidgets.QSlider(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.slider_1.sizePolicy().hasHeightForWidth())
+        self.slider_1.setSizePolicy(sizePolicy)
+        self.slider_1.setMaximumSize(QtCore.QSize(16777215, 55))
+        self.slider_1.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.slider_1.setMaximum(10)
+        self.slider_1.setOrientation(QtCore.Qt.Vertical)
+        self.slider_1.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_1.setTickInterval(1)
+        self.slider_1.setObjectName("slider_1")
+        self.horizontalLayout_6.addWidget(self.slider_1)
+        spacerItem2 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_6.addItem(spacerItem2)
+        self.layout_1.addLayout(self.horizontalLayout_6)
+        self.lcd_1 = QtWidgets.QLCDNumber(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lcd_1.sizePolicy().hasHeightForWidth())
+        self.lcd_1.setSizePolicy(sizePolicy)
+        self.lcd_1.setMaximumSize(QtCore.QSize(50, 12))
+        self.lcd_1.setObjectName("lcd_1")
+        self.layout_1.addWidget(self.lcd_1)
+        self.slidersLayout.addLayout(self.layout_1)
+        self.layout_2 = QtWidgets.QVBoxLayout()
+        self.layout_2.setObjectName("layout_2")
+        self.label_2 = QtWidgets.QLabel(self.frequencyGroupBox)
+        self.label_2.setMaximumSize(QtCore.QSize(16777215, 15))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.label_2.setFont(font)
+        self.label_2.setIndent(7)
+        self.label_2.setObjectName("label_2")
+        self.layout_2.addWidget(self.label_2)
+        self.horizontalLayout_7 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_7.setObjectName("horizontalLayout_7")
+        spacerItem3 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_7.addItem(spacerItem3)
+        self.slider_2 = QtWidgets.QSlider(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.slider_2.sizePolicy().hasHeightForWidth())
+        self.slider_2.setSizePolicy(sizePolicy)
+        self.slider_2.setMaximumSize(QtCore.QSize(16777215, 55))
+        self.slider_2.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.slider_2.setMaximum(10)
+        self.slider_2.setOrientation(QtCore.Qt.Vertical)
+        self.slider_2.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_2.setTickInterval(1)
+        self.slider_2.setObjectName("slider_2")
+        self.horizontalLayout_7.addWidget(self.slider_2)
+        spacerItem4 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_7.addItem(spacerItem4)
+        self.layout_2.addLayout(self.horizontalLayout_7)
+        self.lcd_2 = QtWidgets.QLCDNumber(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lcd_2.sizePolicy().hasHeightForWidth())
+        self.lcd_2.setSizePolicy(sizePolicy)
+        self.lcd_2.setMaximumSize(QtCore.QSize(50, 12))
+        self.lcd_2.setObjectName("lcd_2")
+        self.layout_2.addWidget(self.lcd_2)
+        self.slidersLayout.addLayout(self.layout_2)
+        self.layout_3 = QtWidgets.QVBoxLayout()
+        self.layout_3.setObjectName("layout_3")
+        self.label_3 = QtWidgets.QLabel(self.frequencyGroupBox)
+        self.label_3.setMaximumSize(QtCore.QSize(16777215, 15))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.label_3.setFont(font)
+        self.label_3.setIndent(7)
+        self.label_3.setObjectName("label_3")
+        self.layout_3.addWidget(self.label_3)
+        self.horizontalLayout_10 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_10.setObjectName("horizontalLayout_10")
+        spacerItem5 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_10.addItem(spacerItem5)
+        self.slider_3 = QtWidgets.QSlider(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.slider_3.sizePolicy().hasHeightForWidth())
+        self.slider_3.setSizePolicy(sizePolicy)
+        self.slider_3.setMaximumSize(QtCore.QSize(16777215, 55))
+        self.slider_3.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.slider_3.setMaximum(10)
+        self.slider_3.setOrientation(QtCore.Qt.Vertical)
+        self.slider_3.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_3.setTickInterval(1)
+        self.slider_3.setObjectName("slider_3")
+        self.horizontalLayout_10.addWidget(self.slider_3)
+        spacerItem6 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_10.addItem(spacerItem6)
+        self.layout_3.addLayout(self.horizontalLayout_10)
+        self.lcd_3 = QtWidgets.QLCDNumber(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lcd_3.sizePolicy().hasHeightForWidth())
+        self.lcd_3.setSizePolicy(sizePolicy)
+        self.lcd_3.setMaximumSize(QtCore.QSize(50, 12))
+        self.lcd_3.setObjectName("lcd_3")
+        self.layout_3.addWidget(self.lcd_3)
+        self.slidersLayout.addLayout(self.layout_3)
+        self.layout_4 = QtWidgets.QVBoxLayout()
+        self.layout_4.setObjectName("layout_4")
+        self.label_4 = QtWidgets.QLabel(self.frequencyGroupBox)
+        self.label_4.setMaximumSize(QtCore.QSize(16777215, 15))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.label_4.setFont(font)
+        self.label_4.setIndent(7)
+        self.label_4.setObjectName("label_4")
+        self.layout_4.addWidget(self.label_4)
+        self.horizontalLayout_12 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_12.setObjectName("horizontalLayout_12")
+        spacerItem7 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_12.addItem(spacerItem7)
+        self.slider_4 = QtWidgets.QSlider(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.slider_4.sizePolicy().hasHeightForWidth())
+        self.slider_4.setSizePolicy(sizePolicy)
+        self.slider_4.setMaximumSize(QtCore.QSize(16777215, 55))
+        self.slider_4.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.slider_4.setMaximum(10)
+        self.slider_4.setOrientation(QtCore.Qt.Vertical)
+        self.slider_4.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_4.setTickInterval(1)
+        self.slider_4.setObjectName("slider_4")
+        self.horizontalLayout_12.addWidget(self.slider_4)
+        spacerItem8 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_12.addItem(spacerItem8)
+        self.layout_4.addLayout(self.horizontalLayout_12)
+        self.lcd_4 = QtWidgets.QLCDNumber(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lcd_4.sizePolicy().hasHeightForWidth())
+        self.lcd_4.setSizePolicy(sizePolicy)
+        self.lcd_4.setMaximumSize(QtCore.QSize(50, 12))
+        self.lcd_4.setObjectName("lcd_4")
+        self.layout_4.addWidget(self.lcd_4)
+        self.slidersLayout.addLayout(self.layout_4)
+        self.layout_5 = QtWidgets.QVBoxLayout()
+        self.layout_5.setObjectName("layout_5")
+        self.label_5 = QtWidgets.QLabel(self.frequencyGroupBox)
+        self.label_5.setMaximumSize(QtCore.QSize(16777215, 15))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.label_5.setFont(font)
+        self.label_5.setIndent(7)
+        self.label_5.setObjectName("label_5")
+        self.layout_5.addWidget(self.label_5)
+        self.horizontalLayout_14 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_14.setObjectName("horizontalLayout_14")
+        spacerItem9 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_14.addItem(spacerItem9)
+        self.slider_5 = QtWidgets.QSlider(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.slider_5.sizePolicy().hasHeightForWidth())
+        self.slider_5.setSizePolicy(sizePolicy)
+        self.slider_5.setMaximumSize(QtCore.QSize(16777215, 55))
+        self.slider_5.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.slider_5.setMaximum(10)
+        self.slider_5.setOrientation(QtCore.Qt.Vertical)
+        self.slider_5.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_5.setTickInterval(1)
+        self.slider_5.setObjectName("slider_5")
+        self.horizontalLayout_14.addWidget(self.slider_5)
+        spacerItem10 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_14.addItem(spacerItem10)
+        self.layout_5.addLayout(self.horizontalLayout_14)
+        self.lcd_5 = QtWidgets.QLCDNumber(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lcd_5.sizePolicy().hasHeightForWidth())
+        self.lcd_5.setSizePolicy(sizePolicy)
+        self.lcd_5.setMaximumSize(QtCore.QSize(50, 12))
+        self.lcd_5.setObjectName("lcd_5")
+        self.layout_5.addWidget(self.lcd_5)
+        self.slidersLayout.addLayout(self.layout_5)
+        self.layout_6 = QtWidgets.QVBoxLayout()
+        self.layout_6.setObjectName("layout_6")
+        self.label_6 = QtWidgets.QLabel(self.frequencyGroupBox)
+        self.label_6.setMaximumSize(QtCore.QSize(16777215, 15))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.label_6.setFont(font)
+        self.label_6.setIndent(7)
+        self.label_6.setObjectName("label_6")
+        self.layout_6.addWidget(self.label_6)
+        self.horizontalLayout_15 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_15.setObjectName("horizontalLayout_15")
+        spacerItem11 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_15.addItem(spacerItem11)
+        self.slider_6 = QtWidgets.QSlider(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.slider_6.sizePolicy().hasHeightForWidth())
+        self.slider_6.setSizePolicy(sizePolicy)
+        self.slider_6.setMaximumSize(QtCore.QSize(16777215, 55))
+        self.slider_6.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.slider_6.setMaximum(10)
+        self.slider_6.setOrientation(QtCore.Qt.Vertical)
+        self.slider_6.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_6.setTickInterval(1)
+        self.slider_6.setObjectName("slider_6")
+        self.horizontalLayout_15.addWidget(self.slider_6)
+        spacerItem12 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_15.addItem(spacerItem12)
+        self.layout_6.addLayout(self.horizontalLayout_15)
+        self.lcd_6 = QtWidgets.QLCDNumber(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lcd_6.sizePolicy().hasHeightForWidth())
+        self.lcd_6.setSizePolicy(sizePolicy)
+        self.lcd_6.setMaximumSize(QtCore.QSize(50, 12))
+        self.lcd_6.setObjectName("lcd_6")
+        self.layout_6.addWidget(self.lcd_6)
+        self.slidersLayout.addLayout(self.layout_6)
+        self.layout_7 = QtWidgets.QVBoxLayout()
+        self.layout_7.setObjectName("layout_7")
+        self.label_7 = QtWidgets.QLabel(self.frequencyGroupBox)
+        self.label_7.setMaximumSize(QtCore.QSize(16777215, 15))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.label_7.setFont(font)
+        self.label_7.setIndent(7)
+        self.label_7.setObjectName("label_7")
+        self.layout_7.addWidget(self.label_7)
+        self.horizontalLayout_16 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_16.setObjectName("horizontalLayout_16")
+        spacerItem13 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_16.addItem(spacerItem13)
+        self.slider_7 = QtWidgets.QSlider(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.slider_7.sizePolicy().hasHeightForWidth())
+        self.slider_7.setSizePolicy(sizePolicy)
+        self.slider_7.setMaximumSize(QtCore.QSize(16777215, 55))
+        self.slider_7.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.slider_7.setMaximum(10)
+        self.slider_7.setOrientation(QtCore.Qt.Vertical)
+        self.slider_7.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_7.setTickInterval(1)
+        self.slider_7.setObjectName("slider_7")
+        self.horizontalLayout_16.addWidget(self.slider_7)
+        spacerItem14 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_16.addItem(spacerItem14)
+        self.layout_7.addLayout(self.horizontalLayout_16)
+        self.lcd_7 = QtWidgets.QLCDNumber(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lcd_7.sizePolicy().hasHeightForWidth())
+        self.lcd_7.setSizePolicy(sizePolicy)
+        self.lcd_7.setMaximumSize(QtCore.QSize(50, 12))
+        self.lcd_7.setObjectName("lcd_7")
+        self.layout_7.addWidget(self.lcd_7)
+        self.slidersLayout.addLayout(self.layout_7)
+        self.layout_8 = QtWidgets.QVBoxLayout()
+        self.layout_8.setObjectName("layout_8")
+        self.label_8 = QtWidgets.QLabel(self.frequencyGroupBox)
+        self.label_8.setMaximumSize(QtCore.QSize(16777215, 15))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.label_8.setFont(font)
+        self.label_8.setIndent(7)
+        self.label_8.setObjectName("label_8")
+        self.layout_8.addWidget(self.label_8)
+        self.horizontalLayout_17 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_17.setObjectName("horizontalLayout_17")
+        spacerItem15 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_17.addItem(spacerItem15)
+        self.slider_8 = QtWidgets.QSlider(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.slider_8.sizePolicy().hasHeightForWidth())
+        self.slider_8.setSizePolicy(sizePolicy)
+        self.slider_8.setMaximumSize(QtCore.QSize(16777215, 55))
+        self.slider_8.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.slider_8.setMaximum(10)
+        self.slider_8.setOrientation(QtCore.Qt.Vertical)
+        self.slider_8.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_8.setTickInterval(1)
+        self.slider_8.setObjectName("slider_8")
+        self.horizontalLayout_17.addWidget(self.slider_8)
+        spacerItem16 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_17.addItem(spacerItem16)
+        self.layout_8.addLayout(self.horizontalLayout_17)
+        self.lcd_8 = QtWidgets.QLCDNumber(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lcd_8.sizePolicy().hasHeightForWidth())
+        self.lcd_8.setSizePolicy(sizePolicy)
+        self.lcd_8.setMaximumSize(QtCore.QSize(50, 12))
+        self.lcd_8.setObjectName("lcd_8")
+        self.layout_8.addWidget(self.lcd_8)
+        self.slidersLayout.addLayout(self.layout_8)
+        self.layout_9 = QtWidgets.QVBoxLayout()
+        self.layout_9.setObjectName("layout_9")
+        self.label_9 = QtWidgets.QLabel(self.frequencyGroupBox)
+        self.label_9.setMaximumSize(QtCore.QSize(16777215, 15))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.label_9.setFont(font)
+        self.label_9.setIndent(7)
+        self.label_9.setObjectName("label_9")
+        self.layout_9.addWidget(self.label_9)
+        self.horizontalLayout_18 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_18.setObjectName("horizontalLayout_18")
+        spacerItem17 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_18.addItem(spacerItem17)
+        self.slider_9 = QtWidgets.QSlider(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.slider_9.sizePolicy().hasHeightForWidth())
+        self.slider_9.setSizePolicy(sizePolicy)
+        self.slider_9.setMaximumSize(QtCore.QSize(16777215, 55))
+        self.slider_9.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.slider_9.setMaximum(10)
+        self.slider_9.setOrientation(QtCore.Qt.Vertical)
+        self.slider_9.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_9.setTickInterval(1)
+        self.slider_9.setObjectName("slider_9")
+        self.horizontalLayout_18.addWidget(self.slider_9)
+        spacerItem18 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_18.addItem(spacerItem18)
+        self.layout_9.addLayout(self.horizontalLayout_18)
+        self.lcd_9 = QtWidgets.QLCDNumber(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lcd_9.sizePolicy().hasHeightForWidth())
+        self.lcd_9.setSizePolicy(sizePolicy)
+        self.lcd_9.setMaximumSize(QtCore.QSize(50, 12))
+        self.lcd_9.setObjectName("lcd_9")
+        self.layout_9.addWidget(self.lcd_9)
+        self.slidersLayout.addLayout(self.layout_9)
+        self.layout_10 = QtWidgets.QVBoxLayout()
+        self.layout_10.setObjectName("layout_10")
+        self.label_10 = QtWidgets.QLabel(self.frequencyGroupBox)
+        self.label_10.setMaximumSize(QtCore.QSize(16777215, 15))
+        font = QtGui.QFont()
+        font.setPointSize(8)
+        font.setBold(True)
+        self.label_10.setFont(font)
+        self.label_10.setIndent(7)
+        self.label_10.setObjectName("label_10")
+        self.layout_10.addWidget(self.label_10)
+        self.horizontalLayout_19 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_19.setObjectName("horizontalLayout_19")
+        spacerItem19 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_19.addItem(spacerItem19)
+        self.slider_10 = QtWidgets.QSlider(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.slider_10.sizePolicy().hasHeightForWidth())
+        self.slider_10.setSizePolicy(sizePolicy)
+        self.slider_10.setMaximumSize(QtCore.QSize(16777215, 55))
+        self.slider_10.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.slider_10.setMaximum(10)
+        self.slider_10.setOrientation(QtCore.Qt.Vertical)
+        self.slider_10.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.slider_10.setTickInterval(1)
+        self.slider_10.setObjectName("slider_10")
+        self.horizontalLayout_19.addWidget(self.slider_10)
+        spacerItem20 = QtWidgets.QSpacerItem(5, 5, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_19.addItem(spacerItem20)
+        self.layout_10.addLayout(self.horizontalLayout_19)
+        self.lcd_10 = QtWidgets.QLCDNumber(self.frequencyGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.lcd_10.sizePolicy().hasHeightForWidth())
+        self.lcd_10.setSizePolicy(sizePolicy)
+        self.lcd_10.setMaximumSize(QtCore.QSize(50, 12))
+        self.lcd_10.setAutoFillBackground(False)
+        self.lcd_10.setFrameShape(QtWidgets.QFrame.Box)
+        self.lcd_10.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.lcd_10.setSegmentStyle(QtWidgets.QLCDNumber.Filled)
+        self.lcd_10.setObjectName("lcd_10")
+        self.layout_10.addWidget(self.lcd_10)
+        self.slidersLayout.addLayout(self.layout_10)
+        self.gridLayout.addLayout(self.slidersLayout, 1, 0, 1, 1)
+        self.gridLayout_7.addWidget(self.frequencyGroupBox, 1, 1, 1, 1)
+        self.outputSignalGroupBox = QtWidgets.QGroupBox(self.equalizerTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.outputSignalGroupBox.sizePolicy().hasHeightForWidth())
+        self.outputSignalGroupBox.setSizePolicy(sizePolicy)
+        self.outputSignalGroupBox.setMaximumSize(QtCore.QSize(16777215, 185))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.outputSignalGroupBox.setFont(font)
+        self.outputSignalGroupBox.setStyleSheet("color: rgb(238, 238, 238);")
+        self.outputSignalGroupBox.setObjectName("outputSignalGroupBox")
+        self.verticalLayout_2 = QtWidgets.QVBoxLayout(self.outputSignalGroupBox)
+        self.verticalLayout_2.setObjectName("verticalLayout_2")
+        self.outputLayout = QtWidgets.QHBoxLayout()
+        self.outputLayout.setObjectName("outputLayout")
+        self.outputSignalLayout = QtWidgets.QVBoxLayout()
+        self.outputSignalLayout.setObjectName("outputSignalLayout")
+        self.outputSignalWidget = QtWidgets.QWidget(self.outputSignalGroupBox)
+        self.outputSignalWidget.setStyleSheet("background-color:rgb(4, 4, 4)")
+        self.outputSignalWidget.setObjectName("outputSignalWidget")
+        self.outputSignalLayout.addWidget(self.outputSignalWidget)
+        self.outputLayout.addLayout(self.outputSignalLayout)
+        self.outputSpectrogramLayout = QtWidgets.QVBoxLayout()
+        self.outputSpectrogramLayout.setObjectName("outputSpectrogramLayout")
+        self.outputSpectrogramWidget = QtWidgets.QWidget(self.outputSignalGroupBox)
+        self.outputSpectrogramWidget.setStyleSheet("background-color:rgb(4, 4, 4)")
+        self.outputSpectrogramWidget.setObjectName("outputSpectrogramWidget")
+        self.outputSpectrogramLayout.addWidget(self.outputSpectrogramWidget)
+        self.outputLayout.addLayout(self.outputSpectrogramLayout)
+        self.verticalLayout_2.addLayout(self.outputLayout)
+        self.gridLayout_7.addWidget(self.outputSignalGroupBox, 2, 1, 1, 1)
+        self.controllerGroupBox = QtWidgets.QGroupBox(self.equalizerTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.controllerGroupBox.sizePolicy().hasHeightForWidth())
+        self.controllerGroupBox.setSizePolicy(sizePolicy)
+        self.controllerGroupBox.setMaximumSize(QtCore.QSize(200, 16777214))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.controllerGroupBox.setFont(font)
+        self.controllerGroupBox.setStyleSheet("color: rgb(238, 238, 238);")
+        self.controllerGroupBox.setObjectName("controllerGroupBox")
+        self.verticalLayout_3 = QtWidgets.QVBoxLayout(self.controllerGroupBox)
+        self.verticalLayout_3.setObjectName("verticalLayout_3")
+        self.horizontalLayout_66 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_66.setObjectName("horizontalLayout_66")
+        self.modeLabel = QtWidgets.QLabel(self.controllerGroupBox)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.modeLabel.setFont(font)
+        self.modeLabel.setObjectName("modeLabel")
+        self.horizontalLayout_66.addWidget(self.modeLabel)
+        self.modeComboBox = QtWidgets.QComboBox(self.controllerGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.modeComboBox.sizePolicy().hasHeightForWidth())
+        self.modeComboBox.setSizePolicy(sizePolicy)
+        self.modeComboBox.setMaximumSize(QtCore.QSize(200, 25))
+        self.modeComboBox.setSizeIncrement(QtCore.QSize(20, 0))
+        self.modeComboBox.setBaseSize(QtCore.QSize(20, 0))
+        font = QtGui.QFont()
+        font.setBold(False)
+        self.modeComboBox.setFont(font)
+        self.modeComboBox.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.modeComboBox.setWhatsThis("")
+        self.modeComboBox.setAutoFillBackground(False)
+        self.modeComboBox.setStyleSheet("background-color: rgb(72, 60, 50);\n"
+"selection-background-color: rgb(72, 60, 50);")
+        self.modeComboBox.setEditable(False)
+        self.modeComboBox.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
+        self.modeComboBox.setFrame(True)
+        self.modeComboBox.setObjectName("modeComboBox")
+        self.modeComboBox.addItem("")
+        self.modeComboBox.addItem("")
+        self.modeComboBox.addItem("")
+        self.modeComboBox.addItem("")
+        self.horizontalLayout_66.addWidget(self.modeComboBox)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_66)
+        self.horizontalLayout_channel = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_channel.setObjectName("horizontalLayout_channel")
+        self.channelLabel = QtWidgets.QLabel(self.controllerGroupBox)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.channelLabel.setFont(font)
+        self.channelLabel.setObjectName("channelLabel")
+        self.horizontalLayout_channel.addWidget(self.channelLabel)
+        self.channelComboBox = QtWidgets.QComboBox(self.controllerGroupBox)
+        self.channelComboBox.setEnabled(False)
+        self.channelComboBox.setMaximumSize(QtCore.QSize(200, 25))
+        font = QtGui.QFont()
+        font.setBold(False)
+        self.channelComboBox.setFont(font)
+        self.channelComboBox.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.channelComboBox.setStyleSheet("background-color: rgb(72, 60, 50);\n"
+"selection-background-color: rgb(72, 60, 50);")
+        self.channelComboBox.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
+        self.channelComboBox.setObjectName("channelComboBox")
+        self.channelComboBox.addItem("")
+        self.horizontalLayout_channel.addWidget(self.channelComboBox)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_channel)
+        spacerItem21 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_3.addItem(spacerItem21)
+        self.listWidgetLabel = QtWidgets.QLabel(self.controllerGroupBox)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(True)
+        self.listWidgetLabel.setFont(font)
+        self.listWidgetLabel.setObjectName("listWidgetLabel")
+        self.verticalLayout_3.addWidget(self.listWidgetLabel)
+        self.audioListWidget = QtWidgets.QListWidget(self.controllerGroupBox)
+        self.audioListWidget.setMaximumSize(QtCore.QSize(16777215, 100))
+        self.audioListWidget.setProperty("isWrapping", True)
+        self.audioListWidget.setObjectName("audioListWidget")
+        self.verticalLayout_3.addWidget(self.audioListWidget)
+        spacerItem22 = QtWidgets.QSpacerItem(20, 25, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        self.verticalLayout_3.addItem(spacerItem22)
+        self.spectrogramRadioButton = QtWidgets.QRadioButton(self.controllerGroupBox)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.spectrogramRadioButton.setFont(font)
+        self.spectrogramRadioButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.spectrogramRadioButton.setObjectName("spectrogramRadioButton")
+        self.verticalLayout_3.addWidget(self.spectrogramRadioButton)
+        spacerItem23 = QtWidgets.QSpacerItem(20, 40, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        self.verticalLayout_3.addItem(spacerItem23)
+        spacerItem24 = QtWidgets.QSpacerItem(20, 50, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_3.addItem(spacerItem24)
+        self.horizontalLayout_67 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_67.setObjectName("horizontalLayout_67")
+        self.playPauseButton = QtWidgets.QPushButton(self.controllerGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.playPauseButton.sizePolicy().hasHeightForWidth())
+        self.playPauseButton.setSizePolicy(sizePolicy)
+        self.playPauseButton.setMaximumSize(QtCore.QSize(50, 16777215))
+        self.playPauseButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.playPauseButton.setStyleSheet("background-color: rgb(238, 238, 238);")
+        self.playPauseButton.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap("../../hp/hp/.designer/backup/eraser.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.playPauseButton.setIcon(icon1)
+        self.playPauseButton.setObjectName("playPauseButton")
+        self.horizontalLayout_67.addWidget(self.playPauseButton)
+        self.stopButton = QtWidgets.QPushButton(self.controllerGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.stopButton.sizePolicy().hasHeightForWidth())
+        self.stopButton.setSizePolicy(sizePolicy)
+        self.stopButton.setMaximumSize(QtCore.QSize(50, 16777215))
+        self.stopButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.stopButton.setStyleSheet("background-color: rgb(238, 238, 238);")
+        self.stopButton.setText("")
+        self.stopButton.setIcon(icon1)
+        self.stopButton.setObjectName("stopButton")
+        self.horizontalLayout_67.addWidget(self.stopButton)
+        self.replayButton = QtWidgets.QPushButton(self.controllerGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.replayButton.sizePolicy().hasHeightForWidth())
+        self.replayButton.setSizePolicy(sizePolicy)
+        self.replayButton.setMaximumSize(QtCore.QSize(50, 16777215))
+        self.replayButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.replayButton.setStyleSheet("background-color: rgb(238, 238, 238);")
+        self.replayButton.setText("")
+        self.replayButton.setIcon(icon1)
+        self.replayButton.setObjectName("replayButton")
+        self.horizontalLayout_67.addWidget(self.replayButton)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_67)
+        self.horizontalLayout_68 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_68.setObjectName("horizontalLayout_68")
+        self.speedLabel = QtWidgets.QLabel(self.controllerGroupBox)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.speedLabel.setFont(font)
+        self.speedLabel.setObjectName("speedLabel")
+        self.horizontalLayout_68.addWidget(self.speedLabel)
+        self.speedSlider = QtWidgets.QSlider(self.controllerGroupBox)
+        self.speedSlider.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.speedSlider.setInputMethodHints(QtCore.Qt.ImhDigitsOnly)
+        self.speedSlider.setProperty("value", 0)
+        self.speedSlider.setOrientation(QtCore.Qt.Horizontal)
+        self.speedSlider.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.speedSlider.setTickInterval(1)
+        self.speedSlider.setObjectName("speedSlider")
+        self.horizontalLayout_68.addWidget(self.speedSlider)
+        self.speedLCD = QtWidgets.QLCDNumber(self.controllerGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.speedLCD.sizePolicy().hasHeightForWidth())
+        self.speedLCD.setSizePolicy(sizePolicy)
+        self.speedLCD.setMaximumSize(QtCore.QSize(16777215, 25))
+        self.speedLCD.setObjectName("speedLCD")
+        self.horizontalLayout_68.addWidget(self.speedLCD)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_68)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.constructAudioButton = QtWidgets.QPushButton(self.controllerGroupBox)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.constructAudioButton.setFont(font)
+        self.constructAudioButton.setStyleSheet("background-color: rgb(238, 238, 238);\n"
+"color: rgb(13, 13, 13);")
+        self.constructAudioButton.setObjectName("constructAudioButton")
+        self.horizontalLayout.addWidget(self.constructAudioButton)
+        self.deleteButton = QtWidgets.QPushButton(self.controllerGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.deleteButton.sizePolicy().hasHeightForWidth())
+        self.deleteButton.setSizePolicy(sizePolicy)
+        self.deleteButton.setMinimumSize(QtCore.QSize(31, 0))
+        self.deleteButton.setMaximumSize(QtCore.QSize(31, 24))
+        self.deleteButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.deleteButton.setStyleSheet("background-color: rgb(238, 238, 238);")
+        self.deleteButton.setText("")
+        self.deleteButton.setIcon(icon1)
+        self.deleteButton.setObjectName("deleteButton")
+        self.horizontalLayout.addWidget(self.deleteButton)
+        self.verticalLayout_3.addLayout(self.horizontalLayout)
+        spacerItem25 = QtWidgets.QSpacerItem(20, 120, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Expanding)
+        self.verticalLayout_3.addItem(spacerItem25)
+        self.horizontalLayout_8 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_8.setObjectName("horizontalLayout_8")
+        spacerItem26 = QtWidgets.QSpacerItem(35, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_8.addItem(spacerItem26)
+        self.changeWindowButton = QtWidgets.QPushButton(self.controllerGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Maximum, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.changeWindowButton.sizePolicy().hasHeightForWidth())
+        self.changeWindowButton.setSizePolicy(sizePolicy)
+        self.changeWindowButton.setMaximumSize(QtCore.QSize(130, 16777215))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.changeWindowButton.setFont(font)
+        self.changeWindowButton.setCursor(QtGui.QCursor(QtCore.Qt.OpenHandCursor))
+        self.changeWindowButton.setStyleSheet("background-color: rgb(238, 238, 238);\n"
+"color: rgb(13, 13, 13);")
+        self.changeWindowButton.setObjectName("changeWindowButton")
+        self.horizontalLayout_8.addWidget(self.changeWindowButton)
+        spacerItem27 = QtWidgets.QSpacerItem(35, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_8.addItem(spacerItem27)
+        self.verticalLayout_3.addLayout(self.horizontalLayout_8)
+        spacerItem28 = QtWidgets.QSpacerItem(20, 30, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        self.verticalLayout_3.addItem(spacerItem28)
+        self.gridLayout_7.addWidget(self.controllerGroupBox, 0, 0, 3, 1)
+        self.originalSignalGroupBox = QtWidgets.QGroupBox(self.equalizerTab)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.originalSignalGroupBox.sizePolicy().hasHeightForWidth())
+        self.originalSignalGroupBox.setSizePolicy(sizePolicy)
+        self.originalSignalGroupBox.setMaximumSize(QtCore.QSize(16777215, 185))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.originalSignalGroupBox.setFont(font)
+        self.originalSignalGroupBox.setStyleSheet("color: rgb(238, 238, 238);")
+        self.originalSignalGroupBox.setObjectName("originalSignalGroupBox")
+        self.verticalLayout = QtWidgets.QVBoxLayout(self.originalSignalGroupBox)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.originalLayout = QtWidgets.QHBoxLayout()
+        self.originalLayout.setObjectName("originalLayout")
+        self.originalSignalLayout = QtWidgets.QVBoxLayout()
+        self.originalSignalLayout.setObjectName("originalSignalLayout")
+        self.originalSignalWidget = QtWidgets.QWidget(self.originalSignalGroupBox)
+        self.originalSignalWidget.setStyleSheet("background-color:rgb(4, 4, 4)")
+        self.originalSignalWidget.setObjectName("originalSignalWidget")
+        self.originalSignalLayout.addWidget(self.originalSignalWidget)
+        self.originalLayout.addLayout(self.originalSignalLayout)
+        self.originalSpectrogramLayout = QtWidgets.QVBoxLayout()
+        self.originalSpectrogramLayout.setObjectName("originalSpectrogramLayout")
+        self.originalSpectrogramWidget = QtWidgets.QWidget(self.originalSignalGroupBox)
+        self.originalSpectrogramWidget.setStyleSheet("background-color:rgb(4, 4, 4)")
+        self.originalSpectrogramWidget.setObjectName("originalSpectrogramWidget")
+        self.originalSpectrogramLayout.addWidget(self.originalSpectrogramWidget)
+        self.originalLayout.addLayout(self.originalSpectrogramLayout)
+        self.verticalLayout.addLayout(self.originalLayout)
+        self.horizontalLayout_20 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_20.setObjectName("horizontalLayout_20")
+        self.label_12 = QtWidgets.QLabel(self.originalSignalGroupBox)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.label_12.setFont(font)
+        self.label_12.setObjectName("label_12")
+        self.horizontalLayout_20.addWidget(self.label_12)
+        spacerItem29 = QtWidgets.QSpacerItem(30, 20, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_20.addItem(spacerItem29)
+        self.originalStartLabel = QtWidgets.QLabel(self.originalSignalGroupBox)
+        self.originalStartLabel.setObjectName("originalStartLabel")
+        self.horizontalLayout_20.addWidget(self.originalStartLabel)
+        self.originalEndLabel = QtWidgets.QLabel(self.originalSignalGroupBox)
+        self.originalEndLabel.setObjectName("originalEndLabel")
+        self.horizontalLayout_20.addWidget(self.originalEndLabel)
+        self.originalProgressSlider = QtWidgets.QSlider(self.originalSignalGroupBox)
+        self.originalProgressSlider.setMaximum(100)
+        self.originalProgressSlider.setOrientation(QtCore.Qt.Horizontal)
+        self.originalProgressSlider.setObjectName("originalProgressSlider")
+        self.horizontalLayout_20.addWidget(self.originalProgressSlider)
+        spacerItem30 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_20.addItem(spacerItem30)
+        self.muteOriginalButton = QtWidgets.QPushButton(self.originalSignalGroupBox)
+        self.muteOriginalButton.setMaximumSize(QtCore.QSize(31, 24))
+        self.muteOriginalButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.muteOriginalButton.setStyleSheet("background-color: rgb(238, 238, 238);")
+        self.muteOriginalButton.setText("")
+        self.muteOriginalButton.setObjectName("muteOriginalButton")
+        self.horizontalLayout_20.addWidget(self.muteOriginalButton)
+        self.originalVolumeSpinBox = QtWidgets.QSpinBox(self.originalSignalGroupBox)
+        self.originalVolumeSpinBox.setMaximumSize(QtCore.QSize(16777215, 24))
+        font = QtGui.QFont()
+        font.setBold(False)
+        self.originalVolumeSpinBox.setFont(font)
+        self.originalVolumeSpinBox.setWrapping(False)
+        self.originalVolumeSpinBox.setFrame(True)
+        self.originalVolumeSpinBox.setReadOnly(False)
+        self.originalVolumeSpinBox.setAccelerated(False)
+        self.originalVolumeSpinBox.setMinimum(1)
+        self.originalVolumeSpinBox.setMaximum(100)
+        self.originalVolumeSpinBox.setProperty("value", 50)
+        self.originalVolumeSpinBox.setObjectName("originalVolumeSpinBox")
+        self.horizontalLayout_20.addWidget(self.originalVolumeSpinBox)
+        self.verticalLayout.addLayout(self.horizontalLayout_20)
+        self.gridLayout_7.addWidget(self.originalSignalGroupBox, 0, 1, 1, 1)
+        self.tabWidget.addTab(self.equalizerTab, "")
+        self.smootherTab = QtWidgets.QWidget()
+        self.smootherTab.setStyleSheet("gridline-color: rgb(66, 111, 111);\n"
+"selection-background-color: rgb(83, 74, 65);\n"
+"background-color: rgb(83, 74, 65);\n"
+"color: rgb(66, 111, 111);")
+        self.smootherTab.setObjectName("smootherTab")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.smootherTab)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.smootherGroupBox = QtWidgets.QGroupBox(self.smootherTab)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.smootherGroupBox.setFont(font)
+        self.smootherGroupBox.setStyleSheet("color: rgb(238, 238, 238);")
+        self.smootherGroupBox.setObjectName("smootherGroupBox")
+        self.gridLayout_8 = QtWidgets.QGridLayout(self.smootherGroupBox)
+        self.gridLayout_8.setObjectName("gridLayout_8")
+        self.smoothingControllerComboBox = QtWidgets.QGroupBox(self.smootherGroupBox)
+        self.smoothingControllerComboBox.setMaximumSize(QtCore.QSize(16777215, 100))
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.smoothingControllerComboBox.setFont(font)
+        self.smoothingControllerComboBox.setObjectName("smoothingControllerComboBox")
+        self.gridLayout_6 = QtWidgets.QGridLayout(self.smoothingControllerComboBox)
+        self.gridLayout_6.setObjectName("gridLayout_6")
+        self.horizontalLayout_4 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_4.setObjectName("horizontalLayout_4")
+        spacerItem31 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_4.addItem(spacerItem31)
+        self.horizontalLayout_11 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_11.setObjectName("horizontalLayout_11")
+        self.meanLabel = QtWidgets.QLabel(self.smoothingControllerComboBox)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setItalic(False)
+        font.setStrikeOut(False)
+        self.meanLabel.setFont(font)
+        self.meanLabel.setStyleSheet("color: rgb(238, 238, 238);")
+        self.meanLabel.setObjectName("meanLabel")
+        self.horizontalLayout_11.addWidget(self.meanLabel)
+        self.meanSlider = QtWidgets.QSlider(self.smoothingControllerComboBox)
+        font = QtGui.QFont()
+        font.setKerning(True)
+        self.meanSlider.setFont(font)
+        self.meanSlider.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.meanSlider.setMouseTracking(True)
+        self.meanSlider.setTabletTracking(False)
+        self.meanSlider.setAcceptDrops(False)
+        self.meanSlider.setAutoFillBackground(False)
+        self.meanSlider.setInputMethodHints(QtCore.Qt.ImhDigitsOnly)
+        self.meanSlider.setOrientation(QtCore.Qt.Horizontal)
+        self.meanSlider.setInvertedAppearance(False)
+        self.meanSlider.setInvertedControls(False)
+        self.meanSlider.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.meanSlider.setTickInterval(1)
+        self.meanSlider.setObjectName("meanSlider")
+        self.horizontalLayout_11.addWidget(self.meanSlider)
+        self.meanLCD = QtWidgets.QLCDNumber(self.smoothingControllerComboBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.meanLCD.sizePolicy().hasHeightForWidth())
+        self.meanLCD.setSizePolicy(sizePolicy)
+        self.meanLCD.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.meanLCD.setObjectName("meanLCD")
+        self.horizontalLayout_11.addWidget(self.meanLCD)
+        spacerItem32 = QtWidgets.QSpacerItem(20, 20, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_11.addItem(spacerItem32)
+        self.horizontalLayout_4.addLayout(self.horizontalLayout_11)
+        self.horizontalLayout_13 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_13.setObjectName("horizontalLayout_13")
+        self.stdLabel = QtWidgets.QLabel(self.smoothingControllerComboBox)
+        font = QtGui.QFont()
+        font.setPointSize(12)
+        font.setBold(True)
+        font.setItalic(False)
+        font.setStrikeOut(False)
+        self.stdLabel.setFont(font)
+        self.stdLabel.setStyleSheet("color: rgb(238, 238, 238);")
+        self.stdLabel.setObjectName("stdLabel")
+        self.horizontalLayout_13.addWidget(self.stdLabel)
+        self.standardDeviationSlider = QtWidgets.QSlider(self.smoothingControllerComboBox)
+        font = QtGui.QFont()
+        font.setKerning(True)
+        self.standardDeviationSlider.setFont(font)
+        self.standardDeviationSlider.setCursor(QtGui.QCursor(QtCore.Qt.ClosedHandCursor))
+        self.standardDeviationSlider.setMouseTracking(True)
+        self.standardDeviationSlider.setTabletTracking(False)
+        self.standardDeviationSlider.setAcceptDrops(False)
+        self.standardDeviationSlider.setAutoFillBackground(False)
+        self.standardDeviationSlider.setInputMethodHints(QtCore.Qt.ImhDigitsOnly)
+        self.standardDeviationSlider.setOrientation(QtCore.Qt.Horizontal)
+        self.standardDeviationSlider.setInvertedAppearance(False)
+        self.standardDeviationSlider.setInvertedControls(False)
+        self.standardDeviationSlider.setTickPosition(QtWidgets.QSlider.TicksBelow)
+        self.standardDeviationSlider.setTickInterval(1)
+        self.standardDeviationSlider.setObjectName("standardDeviationSlider")
+        self.horizontalLayout_13.addWidget(self.standardDeviationSlider)
+        self.standardDeviationLCD = QtWidgets.QLCDNumber(self.smoothingControllerComboBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.standardDeviationLCD.sizePolicy().hasHeightForWidth())
+        self.standardDeviationLCD.setSizePolicy(sizePolicy)
+        self.standardDeviationLCD.setMaximumSize(QtCore.QSize(16777215, 30))
+        self.standardDeviationLCD.setObjectName("standardDeviationLCD")
+        self.horizontalLayout_13.addWidget(self.standardDeviationLCD)
+        self.horizontalLayout_4.addLayout(self.horizontalLayout_13)
+        spacerItem33 = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_4.addItem(spacerItem33)
+        self.confirmButton = QtWidgets.QPushButton(self.smoothingControllerComboBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.confirmButton.sizePolicy().hasHeightForWidth())
+        self.confirmButton.setSizePolicy(sizePolicy)
+        self.confirmButton.setMaximumSize(QtCore.QSize(50, 16777215))
+        font = QtGui.QFont()
+        font.setBold(False)
+        self.confirmButton.setFont(font)
+        self.confirmButton.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.confirmButton.setStyleSheet("background-color: rgb(238, 238, 238);")
+        self.confirmButton.setText("")
+        self.confirmButton.setIcon(icon1)
+        self.confirmButton.setObjectName("confirmButton")
+        self.horizontalLayout_4.addWidget(self.confirmButton)
+        spacerItem34 = QtWidgets.QSpacerItem(35, 20, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_4.addItem(spacerItem34)
+        self.gridLayout_6.addLayout(self.horizontalLayout_4, 0, 0, 1, 1)
+        self.gridLayout_8.addWidget(self.smoothingControllerComboBox, 3, 0, 1, 1)
+        self.smoothingLayout = QtWidgets.QVBoxLayout()
+        self.smoothingLayout.setObjectName("smoothingLayout")
+        self.smoothedSignalWidget = QtWidgets.QWidget(self.smootherGroupBox)
+        self.smoothedSignalWidget.setStyleSheet("background-color:rgb(4, 4, 4)")
+        self.smoothedSignalWidget.setObjectName("smoothedSignalWidget")
+        self.smoothingLayout.addWidget(self.smoothedSignalWidget)
+        self.gridLayout_8.addLayout(self.smoothingLayout, 2, 0, 1, 1)
+        self.horizontalLayout_9 = QtWidgets.QHBoxLayout()
+        self.horizontalLayout_9.setObjectName("horizontalLayout_9")
+        spacerItem35 = QtWidgets.QSpacerItem(100, 20, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_9.addItem(spacerItem35)
+        self.windowLabel = QtWidgets.QLabel(self.smootherGroupBox)
+        font = QtGui.QFont()
+        font.setBold(True)
+        self.windowLabel.setFont(font)
+        self.windowLabel.setObjectName("windowLabel")
+        self.horizontalLayout_9.addWidget(self.windowLabel)
+        spacerItem36 = QtWidgets.QSpacerItem(13, 20, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_9.addItem(spacerItem36)
+        self.smootherComboBox = QtWidgets.QComboBox(self.smootherGroupBox)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.smootherComboBox.sizePolicy().hasHeightForWidth())
+        self.smootherComboBox.setSizePolicy(sizePolicy)
+        self.smootherComboBox.setMaximumSize(QtCore.QSize(200, 25))
+        self.smootherComboBox.setSizeIncrement(QtCore.QSize(20, 0))
+        self.smootherComboBox.setBaseSize(QtCore.QSize(20, 0))
+        font = QtGui.QFont()
+        font.setBold(False)
+        self.smootherComboBox.setFont(font)
+        self.smootherComboBox.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.smootherComboBox.setWhatsThis("")
+        self.smootherComboBox.setAutoFillBackground(False)
+        self.smootherComboBox.setStyleSheet("background-color: rgb(72, 60, 50);\n"
+"selection-background-color: rgb(72, 60, 50);")
+        self.smootherComboBox.setEditable(False)
+        self.smootherComboBox.setSizeAdjustPolicy(QtWidgets.QComboBox.AdjustToContents)
+        self.smootherComboBox.setFrame(True)
+        self.smootherComboBox.setObjectName("smootherComboBox")
+        self.smootherComboBox.addItem("")
+        self.smootherComboBox.addItem("")
+        self.smootherComboBox.addItem("")
+        self.smootherComboBox.addItem("")
+        self.horizontalLayout_9.addWidget(self.smootherComboBox)
+        spacerItem37 = QtWidgets.QSpacerItem(50, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_9.addItem(spacerItem37)
+        spacerItem38 = QtWidgets.QSpacerItem(178, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_9.addItem(spacerItem38)
+        spacerItem39 = QtWidgets.QSpacerItem(15, 20, QtWidgets.QSizePolicy.Preferred, QtWidgets.QSizePolicy.Minimum)
+        self.horizontalLayout_9.addItem(spacerItem39)
+        self.gridLayout_8.addLayout(self.horizontalLayout_9, 0, 0, 1, 1)
+        spacerItem40 = QtWidgets.QSpacerItem(20, 10, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        self.gridLayout_8.addItem(spacerItem40, 1, 0, 1, 1)
+        self.gridLayout_2.addWidget(self.smootherGroupBox, 0, 0, 1, 1)
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap("../../hp/hp/.designer/backup/video-editing.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.tabWidget.addTab(self.smootherTab, icon2, "")
+        self.gridLayout_3.addWidget(self.tabWidget, 1, 0, 1, 1)
+        MainWindow.setCentralWidget(self.centralWidget)
+        self.menuBar = QtWidgets.QMenuBar(MainWindow)
+        self.menuBar.setGeometry(QtCore.QRect(0, 0, 1055, 25))
+        self.menuBar.setObjectName("menuBar")
+        self.menuFile = QtWidgets.QMenu(self.menuBar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuTools = QtWidgets.QMenu(self.menuBar)
+        self.menuTools.setObjectName("menuTools")
+        MainWindow.setMenuBar(self.menuBar)
+        self.actionOpen_Signal = QtWidgets.QAction(MainWindow)
+        self.actionOpen_Signal.setObjectName("actionOpen_Signal")
+        self.actionExit = QtWidgets.QAction(MainWindow)
+        self.actionExit.setObjectName("actionExit")
+        self.actionOpen_Signal_2 = QtWidgets.QAction(MainWindow)
+        self.actionOpen_Signal_2.setObjectName("actionOpen_Signal_2")
+        self.actionExit_2 = QtWidgets.QAction(MainWindow)
+        self.actionExit_2.setObjectName("actionExit_2")
+        self.actionA7a = QtWidgets.QAction(MainWindow)
+        self.actionA7a.setEnabled(False)
+        self.actionA7a.setObjectName("actionA7a")
+        self.actionOpenUniformSignal = QtWidgets.QAction(MainWindow)
+        self.actionOpenUniformSignal.setObjectName("actionOpenUniformSignal")
+        self.actionOpenAnimalSounds = QtWidgets.QAction(MainWindow)
+        self.actionOpenAnimalSounds.setObjectName("actionOpenAnimalSounds")
+        self.actionOpenInstrumentsSounds = QtWidgets.QAction(MainWindow)
+        self.actionOpenInstrumentsSounds.setObjectName("actionOpenInstrumentsSounds")
+        self.actionOpenECGSignal = QtWidgets.QAction(MainWindow)
+        self.actionOpenECGSignal.setObjectName("actionOpenECGSignal")
+        self.actionProfilerStats = QtWidgets.QAction(MainWindow)
+        self.actionProfilerStats.setObjectName("actionProfilerStats")
+        self.actionSavePreset = QtWidgets.QAction(MainWindow)
+        self.actionSavePreset.setObjectName("actionSavePreset")
+        self.actionDitherExports = QtWidgets.QAction(MainWindow)
+        self.actionDitherExports.setCheckable(True)
+        self.actionDitherExports.setChecked(True)
+        self.actionDitherExports.setObjectName("actionDitherExports")
+        self.menuFile.addAction(self.actionOpenUniformSignal)
+        self.menuFile.addAction(self.actionOpenAnimalSounds)
+        self.menuFile.addAction(self.actionOpenInstrumentsSounds)
+        self.menuFile.addAction(self.actionOpenECGSignal)
+        self.menuTools.addAction(self.actionProfilerStats)
+        self.menuTools.addAction(self.actionSavePreset)
+        self.menuTools.addAction(self.actionDitherExports)
+        self.menuBar.addAction(self.menuFile.menuAction())
+        self.menuBar.addAction(self.menuTools.menuAction())
+
+        self.retranslateUi(MainWindow)
+        self.tabWidget.setCurrentIndex(0)
+        self.modeComboBox.setCurrentIndex(-1)
+        self.smootherComboBox.setCurrentIndex(-1)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Sampling Theory Studio"))
+        self.label.setText(_translate("MainWindow", "Signal Equalizer"))
+        self.frequencyGroupBox.setTitle(_translate("MainWindow", "Frequency"))
+        self.label_1.setText(_translate("MainWindow", "0 - 10 Hz"))
+        self.label_2.setText(_translate("MainWindow", "10 - 20 Hz"))
+        self.label_3.setText(_translate("MainWindow", "20 - 30 Hz"))
+        self.label_4.setText(_translate("MainWindow", "30 - 40 Hz"))
+        self.label_5.setText(_translate("MainWindow", "40 - 50 Hz"))
+        self.label_6.setText(_translate("MainWindow", "50 - 60 Hz"))
+        self.label_7.setText(_translate("MainWindow", "60 - 70 Hz"))
+        self.label_8.setText(_translate("MainWindow", "70 - 80 Hz"))
+        self.label_9.setText(_translate("MainWindow", "80 - 90 Hz"))
+        self.label_10.setText(_translate("MainWindow", "90 - 100 Hz"))
+        self.outputSignalGroupBox.setTitle(_translate("MainWindow", "Output Signal / Spectrogram"))
+        self.controllerGroupBox.setTitle(_translate("MainWindow", "Controllers"))
+        self.modeLabel.setText(_translate("MainWindow", "Mode:"))
+        self.modeComboBox.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Select signal mode</span></p></body></html>"))
+        self.modeComboBox.setPlaceholderText(_translate("MainWindow", "Select Mode"))
+        self.modeComboBox.setItemText(0, _translate("MainWindow", "Uniform Range Mode"))
+        self.modeComboBox.setItemText(1, _translate("MainWindow", "Musical Instruments Mode"))
+        self.modeComboBox.setItemText(2, _translate("MainWindow", "Animal Sounds Mode"))
+        self.modeComboBox.setItemText(3, _translate("MainWindow", "ECG Abnormalities Mode"))
+        self.channelLabel.setText(_translate("MainWindow", "Channel:"))
+        self.channelComboBox.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Channel shown in the viewers; every channel is equalized and exported</span></p></body></html>"))
+        self.channelComboBox.setItemText(0, _translate("MainWindow", "Mid"))
+        self.listWidgetLabel.setText(_translate("MainWindow", "Current Playlist"))
+        self.audioListWidget.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Tracks stored in playlist</span></p></body></html>"))
+        self.spectrogramRadioButton.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Display or disappear spectrograms</span></p></body></html>"))
+        self.spectrogramRadioButton.setText(_translate("MainWindow", "Show Spectrogram"))
+        self.playPauseButton.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Play/Pause</span></p></body></html>"))
+        self.stopButton.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Stop Signal</span></p></body></html>"))
+        self.replayButton.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Replay</span></p></body></html>"))
+        self.speedLabel.setText(_translate("MainWindow", "Speed:"))
+        self.speedSlider.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Control speed of audio file</span></p></body></html>"))
+        self.constructAudioButton.setText(_translate("MainWindow", "Construct Audio"))
+        self.deleteButton.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Delete Audio/Signal</span></p></body></html>"))
+        self.changeWindowButton.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Shift to smoothing window</span></p></body></html>"))
+        self.changeWindowButton.setText(_translate("MainWindow", "Change Window"))
+        self.originalSignalGroupBox.setTitle(_translate("MainWindow", "Original Signal / Spectrogram"))
+        self.label_12.setText(_translate("MainWindow", "Original"))
+        self.originalStartLabel.setText(_translate("MainWindow", "0:00 /"))
+        self.originalEndLabel.setText(_translate("MainWindow", "0:00"))
+        self.originalProgressSlider.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Input audio progress bar</span></p></body></html>"))
+        self.muteOriginalButton.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Mute/Unmute original signal sound</span></p></body></html>"))
+        self.originalVolumeSpinBox.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Change original signal volume</span></p></body></html>"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.equalizerTab), _translate("MainWindow", "Equalizer"))
+        self.smootherGroupBox.setTitle(_translate("MainWindow", "Smoothed Signal"))
+        self.smoothingControllerComboBox.setTitle(_translate("MainWindow", "Controller"))
+        self.meanLabel.setText(_translate("MainWindow", "Mean"))
+        self.meanSlider.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Change signal mean</span></p></body></html>"))
+        self.stdLabel.setText(_translate("MainWindow", "Standard Deviation"))
+        self.standardDeviationSlider.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Change signal standard deviation</span></p></body></html>"))
+        self.confirmButton.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Confirm changes</span></p></body></html>"))
+        self.windowLabel.setText(_translate("MainWindow", "Window:"))
+        self.smootherComboBox.setToolTip(_translate("MainWindow", "<html><head/><body><p><span style=\" font-size:7pt; color:#000000;\">Select smoothing mode</span></p></body></html>"))
+        self.smootherComboBox.setPlaceholderText(_translate("MainWindow", "Select Smoothing Window"))
+        self.smootherComboBox.setItemText(0, _translate("MainWindow", "Rectangle"))
+        self.smootherComboBox.setItemText(1, _translate("MainWindow", "Hamming"))
+        self.smootherComboBox.setItemText(2, _translate("MainWindow", "Hanning"))
+        self.smootherComboBox.setItemText(3, _translate("MainWindow", "Gaussian"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.smootherTab), _translate("MainWindow", "Smoothing Window"))
+        self.menuFile.setTitle(_translate("MainWindow", "File"))
+        self.menuTools.setTitle(_translate("MainWindow", "Tools"))
+        self.actionOpen_Signal.setText(_translate("MainWindow", "Open Signal"))
+        self.actionExit.setText(_translate("MainWindow", "Quit"))
+        self.actionOpen_Signal_2.setText(_translate("MainWindow", "Open Signal"))
+        self.actionExit_2.setText(_translate("MainWindow", "Exit"))
+        self.actionA7a.setText(_translate("MainWindow", "A7a"))
+        self.actionOpenUniformSignal.setText(_translate("MainWindow", "Add Uniform Signal"))
+        self.actionOpenAnimalSounds.setText(_translate("MainWindow", "Add Animal Sounds"))
+        self.actionOpenInstrumentsSounds.setText(_translate("MainWindow", "Add Instruments Sounds"))
+        self.actionOpenECGSignal.setText(_translate("MainWindow", "Add ECG Signal"))
+        self.actionProfilerStats.setText(_translate("MainWindow", "Performance Stats"))
+        self.actionSavePreset.setText(_translate("MainWindow", "Save EQ Preset..."))
+        self.actionDitherExports.setText(_translate("MainWindow", "Dither 16/24-bit Exports"))
@@ -0,0 +1,529 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from fft_backend import irfft, rfft
+
+UNIFORM_MODE = "Uniform Range Mode"
+ECG_MODE = "ECG Abnormalities Mode"
+ANIMAL_MODE = "Animal Sounds Mode"
+MUSIC_MODE = "Musical Instruments Mode"
+
+UNIFORM_BANDS = 10
+
+# Slider bands of the named modes, [min_hz, max_hz]
+MODE_FREQUENCY_RANGES = {
+    MUSIC_MODE: [
+        [0, 1000],  # Guitar
+        [1000, 2000],  # Drums
+        [2000, 3000],  # Trumpet
+        [4000, 5000],  # Piano
+    ],
+    ANIMAL_MODE: [
+        [600, 800],  # Bengal Tiger
+        [3800, 7000],  # Elephant
+        [1000, 6000],  # Lamb
+        [0, 3000],  # Sea Lion
+    ],
+    ECG_MODE: [
+        [0, 12],
+        [0, 0],
+        [38, 96],
+    ],
+}
+# Length of the bundled Normal.csv recording, whose first ECG band is switched off
+ECG_NORMAL_LENGTH = 3341
+
+# Proxy previews keep this much bandwidth above the highest band edge
+PROXY_HEADROOM = 1.25
+# Signals shorter than this are always reconstructed at full rate
+PROXY_MIN_SAMPLES = 1 << 18
+
+# Smoothing windows in the order of the smoother combo box
+WINDOW_NAMES = ["rectangle", "hamming", "hanning", "gaussian"]
+
+
+def make_window(index, freqs, mu=None, std=None):
+    """
+    Smoothing window laid over one band, as drawn on the smoothing tab.
+
+    Parameters:
+    - index (int): 0 rectangle, 1 hamming, 2 hanning, 3 gaussian.
+    - freqs (ndarray): Frequencies of the band bins.
+    - mu, std (float): Gaussian centre and width, only used for index 3.
+    """
+    if index == 0:
+        return np.ones_like(freqs)
+    elif index == 1:
+        return np.hamming(len(freqs))
+    elif index == 2:
+        return np.hanning(len(freqs))
+    return np.exp(-(freqs - mu) ** 2 / (2 * std ** 2))
+
+
+def mode_frequency_ranges(mode, n):
+    """Band ranges of a mode for an n-sample signal, or None for the uniform bands."""
+    ranges = MODE_FREQUENCY_RANGES.get(mode)
+    if ranges is None:
+        return None
+    ranges = [list(edges) for edges in ranges]
+    if mode == ECG_MODE:
+        ranges[0] = [0, 0] if n == ECG_NORMAL_LENGTH else [0, 12]
+    return ranges
+
+
+def band_count(mode):
+    ranges = MODE_FREQUENCY_RANGES.get(mode)
+    return UNIFORM_BANDS if ranges is None else len(ranges)
+
+
+def nearest_bins(frequencies, targets):
+    """Index of the bin closest to each target in an ascending frequency axis (ties go to the lower bin)."""
+    targets = np.asarray(targets, dtype=float)
+    if len(frequencies) < 2:
+        return np.zeros(targets.shape, dtype=int)
+    idx = np.clip(np.searchsorted(frequencies, targets), 1, len(frequencies) - 1)
+    left = frequencies[idx - 1]
+    right = frequencies[idx]
+    return np.where(targets - left <= right - targets, idx - 1, idx)
+
+
+def uniform_bands(n_bins):
+    """Uniform Range Mode: ten equal index ranges over the rfft bins (0 .. n_bins - 1)."""
+    step = (n_bins - 1) // UNIFORM_BANDS
+    bands = []
+    for idx in range(UNIFORM_BANDS):
+        hi = (idx + 1) * step + 2 if idx == UNIFORM_BANDS - 1 else (idx + 1) * step
+        bands.append(slice(int(idx * step), int(hi)))
+    return bands
+
+
+def band_table(mode, frequencies, frequency_ranges=None):
+    """
+    Build the bin slice of every slider band for one loaded signal.
+
+    Named modes map their [min_hz, max_hz] ranges onto the nearest bins of the
+    rfft frequency axis.
+    """
+    if frequency_ranges:
+        edges = nearest_bins(frequencies, np.asarray(frequency_ranges, dtype=float).ravel()).reshape(-1, 2)
+        return [slice(int(lo), int(hi)) for lo, hi in edges]
+    return uniform_bands(len(frequencies))
+
+
+def band_edges_hz(mode, n, fs, frequency_ranges=None):
+    """[min_hz, max_hz] of every band for an n-sample signal, without building its frequency axis."""
+    if frequency_ranges:
+        return [tuple(map(float, edges)) for edges in frequency_ranges]
+    return [(band.start * fs / n, band.stop * fs / n) for band in uniform_bands(n // 2 + 1)]
+
+
+def proxy_factor(mode, n, fs, frequency_ranges=None):
+    """
+    Decimation factor of an n-sample signal's preview proxy, or 1 for no proxy.
+
+    The proxy rate stays PROXY_HEADROOM above twice the highest band edge,
+    so every slider band is still audible in (and visible on) the proxy.
+    Modes whose bands reach Nyquist, such as Uniform Range Mode, get none.
+    """
+    if n < PROXY_MIN_SAMPLES:
+        return 1
+    top = max(hi for _, hi in band_edges_hz(mode, n, fs, frequency_ranges))
+    if top <= 0:
+        return 1
+    return max(int(fs / (2 * top * PROXY_HEADROOM)), 1)
+
+
+def channel_view(samples, channel=None):
+    """
+    One channel of a (channels, samples) array, or the mid signal (their mean) for `channel` None.
+
+    1-D (mono) arrays are returned as they are.
+    """
+    if samples.ndim == 1:
+        return samples
+    if channel is None:
+        return samples.mean(axis=0, dtype=samples.dtype)
+    return samples[channel]
+
+
+def unity_gain(frequencies):
+    return np.ones(len(frequencies))
+
+
+def band_gain_curve(mode, n, fs, frequency_ranges, band_settings):
+    """
+    Gain-vs-frequency function equivalent to the per-bin gains of the engine.
+
+    Lets block-based processing rebuild the same band gains and smoothing
+    windows on its own frequency grid. `band_settings` maps band index to
+    (value, window) in the order the bands were last written, where window is
+    None, a (index, mu, std) spec for make_window, or a per-bin array that is
+    resampled over the band.
+    """
+    return BandGainCurve(mode, band_edges_hz(mode, n, fs, frequency_ranges), band_settings, fs / n, n // 2 + 1)
+
+
+class BandGainCurve:
+    """
+    Callable returned by band_gain_curve: maps an array of frequencies (Hz) to gains.
+
+    Also keeps the band edges (Hz) and settings it was built from, for
+    processors that design their own filters per band instead of sampling
+    the curve (see iir.py).
+
+    Window specs are laid over the band's bins on the engine's own grid
+    (`resolution` Hz apart, `n_bins` of them) and interpolated from there,
+    so a window keeps the same shape in Hz on any grid instead of being
+    stretched over however many bins the band has there.
+    """
+
+    def __init__(self, mode, edges, band_settings, resolution, n_bins):
+        self.mode = mode
+        self.edges = edges
+        self.settings = list(band_settings.items())
+        self.resolution = resolution
+        self.n_bins = n_bins
+
+    def engine_bins(self, band_index):
+        """Frequencies of the bins one band covers in the engine, as nearest_bins picks them."""
+        # Ties go to the lower bin, as in nearest_bins; uniform bands are bin slices and may end at n_bins
+        top = self.n_bins if self.mode == UNIFORM_MODE else self.n_bins - 1
+        lo, hi = np.clip(np.ceil(np.asarray(self.edges[band_index]) / self.resolution - 0.5), 0, top)
+        return np.arange(int(lo), int(hi)) * self.resolution
+
+    def __call__(self, frequencies):
+        gains = np.ones(len(frequencies))
+        for band_index, (value, window) in self.settings:
+            lo, hi = nearest_bins(frequencies, self.edges[band_index])
+            if hi <= lo:
+                continue
+            band_freqs = frequencies[lo:hi]
+            if window is None:
+                gains[lo:hi] = value
+            elif isinstance(window, tuple):
+                grid = self.engine_bins(band_index)
+                if not len(grid):
+                    continue
+                gains[lo:hi] = value * np.interp(band_freqs, grid, make_window(window[0], grid, *window[1:]))
+            else:
+                grid = self.engine_bins(band_index)
+                if len(grid) != len(window):
+                    grid = np.linspace(*self.edges[band_index], len(window), endpoint=False)
+                gains[lo:hi] = value * np.interp(band_freqs, grid, window)
+        return gains
+
+
+def band_segments(bands, n_bins):
+    """Split possibly overlapping bands into disjoint bin segments covered by at least one band."""
+    spans = [band.indices(n_bins)[:2] for band in bands]
+    edges = sorted({edge for span in spans for edge in span})
+    segments = [slice(a, b) for a, b in zip(edges, edges[1:])
+                if any(lo <= a and b <= hi for lo, hi in spans)]
+    members = [[i for i, seg in enumerate(segments) if lo <= seg.start and seg.stop <= hi] for lo, hi in spans]
+    return segments, members
+
+
+class SignalAnalysis:
+    """
+    Real-input spectrum and band table of one signal in one mode.
+
+    Immutable once built, so it can be cached and handed to several engines;
+    `time` optionally keeps the sample times of signals that come with their
+    own time axis (CSV files). `dtype` is the real working precision:
+    float32 stores the signal, spectrum and magnitudes at half the memory of
+    float64 and transforms in single precision.
+
+    `signal` is either mono (1-D) or shaped (channels, samples); all channels
+    are transformed in one call along the last axis and share the frequency
+    axis and band table. `magnitudes` are those of the mono or mid signal
+    (see channel_view); `channel_magnitudes` gives the other views.
+    """
+
+    def __init__(self, signal, fs, mode, frequency_ranges=None, time=None, dtype=np.float64):
+        dtype = np.dtype(dtype)
+        n = signal.shape[-1]
+        self.signal = np.asarray(signal, dtype=dtype) if dtype == np.float32 else signal
+        self.length = n
+        self.channels = 1 if signal.ndim == 1 else signal.shape[0]
+        self.fs = fs
+        self.mode = mode
+        self.time = time
+        self.dtype = dtype
+        self.frequency_ranges = [list(edges) for edges in frequency_ranges] if frequency_ranges else None
+        self.frequencies = np.fft.rfftfreq(n, 1 / fs)
+        complex_dtype = np.result_type(dtype, np.complex64)
+        self.spectrum = rfft(np.asarray(self.signal, dtype=dtype), axis=-1).astype(complex_dtype, copy=False)
+        self.magnitudes = self.channel_magnitudes(None)
+        self.bands = band_table(mode, self.frequencies, self.frequency_ranges)
+
+    def channel_magnitudes(self, channel=None):
+        """Spectrum magnitudes of one channel, or of the mid signal for None (the spectrum is linear)."""
+        return np.abs(channel_view(self.spectrum, channel))
+
+    @property
+    def nbytes(self):
+        arrays = [self.signal, self.frequencies, self.spectrum, self.magnitudes, self.time]
+        return sum(array.nbytes for array in arrays if isinstance(array, np.ndarray))
+
+
+class EqualizerEngine:
+    """
+    Qt-free equalizer state for the currently loaded signal.
+
+    Owns the spectrum, the per-bin gain vector and the modified magnitudes, and
+    keeps the band-to-bin table of the active mode so a slider move only
+    touches the bins of its own band. Multichannel signals keep their
+    (channels, samples) layout: one gain vector is broadcast over every
+    channel's spectrum and all channels are inverted in a single irfft, so
+    stereo costs about as much per sample as mono. `magnitudes` and
+    `modified` describe the mid signal.
+
+    Every mode runs on the real-input spectrum (rfft/irfft), and `gains`, the
+    per-bin slider gains shown in the frequency plot, multiply it exactly:
+    a band at gain 0 is removed from the output in every mode. (Uniform and
+    ECG modes used to scale only the positive half of a two-sided FFT and
+    keep the real part of the inverse, which halved every cut.) With
+    `dtype=np.float32` spectra and outputs are single precision, and the
+    output stays within about 1e-6 of the input RMS of the float64 result.
+
+    With a non-zero `basis_budget` (bytes) the engine also keeps the
+    time-domain contribution of every band segment plus the untouched
+    remainder, so reconstruction becomes `remainder + sum(gain_k * band_k)`
+    without any inverse FFT. Rectangular-window bases are built on load;
+    bases for smoothed windows are built on first use and evicted LRU once the
+    budget is exhausted. If the rectangular set alone does not fit, the engine
+    silently uses the FFT path for that signal.
+
+    The gained spectrum handed to the inverse FFT is written into one work
+    buffer kept while the signal stays loaded, so an FFT-path update only
+    allocates its output. Transforms go through fft_backend.
+
+    `reconstruct_proxy` gives a cheap preview of the output decimated by
+    `proxy_factor` (see the module function) for use while a slider is
+    dragged; the exact `reconstruct` replaces it once the slider settles.
+    """
+
+    def __init__(self, basis_budget=0, dtype=np.float64):
+        self.basis_budget = basis_budget
+        self.dtype = np.dtype(dtype)
+        self.analysis = None
+        self.signal = None
+        self.length = 0
+        self.channels = 1
+        self.fs = None
+        self.mode = None
+        self.frequencies = None
+        self.spectrum = None
+        self.magnitudes = None
+        self.gains = None
+        self.modified = None
+        self.frequency_ranges = None
+        self.bands = []
+        self.band_settings = OrderedDict()
+        self.proxy_factor = 1
+        self._product = None
+        self._reset_basis()
+
+    @property
+    def loaded(self):
+        return self.spectrum is not None
+
+    @property
+    def basis_active(self):
+        return self._remainder is not None
+
+    @property
+    def basis_bytes(self):
+        if self._remainder is None:
+            return 0
+        return self._remainder.nbytes * (len(self._rect_bases) + 2) + self._windowed_bytes
+
+    @property
+    def phases(self):
+        return np.angle(self.spectrum)
+
+    def load(self, signal, fs, mode, frequency_ranges=None):
+        """Analyse a new signal and build the band table of its mode."""
+        self.load_analysis(SignalAnalysis(signal, fs, mode, frequency_ranges, dtype=self.dtype))
+
+    def load_analysis(self, analysis):
+        """Start equalizing a previously analysed signal with all gains at one."""
+        self.analysis = analysis
+        self.signal = analysis.signal
+        self.length = analysis.length
+        self.channels = analysis.channels
+        self.fs = analysis.fs
+        self.mode = analysis.mode
+        self.frequencies = analysis.frequencies
+        self.spectrum = analysis.spectrum
+        self.magnitudes = analysis.magnitudes
+        self.frequency_ranges = analysis.frequency_ranges
+        self.bands = analysis.bands
+        self.gains = np.ones(len(self.magnitudes), dtype=self.magnitudes.dtype)
+        self.modified = self.magnitudes.copy()
+        self.band_settings = OrderedDict()
+        self.proxy_factor = proxy_factor(self.mode, self.length, self.fs, self.frequency_ranges)
+        self._product = None
+        self._build_basis()
+
+    def band_frequencies(self, band_index):
+        return self.frequencies[self.bands[band_index]]
+
+    def set_gain(self, band_index, value, window=None):
+        """
+        Scale one band by `value`, shaped by an optional smoothing window.
+
+        `window` is either a per-bin array over the band or an (index, mu, std)
+        spec passed to make_window; specs let block-based processing rebuild the
+        same window on a different frequency grid.
+        """
+        band = self.bands[band_index]
+        spec = window if isinstance(window, tuple) else None
+        if spec is not None:
+            window = make_window(spec[0], self.frequencies[band], *spec[1:])
+        self.band_settings.pop(band_index, None)
+        self.band_settings[band_index] = (value, window if spec is None else spec)
+
+        if window is None:
+            self.gains[band] = value
+        else:
+            np.multiply(window, value, out=self.gains[band])
+        np.multiply(self.magnitudes[band], self.gains[band], out=self.modified[band])
+
+        if self.basis_active:
+            key = self._window_key(spec if spec is not None else window)
+            owner = None if key is None else band_index
+            self._band_windows[band_index] = None if key is None else np.array(window)
+            for i in self._band_members[band_index]:
+                self._segment_state[i] = (owner, key, value)
+
+    def gain_curve(self):
+        """Current gains as a function of frequency, for block-based processing of the same signal."""
+        return band_gain_curve(self.mode, self.length, self.fs, self.frequency_ranges, self.band_settings)
+
+    def reset_gains(self):
+        self.band_settings.clear()
+        self.gains.fill(1)
+        np.copyto(self.modified, self.magnitudes)
+        self._segment_state = [(None, None, 1.0)] * len(self.segments)
+
+    def reconstruct(self, out=None):
+        """Time-domain output for the current gains, written into `out` when given."""
+        if self.basis_active:
+            if out is None:
+                out = np.empty_like(self._remainder)
+            np.copyto(out, self._remainder)
+            for i, (owner, key, value) in enumerate(self._segment_state):
+                basis = self._segment_basis(i, owner, key)
+                if basis is None:
+                    break
+                np.multiply(basis, value, out=self._scratch)
+                out += self._scratch
+            else:
+                return out
+
+        return self._inverse(self._gained_spectrum(), out)
+
+    def reconstruct_proxy(self):
+        """
+        Output decimated by `proxy_factor`, at a sample rate of fs / proxy_factor.
+
+        A signal decimated by D after ideal low-pass filtering has exactly
+        the first (n // D) // 2 + 1 bins of the full spectrum, at the same
+        bin frequencies; so the proxy is an inverse FFT D times shorter of
+        those bins times the same per-bin gains, with no band table of its
+        own to keep in step. Falls back to `reconstruct` without a proxy.
+        """
+        factor = self.proxy_factor
+        if factor == 1:
+            return self.reconstruct()
+        length = self.length // factor
+        spectrum = self._gained_spectrum(length // 2 + 1)
+        spectrum /= factor
+        return self._inverse(spectrum, n=length)
+
+    def _gained_spectrum(self, bins=None):
+        """The first `bins` bins of spectrum * gains, in the engine's work buffer."""
+        if self._product is None:
+            self._product = np.empty_like(self.spectrum)
+        product = self._product[..., :bins]
+        np.multiply(self.spectrum[..., :bins], self.gains[:bins], out=product)
+        return product
+
+    def _inverse(self, spectrum, out=None, n=None):
+        # `spectrum` is always a scratch array (the work buffer or a basis mask)
+        output = irfft(spectrum, n=n or self.length, axis=-1, out=out, overwrite=True)
+        return output.astype(self.spectrum.real.dtype, copy=False)
+
+    # ---------------------------------------------------------------- band basis
+    def _reset_basis(self):
+        self.segments = []
+        self._band_members = []
+        self._segment_state = []
+        self._band_windows = []
+        self._remainder = None
+        self._scratch = None
+        self._rect_bases = []
+        self._windowed_bases = OrderedDict()
+        self._windowed_bytes = 0
+
+    def _build_basis(self):
+        self._reset_basis()
+        self.segments, self._band_members = band_segments(self.bands, self.spectrum.shape[-1])
+        self._segment_state = [(None, None, 1.0)] * len(self.segments)
+        self._band_windows = [None] * len(self.bands)
+
+        # remainder + scratch + one rectangular basis per segment
+        vector_bytes = self.signal.size * self.spectrum.real.itemsize
+        if not self.basis_budget or vector_bytes * (len(self.segments) + 2) > self.basis_budget:
+            return
+
+        uncovered = self.spectrum.copy()
+        for seg in self.segments:
+            uncovered[..., seg] = 0
+        self._rect_bases = [self._compute_basis(i, None) for i in range(len(self.segments))]
+        self._scratch = np.empty(self.signal.shape, dtype=self.spectrum.real.dtype)
+        self._remainder = self._inverse(uncovered)
+
+    def _compute_basis(self, segment_index, band_index):
+        seg = self.segments[segment_index]
+        masked = np.zeros_like(self.spectrum)
+        masked[..., seg] = self.spectrum[..., seg]
+        if band_index is not None:
+            offset = seg.start - self.bands[band_index].start
+            masked[..., seg] *= self._band_windows[band_index][offset:offset + seg.stop - seg.start]
+        return self._inverse(masked)
+
+    def _segment_basis(self, segment_index, owner, key):
+        if owner is None:
+            return self._rect_bases[segment_index]
+
+        cache_key = (segment_index, owner, key)
+        basis = self._windowed_bases.get(cache_key)
+        if basis is not None:
+            self._windowed_bases.move_to_end(cache_key)
+            return basis
+
+        vector_bytes = self._remainder.nbytes
+        while self._windowed_bases and self.basis_bytes + vector_bytes > self.basis_budget:
+            _, evicted = self._windowed_bases.popitem(last=False)
+            self._windowed_bytes -= evicted.nbytes
+        if self.basis_bytes + vector_bytes > self.basis_budget:
+            return None
+
+        basis = self._compute_basis(segment_index, owner)
+        self._windowed_bases[cache_key] = basis
+        self._windowed_bytes += basis.nbytes
+        return basis
+
+    @staticmethod
+    def _window_key(window):
+        if window is None:
+            return None
+        if isinstance(window, tuple):
+            return None if window[0] == 0 else window
+        window = np.asarray(window)
+        if np.all(window == 1):
+            return None
+        return hash(window.tobytes())
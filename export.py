@@ -0,0 +1,86 @@
+"""
+Writing equalized audio to disk block by block.
+
+`write_audio` converts and writes one block of the output at a time, so
+apart from the signal itself it needs memory for a single block whatever
+the track length; `write_blocks` does the same for output that arrives as
+blocks and never exists whole. Integer formats are quantized here rather than by
+libsndfile: samples are scaled by 2^(bits-1), the same scale audio_io
+reads them back with, optionally with TPDF dither of +-1 LSB, and clipped.
+"""
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+BLOCK_SIZE = 65536
+
+# name -> (label, container, libsndfile subtype, integer bits or None for float)
+EXPORT_FORMATS = OrderedDict([
+    ("wav16", ("WAV PCM 16-bit", "WAV", "PCM_16", 16)),
+    ("wav24", ("WAV PCM 24-bit", "WAV", "PCM_24", 24)),
+    ("wav32f", ("WAV float 32-bit", "WAV", "FLOAT", None)),
+    ("flac16", ("FLAC 16-bit", "FLAC", "PCM_16", 16)),
+    ("flac24", ("FLAC 24-bit", "FLAC", "PCM_24", 24)),
+])
+
+
+def quantize(block, bits, rng=None):
+    """
+    Integer samples of a float block for a `bits`-bit PCM file, as the
+    int16/int32 array soundfile writes without converting again (24-bit
+    samples sit in the top bits of int32).
+    """
+    scale = 2 ** (bits - 1)
+    scaled = block * scale
+    if rng is not None:
+        scaled += rng.random(block.shape) - rng.random(block.shape)
+    samples = np.clip(np.rint(scaled), -scale, scale - 1)
+    if bits == 16:
+        return samples.astype(np.int16)
+    return samples.astype(np.int32) << (32 - bits)
+
+
+def write_audio(file_path, signal, fs, export_format="wav16", dither=False, block_size=BLOCK_SIZE,
+                progress=None, cancelled=None):
+    """
+    Write a mono or (channels, samples) signal as `export_format` (see EXPORT_FORMATS).
+
+    `progress(fraction)` is called after every block; when `cancelled()`
+    returns true the partial file is removed and False is returned.
+    """
+    channels = 1 if signal.ndim == 1 else signal.shape[0]
+    n = signal.shape[-1]
+    blocks = (signal[..., start:start + block_size] for start in range(0, n, block_size))
+    return write_blocks(file_path, blocks, fs, channels, n, export_format, dither, progress, cancelled)
+
+
+def write_blocks(file_path, blocks, fs, channels, length, export_format="wav16", dither=False, progress=None,
+                 cancelled=None):
+    """
+    Write an iterable of mono or (channels, samples) blocks, `length` samples in all, as `export_format`.
+
+    Blocks are pulled one at a time, so a generator that equalizes as it
+    goes (see streaming.equalize_blocks) is never held whole. `progress`
+    and `cancelled` work as in write_audio.
+    """
+    import soundfile as sf
+
+    _, container, subtype, bits = EXPORT_FORMATS[export_format]
+    rng = np.random.default_rng() if dither and bits else None
+    written = 0
+    with sf.SoundFile(file_path, "w", samplerate=int(fs), channels=channels, format=container,
+                      subtype=subtype) as out:
+        for block in blocks:
+            if cancelled is not None and cancelled():
+                break
+            # soundfile takes (frames, channels)
+            block = np.real(block).T
+            out.write(quantize(block, bits, rng) if bits else block.astype(np.float32))
+            written += len(block)
+            if progress is not None:
+                progress(min(written / max(length, 1), 1.0))
+        else:
+            return True
+    os.remove(file_path)
+    return False
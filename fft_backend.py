@@ -0,0 +1,156 @@
+"""
+Switchable implementation of the real FFTs behind the equalizer.
+
+Every rfft/irfft of the engine, Holter windows, streaming playback and the
+spectrogram goes through `rfft` and `irfft` here, which call the backend
+chosen with `set_backend`:
+
+- "numpy": numpy.fft, single-threaded; writes straight into `out`
+- "scipy": scipy.fft, which keeps float32 input in single precision and
+  splits multichannel and batched transforms over `workers` threads
+- "pyfftw": FFTW through pyFFTW (optional), with the plan of each transform
+  shape built once and kept in a small LRU of PLAN_CACHE_SIZE plans per
+  thread (a plan owns its arrays, so threads cannot share one)
+
+All backends return the same (numpy-normalised) result to rounding. The
+engine's whole-signal transform has to keep the signal's own length, since
+its bins are the band table's grid; transforms whose length is free, such
+as Holter frames, pad to `fast_length` instead so prime-ish sizes never
+reach the slow paths.
+"""
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+BACKENDS = ("numpy", "scipy", "pyfftw")
+# FFTW plans kept per thread; each holds its own input and output arrays
+PLAN_CACHE_SIZE = 8
+# FFTW_MEASURE would time several algorithms on first use of every shape
+PYFFTW_PLANNER_EFFORT = "FFTW_ESTIMATE"
+
+
+def fast_length(n):
+    """Smallest length >= n whose real FFT has only small prime factors."""
+    # scipy is only loaded here and by ScipyBackend, keeping it off the startup path
+    from scipy.fft import next_fast_len
+
+    return next_fast_len(int(n), real=True)
+
+
+class NumpyBackend:
+    name = "numpy"
+
+    def __init__(self, workers=None):
+        self.workers = 1
+
+    def rfft(self, a, n=None, axis=-1):
+        return np.fft.rfft(a, n=n, axis=axis)
+
+    def irfft(self, a, n=None, axis=-1, out=None, overwrite=False):
+        return np.fft.irfft(a, n=n, axis=axis, out=out)
+
+
+class ScipyBackend:
+    name = "scipy"
+
+    def __init__(self, workers=None):
+        import scipy.fft
+
+        self._fft = scipy.fft
+        # -1 uses every core
+        self.workers = workers or -1
+
+    def rfft(self, a, n=None, axis=-1):
+        return self._fft.rfft(a, n=n, axis=axis, workers=self.workers)
+
+    def irfft(self, a, n=None, axis=-1, out=None, overwrite=False):
+        result = self._fft.irfft(a, n=n, axis=axis, overwrite_x=overwrite, workers=self.workers)
+        if out is None:
+            return result
+        np.copyto(out, result)
+        return out
+
+
+class PyfftwBackend:
+    name = "pyfftw"
+
+    def __init__(self, workers=None):
+        import pyfftw.builders
+
+        self._builders = pyfftw.builders
+        self.workers = workers or os.cpu_count() or 1
+        self._local = threading.local()
+
+    def rfft(self, a, n=None, axis=-1):
+        # The plan owns its output array, so hand back a copy
+        return self._plan("rfft", a, n, axis, False)(a).copy()
+
+    def irfft(self, a, n=None, axis=-1, out=None, overwrite=False):
+        result = self._plan("irfft", a, n, axis, overwrite)(a)
+        if out is None:
+            return result.copy()
+        np.copyto(out, result)
+        return out
+
+    def _plan(self, kind, a, n, axis, overwrite):
+        plans = getattr(self._local, "plans", None)
+        if plans is None:
+            plans = self._local.plans = OrderedDict()
+        key = (kind, a.shape, a.dtype.str, n, axis, overwrite)
+        plan = plans.pop(key, None)
+        if plan is None:
+            build = self._builders.rfft if kind == "rfft" else self._builders.irfft
+            plan = build(a, n=n, axis=axis, overwrite_input=overwrite, threads=self.workers,
+                         planner_effort=PYFFTW_PLANNER_EFFORT)
+        plans[key] = plan
+        while len(plans) > PLAN_CACHE_SIZE:
+            plans.popitem(last=False)
+        return plan
+
+
+_BACKEND_CLASSES = {"numpy": NumpyBackend, "scipy": ScipyBackend, "pyfftw": PyfftwBackend}
+_backend = NumpyBackend()
+
+
+def available_backends():
+    """Backend names whose library can be imported here."""
+    names = ["numpy", "scipy"]
+    try:
+        import pyfftw  # noqa: F401
+        names.append("pyfftw")
+    except ImportError:
+        pass
+    return names
+
+
+def set_backend(name, workers=None):
+    """
+    Route every following transform through backend `name` (see BACKENDS).
+
+    `workers` is the thread count of scipy and pyFFTW (None for all cores).
+    Raises ValueError for an unknown name and ImportError when pyFFTW is
+    not installed.
+    """
+    global _backend
+    if name not in _BACKEND_CLASSES:
+        raise ValueError(f"Unknown FFT backend {name!r}, expected one of {', '.join(BACKENDS)}")
+    _backend = _BACKEND_CLASSES[name](workers)
+    return _backend
+
+
+def get_backend():
+    return _backend
+
+
+def rfft(a, n=None, axis=-1):
+    return _backend.rfft(a, n=n, axis=axis)
+
+
+def irfft(a, n=None, axis=-1, out=None, overwrite=False):
+    """
+    Inverse of rfft. With `out` the result is written there (same shape,
+    matching real dtype); `overwrite` lets the backend use `a` as scratch.
+    """
+    return _backend.irfft(a, n=n, axis=axis, out=out, overwrite=overwrite)
@@ -0,0 +1,61 @@
+"""
+One display-paced tick for everything that moves during playback.
+
+The playhead lines, progress slider and time labels used to be driven by
+their own timers whose interval doubled as the playback speed, so fast
+speeds meant hundreds of callbacks (and repaints) per second and the
+playhead drifted from the nominal interval. FrameClock fires once per
+display refresh instead and reports the time that really passed, measured
+with a monotonic clock, so listeners can advance by `elapsed * rate` and
+redraw once per frame.
+"""
+import time
+
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QGuiApplication
+
+# Used when the screen does not report its refresh rate
+DEFAULT_REFRESH_HZ = 60.0
+
+
+def display_refresh_rate():
+    screen = QGuiApplication.primaryScreen()
+    rate = screen.refreshRate() if screen is not None else 0
+    return rate if rate > 1 else DEFAULT_REFRESH_HZ
+
+
+class FrameClock(QObject):
+    """
+    Emits `frame(elapsed)` about once per display refresh while running.
+
+    `elapsed` is the monotonic time in seconds since the previous frame (or
+    since `start`), so a late or skipped tick is made up for on the next one
+    instead of slowing the playhead down.
+    """
+    frame = pyqtSignal(float)
+
+    def __init__(self, parent=None, refresh_hz=None):
+        super().__init__(parent)
+        self.refreshHz = refresh_hz or display_refresh_rate()
+        self._last = None
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(max(1, round(1000 / self.refreshHz)))
+        self._timer.timeout.connect(self._tick)
+
+    def start(self):
+        if not self._timer.isActive():
+            self._last = time.monotonic()
+            self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+        self._last = None
+
+    def isActive(self):
+        return self._timer.isActive()
+
+    def _tick(self):
+        now = time.monotonic()
+        elapsed, self._last = now - self._last, now
+        self.frame.emit(elapsed)
@@ -0,0 +1,141 @@
+"""
+Causal parametric equalization with one biquad per slider band.
+
+An alternative to FFT masking (engine.py) and the STFT processor
+(streaming.py) for live playback and arbitrarily long files: every band of
+the mode's frequency table becomes one second-order section and the
+sections are cascaded with `scipy.signal.sosfilt`, carrying the filter
+state from block to block. Output is sample-accurate with no latency and
+needs two state values per band and channel, whatever the signal length.
+
+Band shapes follow the RBJ audio-EQ cookbook:
+
+- a band starting at 0 Hz is a low shelf with its corner at the top edge
+- a band reaching Nyquist is a high shelf with its corner at the bottom edge
+- any other band is a peaking filter centred on the geometric mean of its
+  edges, as wide as the band in octaves
+
+The slider value is the linear gain in the band; 0 (mute) is floored at
+MIN_GAIN_DB since a peaking filter cannot reach -inf dB. Compared with the
+FFT path the band edges roll off instead of cutting at a bin, overlapping
+bands multiply instead of the last one winning, and smoothing windows are
+not applied (every band is flat).
+"""
+from functools import lru_cache
+
+import numpy as np
+from scipy.signal import sosfilt
+
+from engine import BandGainCurve
+
+# Deepest cut of a muted band; deeper peaking cuts widen their skirts into the neighbouring bands
+MIN_GAIN_DB = -30
+# Bands whose top edge is at least this share of Nyquist become high shelves
+HIGH_SHELF_FRACTION = 0.95
+# Samples filtered per call during live playback (the player renders `hop` at a time)
+BLOCK_LENGTH = 1024
+IDENTITY_SECTION = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+
+
+def band_gains(curve):
+    """Linear gain of every band of a BandGainCurve, with later settings winning as in the engine."""
+    gains = [1.0] * len(curve.edges)
+    for band_index, (value, _) in curve.settings:
+        gains[band_index] = float(value)
+    return tuple(gains)
+
+
+def filter_bank_sos(fs, curve):
+    """SOS array of a gain curve's bands at `fs`, or None when there are no bands to filter."""
+    if not isinstance(curve, BandGainCurve) or not curve.edges:
+        return None
+    edges = tuple((float(lo), float(hi)) for lo, hi in curve.edges)
+    return design_filter_bank(float(fs), edges, band_gains(curve))
+
+
+@lru_cache(maxsize=64)
+def design_filter_bank(fs, edges, gains):
+    """
+    One second-order section per band, cached per (fs, band table, gains).
+
+    Bands that are empty or above Nyquist get an identity section, so the
+    section count (and with it the filter state) never depends on the gains.
+    """
+    return np.array([band_section(fs, lo, hi, gain) for (lo, hi), gain in zip(edges, gains)])
+
+
+def band_section(fs, lo, hi, gain):
+    nyquist = fs / 2
+    if gain == 1 or hi <= lo or lo >= nyquist:
+        return IDENTITY_SECTION
+    A = 10 ** (max(20 * np.log10(max(gain, 1e-12)), MIN_GAIN_DB) / 40)
+    low_shelf = lo <= 0
+    high_shelf = hi >= HIGH_SHELF_FRACTION * nyquist
+    if low_shelf and high_shelf:
+        return (A * A, 0.0, 0.0, 1.0, 0.0, 0.0)
+    if low_shelf or high_shelf:
+        w0 = 2 * np.pi * (hi if low_shelf else lo) / fs
+        cos, alpha = np.cos(w0), np.sin(w0) / np.sqrt(2)
+        root = 2 * np.sqrt(A) * alpha
+        if low_shelf:
+            b = (A * ((A + 1) - (A - 1) * cos + root), 2 * A * ((A - 1) - (A + 1) * cos),
+                 A * ((A + 1) - (A - 1) * cos - root))
+            a = ((A + 1) + (A - 1) * cos + root, -2 * ((A - 1) + (A + 1) * cos), (A + 1) + (A - 1) * cos - root)
+        else:
+            b = (A * ((A + 1) + (A - 1) * cos + root), -2 * A * ((A - 1) + (A + 1) * cos),
+                 A * ((A + 1) + (A - 1) * cos - root))
+            a = ((A + 1) - (A - 1) * cos + root, 2 * ((A - 1) - (A + 1) * cos), (A + 1) - (A - 1) * cos - root)
+    else:
+        center = np.sqrt(lo * hi)
+        w0 = 2 * np.pi * center / fs
+        octaves = np.log2(hi / lo)
+        cos = np.cos(w0)
+        alpha = np.sin(w0) * np.sinh(np.log(2) / 2 * octaves * w0 / np.sin(w0))
+        b = (1 + alpha * A, -2 * cos, 1 - alpha * A)
+        a = (1 + alpha / A, -2 * cos, 1 - alpha / A)
+    return tuple(float(value / a[0]) for value in b + a)
+
+
+class IirEqualizer:
+    """
+    Streaming filter bank with the interface of streaming.StftEqualizer.
+
+    Blocks are mono or (channels, samples); the output of `process` is as
+    long as its input, so `flush` has nothing left to return. Replacing the
+    gain curve keeps the filter state, which avoids restarting the filters
+    mid-stream.
+    """
+    hop = BLOCK_LENGTH
+
+    def __init__(self, fs, gain_curve):
+        self.fs = fs
+        self.sos = filter_bank_sos(fs, gain_curve)
+        self.reset()
+
+    def reset(self):
+        self._state = None
+
+    def set_gain_curve(self, gain_curve):
+        sos = filter_bank_sos(self.fs, gain_curve)
+        if sos is None or self.sos is None or sos.shape != self.sos.shape:
+            self._state = None
+        self.sos = sos
+
+    def process(self, block):
+        if self.sos is None:
+            return np.array(block, dtype=np.float64)
+        if self._state is None:
+            self._state = np.zeros((len(self.sos),) + block.shape[:-1] + (2,))
+        output, self._state = sosfilt(self.sos, block, axis=-1, zi=self._state)
+        return output
+
+    def flush(self):
+        shape = () if self._state is None else self._state.shape[1:-1]
+        return np.zeros(shape + (0,))
+
+
+def equalize_blocks(blocks, fs, gain_curve):
+    """Filter a stream of mono or (channels, samples) blocks, yielding one output block per input block."""
+    equalizer = IirEqualizer(fs, gain_curve)
+    for block in blocks:
+        yield equalizer.process(block)
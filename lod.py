@@ -0,0 +1,145 @@
+"""
+Min/max level-of-detail rendering for long time-domain signals.
+
+`MinMaxPyramid` keeps the minimum and maximum of every block of 64, 256,
+1024, ... samples. A view only ever needs about two points per horizontal
+pixel, so `envelope` answers a visible sample range with the coarsest level
+that still resolves it; alternating min/max points keep every peak on screen.
+Zoomed in below the finest prebuilt block, the visible slice is decimated
+straight from the samples, which is cheap because it is short.
+"""
+import numpy as np
+import pyqtgraph as pg
+
+BASE_BLOCK = 64
+FACTOR = 4
+# Coarsest level still has at least this many blocks
+MIN_LEVEL_BLOCKS = 1024
+
+
+def _reduce(values, factor, reducer):
+    full = len(values) // factor * factor
+    out = reducer(values[:full].reshape(-1, factor), axis=1)
+    if full < len(values):
+        out = np.append(out, reducer(values[full:]))
+    return out
+
+
+class MinMaxPyramid:
+    def __init__(self, samples, base_block=BASE_BLOCK, factor=FACTOR):
+        self.samples = samples
+        # Set when `samples` is held (and counted) elsewhere, e.g. by the cached reconstruction that owns this entry
+        self.shared = False
+        self.blocks = []
+        self.mins = []
+        self.maxs = []
+        block, mins, maxs = base_block, samples, samples
+        factor_step = base_block
+        while len(samples) // block >= MIN_LEVEL_BLOCKS:
+            mins = _reduce(mins, factor_step, np.min)
+            maxs = _reduce(maxs, factor_step, np.max)
+            self.blocks.append(block)
+            self.mins.append(mins)
+            self.maxs.append(maxs)
+            block *= factor
+            factor_step = factor
+
+    def __len__(self):
+        return len(self.samples)
+
+    @property
+    def nbytes(self):
+        levels = sum(level.nbytes for level in self.mins + self.maxs)
+        return levels if self.shared else levels + self.samples.nbytes
+
+    def envelope(self, start, stop, max_points):
+        """
+        Indices and values to draw samples [start, stop) with about `max_points` points.
+
+        Returns (indices, values); each block contributes its min then its max
+        at the index of its first sample.
+        """
+        start = max(int(start), 0)
+        stop = min(int(stop), len(self.samples))
+        count = stop - start
+        if count <= max_points:
+            return np.arange(start, max(stop, start)), self.samples[start:stop]
+        needed = count // max(max_points // 2, 1)
+        level = None
+        for index, block in enumerate(self.blocks):
+            if block <= needed:
+                level = index
+        if level is None:
+            # Finer than the prebuilt levels: decimate just the visible slice
+            block = needed
+            mins = _reduce(self.samples[start:stop], block, np.min)
+            maxs = _reduce(self.samples[start:stop], block, np.max)
+            first = start
+        else:
+            block = self.blocks[level]
+            first_block = start // block
+            last_block = -(-stop // block)
+            mins = self.mins[level][first_block:last_block]
+            maxs = self.maxs[level][first_block:last_block]
+            first = first_block * block
+            # Levels are FACTOR apart; merge the remaining factor on the (short) visible slice
+            merge = needed // block
+            if merge > 1:
+                mins = _reduce(mins, merge, np.min)
+                maxs = _reduce(maxs, merge, np.max)
+                block *= merge
+        indices = np.repeat(first + np.arange(len(mins)) * block, 2)
+        values = np.empty(2 * len(mins), dtype=mins.dtype)
+        values[0::2] = mins
+        values[1::2] = maxs
+        return indices, values
+
+
+class LodCurve:
+    """
+    A curve in a PlotWidget that redraws its signal through a MinMaxPyramid
+    whenever the visible x range or the widget size changes.
+    """
+
+    def __init__(self, widget, pen):
+        self.widget = widget
+        self.curve = pg.PlotDataItem(pen=pen)
+        self.time = None
+        self.pyramid = None
+        self._refreshing = False
+        viewBox = widget.getPlotItem().getViewBox()
+        viewBox.sigXRangeChanged.connect(self.refresh)
+        viewBox.sigResized.connect(self.refresh)
+
+    def setData(self, t, signal, pyramid=None):
+        """Draw `signal` over `t`, reusing a `pyramid` already built for it when given."""
+        self.time = np.asarray(t)
+        self.pyramid = pyramid if pyramid is not None else MinMaxPyramid(np.asarray(signal))
+        # PlotWidget.clear() drops the item along with everything else
+        if self.curve not in self.widget.getPlotItem().items:
+            self.widget.addItem(self.curve)
+        self.refresh()
+
+    def clear(self):
+        self.time = None
+        self.pyramid = None
+        self.curve.clear()
+
+    def refresh(self, *args):
+        if self.pyramid is None or self._refreshing or not len(self.pyramid):
+            return
+        viewBox = self.widget.getPlotItem().getViewBox()
+        # While auto-ranging the view follows the data, so draw all of it
+        if viewBox.autoRangeEnabled()[0]:
+            start, stop = 0, len(self.pyramid)
+        else:
+            x_min, x_max = viewBox.viewRange()[0]
+            start = max(np.searchsorted(self.time, x_min, side="right") - 1, 0)
+            stop = np.searchsorted(self.time, x_max, side="left") + 1
+        max_points = 2 * max(int(viewBox.width()), 100)
+        indices, values = self.pyramid.envelope(start, stop, max_points)
+        self._refreshing = True
+        try:
+            self.curve.setData(self.time[indices], values)
+        finally:
+            self._refreshing = False
@@ -3,23 +3,73 @@ import sys
 import os
 import warnings
 
-import librosa
 from os import path
 import numpy as np
-import pandas as pd
-from PyQt5 import QtWidgets, QtGui, QtMultimedia
-from PyQt5.QtMultimedia import QMediaContent, QMediaPlayer  # Updated line
+from PyQt5 import QtWidgets, QtGui
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
-from PyQt5.uic import loadUiType
-import soundfile as sf
 from PyQt5.QtGui import QIcon,QFont
-from IPython.display import Audio
 import pyqtgraph as pg
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
-FORM_CLASS, _ = loadUiType(path.join(path.dirname(__file__), "design.ui"))
+from batch import save_preset
+from engine import (ANIMAL_MODE, ECG_MODE, ECG_NORMAL_LENGTH, MUSIC_MODE, EqualizerEngine, channel_view,
+                    make_window, mode_frequency_ranges)
+from export import BLOCK_SIZE, EXPORT_FORMATS
+from fft_backend import set_backend
+from frame_clock import FrameClock
+from holter import HolterRecord
+from lod import LodCurve
+from playback import EqualizedPlayer
+from profiler import Profiler, profiled
+from profiler_panel import ProfilerPanel
+from signal_cache import ReconstructionCache, SignalCache
+from spectrogram import SpectrogramView
+from streaming import equalize_blocks
+from workers import AudioExporter, FileLoader, RecomputeScheduler, SpectrogramWorker
+
+UI_FILE = path.join(path.dirname(__file__), "design.ui")
+
+
+def loadFormClass():
+    # design_ui.py is generated with `pyuic5 design.ui -o design_ui.py`; rerun it after
+    # editing design.ui, or set EQUALIZER_LOAD_UI=1 to parse design.ui at startup
+    if os.environ.get("EQUALIZER_LOAD_UI", "0") != "1":
+        try:
+            from design_ui import Ui_MainWindow
+            return Ui_MainWindow
+        except ImportError:
+            pass
+    from PyQt5.uic import loadUiType
+    return loadUiType(UI_FILE)[0]
+
+
+FORM_CLASS = loadFormClass()
+
+# Memory the engine may spend on per-band time-domain bases (0 keeps the IFFT path)
+BASIS_BUDGET_MB = float(os.environ.get("EQUALIZER_BASIS_BUDGET_MB", 0))
+# Working precision of spectra and outputs; "float32" halves their memory
+PRECISION = os.environ.get("EQUALIZER_PRECISION", "float64")
+AUDIO_EXTENSIONS = ('.wav', '.mp3', '.m4a', '.wma', '.mpeg', '.ogg', '.flac')
+# Seconds of audio decoded first and drawn while the loader decodes and analyses the rest
+PREVIEW_SECONDS = 10
+# Memory for decoded signals and spectra kept across list selections
+SIGNAL_CACHE_MB = float(os.environ.get("EQUALIZER_SIGNAL_CACHE_MB", 512))
+# Memory for equalized outputs (with their LOD pyramids) kept per gain setting
+RECONSTRUCTION_CACHE_MB = float(os.environ.get("EQUALIZER_RECONSTRUCTION_CACHE_MB", 256))
+# Speed slider steps per 1x playback rate (the slider runs from 0.1x to 10x)
+SPEED_SLIDER_SCALE = 10
+# Pause after panning or zooming a Holter record before the window under the view is equalized
+HOLTER_VIEW_DELAY_MS = 150
+# Pause in a slider drag after which the decimated preview is replaced by the full output
+PREVIEW_IDLE_MS = 300
+# Live playback equalizer: "stft" (overlap-add, matches the plots) or "iir" (biquad bank, no added latency)
+PLAYBACK_ENGINE = os.environ.get("EQUALIZER_PLAYBACK_ENGINE", "stft")
+# FFT implementation: "numpy", "scipy" (multithreaded) or "pyfftw" (needs pyFFTW), see fft_backend.py
+FFT_BACKEND = os.environ.get("EQUALIZER_FFT_BACKEND", "numpy")
+# Threads per transform for the scipy and pyfftw backends (0 uses every core)
+FFT_WORKERS = int(os.environ.get("EQUALIZER_FFT_WORKERS", 0))
+# tracemalloc-based allocation sizes in the performance stats (slows every allocation)
+PROFILE_ALLOCATIONS = os.environ.get("EQUALIZER_PROFILE_ALLOCATIONS", "0") == "1"
 
 class MainApp(QMainWindow, FORM_CLASS):
     def __init__(self, parent=None):
@@ -84,26 +134,39 @@ class MainApp(QMainWindow, FORM_CLASS):
         # Initialize and configure plotting widgets
         self.originalSignalWidget = pg.PlotWidget()
         self.outputSignalWidget = pg.PlotWidget()
-        self.originalSpectrogramWidget = pg.PlotWidget()
-        self.outputSpectrogramWidget = pg.PlotWidget()
+        self.originalSpectrogramWidget = SpectrogramView()
+        self.outputSpectrogramWidget = SpectrogramView()
         self.frequencyWidget = pg.PlotWidget()
         self.smoothedSignalWidget = pg.PlotWidget()
 
+        # Long signals are drawn through a min/max pyramid at about two points per pixel
+        self.originalCurve = LodCurve(self.originalSignalWidget, pen='g')
+        self.outputCurve = LodCurve(self.outputSignalWidget, pen='y')
+        self.setupPlotItems()
+
         self.originalSignalLayout.addWidget(self.originalSignalWidget)
         self.outputSignalLayout.addWidget(self.outputSignalWidget)
         self.frequencyLayout.addWidget(self.frequencyWidget)
         self.smoothingLayout.addWidget(self.smoothedSignalWidget)
+        # Replace the designer placeholders; the views are reused for every file
+        self.clearLayout(self.originalSpectrogramLayout)
+        self.clearLayout(self.outputSpectrogramLayout)
+        self.originalSpectrogramLayout.addWidget(self.originalSpectrogramWidget)
+        self.outputSpectrogramLayout.addWidget(self.outputSpectrogramWidget)
+        self.toggleSpectrogramVisibility(self.spectrogramRadioButton.isChecked())
 
         ##################### Sliders ##################
         self.speedSlider = self.findChild(QSlider, "speedSlider")
         self.speedLCD = self.findChild(QLCDNumber, "speedLCD")
-        self.speedSlider.valueChanged.connect(lambda: self.speedLCD.display(self.speedSlider.value()))
+        self.speedSlider.valueChanged.connect(self.updatePlaybackRate)
         self.speedSlider.setMinimum(1)
-        self.speedSlider.setMaximum(100)
+        self.speedSlider.setMaximum(10 * SPEED_SLIDER_SCALE)
         self.speedSlider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.speedSlider.setTickInterval(1)
         self.speedSlider.setStyleSheet(self.slidersStyleHorizontal1)
         self.speedSlider.setStyleSheet(self.slidersStyleHorizontal2)
+        self.speedSlider.setValue(SPEED_SLIDER_SCALE)
+        self.updatePlaybackRate(self.speedSlider.value())
 
         self.meanSlider.valueChanged.connect(lambda: self.meanLCD.display(self.meanSlider.value()))
         self.meanSlider.valueChanged.connect(self.updateGaussianWindow)
@@ -122,9 +185,6 @@ class MainApp(QMainWindow, FORM_CLASS):
         self.standardDeviationSlider.valueChanged.connect(self.updateGaussianWindow)
         self.standardDeviationSlider.valueChanged.connect(lambda: self.standardDeviationLCD.display(self.standardDeviationSlider.value() / 10.0))
 
-        self.originalTimer=QTimer(self)
-        self.originalTimer.start(1000)
-        self.originalTimer.timeout.connect(self.originalMediaProgress)
         self.originalProgressSlider.setStyleSheet(self.slidersStyleHorizontal1)
         self.originalProgressSlider.setStyleSheet(self.slidersStyleHorizontal2)
 
@@ -138,7 +198,53 @@ class MainApp(QMainWindow, FORM_CLASS):
         self.playing = False
         self.originalSoundOn = True
         self.outputSoundOn = True
-        self.fft_result = None
+        try:
+            set_backend(FFT_BACKEND, FFT_WORKERS or None)
+        except (ImportError, ValueError) as e:
+            self.statusBar().showMessage(f"FFT backend {FFT_BACKEND} unavailable, using numpy: {e}", 10000)
+        self.engine = EqualizerEngine(basis_budget=int(BASIS_BUDGET_MB * 2**20), dtype=PRECISION)
+        self.profiler = Profiler(track_allocations=PROFILE_ALLOCATIONS)
+        self.profilerPanel = None
+        self.signalCache = SignalCache(int(SIGNAL_CACHE_MB * 2**20))
+        self.profiler.add_counters("signal_cache", self.signalCache.stats)
+        self.reconstructionCache = ReconstructionCache(int(RECONSTRUCTION_CACHE_MB * 2**20))
+        self.profiler.add_counters("reconstruction_cache", self.reconstructionCache.stats)
+        self.reconstructionKey = None
+        self.recomputeScheduler = RecomputeScheduler(self.engine, self, self.profiler, self.reconstructionCache)
+        self.recomputeScheduler.resultReady.connect(self.displayRecomputedSignal)
+        self.recomputeScheduler.previewReady.connect(self.displayPreviewSignal)
+        # Dragging a slider shows a decimated preview (see EqualizerEngine.reconstruct_proxy)
+        self.refineTimer = QTimer(self)
+        self.refineTimer.setSingleShot(True)
+        self.refineTimer.setInterval(PREVIEW_IDLE_MS)
+        self.refineTimer.timeout.connect(self.refineOutput)
+        self.spectrogramWorker = SpectrogramWorker(self, self.profiler)
+        self.spectrogramWorker.ready.connect(self.showSpectrograms)
+        self.fileLoader = FileLoader(self.signalCache, self, self.profiler, dtype=PRECISION,
+                                     preview_seconds=PREVIEW_SECONDS)
+        self.fileLoader.previewed.connect(self.plotSignalPreview)
+        self.fileLoader.loaded.connect(self.onSignalLoaded)
+        self.fileLoader.failed.connect(self.onSignalFailed)
+        self.loadProgressBar = QProgressBar()
+        self.loadProgressBar.setMaximumWidth(200)
+        self.loadProgressBar.hide()
+        self.statusBar().addPermanentWidget(self.loadProgressBar)
+        self.audioExporter = AudioExporter(self, self.profiler)
+        self.audioExporter.finished.connect(self.onExportFinished)
+        self.audioExporter.failed.connect(self.onExportFailed)
+        self.exportProgressBar = QProgressBar()
+        self.exportProgressBar.setMaximumWidth(200)
+        self.exportProgressBar.setFormat("Exporting %p%")
+        self.exportProgressBar.hide()
+        self.cancelExportButton = QPushButton("Cancel Export")
+        self.cancelExportButton.hide()
+        self.cancelExportButton.clicked.connect(self.cancelExport)
+        self.statusBar().addPermanentWidget(self.exportProgressBar)
+        self.statusBar().addPermanentWidget(self.cancelExportButton)
+        self.audioExporter.progress.connect(self.exportProgressBar.setValue)
+        self.exportMode = None
+        self.fileLoader.progress.connect(self.loadProgressBar.setValue)
+        self.cacheKey = None
         self.playheadPosition = 0
         self.elapsedTime = 0
         self.originalSignalDuration = 0
@@ -148,13 +254,8 @@ class MainApp(QMainWindow, FORM_CLASS):
         self.ecgSignals = []
         self.currentVolume = 50
 
-        self.Normal =3341
-        self.instrumentsFrequencyRanges = [
-            [0, 1000], # Guitar
-            [1000, 2000], # Drums
-            [2000, 3000], # Trumpet
-            [4000, 5000] # Piano
-            ]
+        self.Normal = ECG_NORMAL_LENGTH
+        self.instrumentsFrequencyRanges = mode_frequency_ranges(MUSIC_MODE, 0)
 
         # self.animalsFrequencyRanges  = [
         #     [80, 800], # Bengal Tiger
@@ -163,31 +264,29 @@ class MainApp(QMainWindow, FORM_CLASS):
         #     [2000, 3000] # Sea Lion
         #     ]
 
-        self.animalsFrequencyRanges  = [
-            [600, 800], # Bengal Tiger
-            [3800, 7000], # Elephant
-            [1000, 6000], # Lamb
-            [0, 3000] # Sea Lion
-            ]
-
-        self.ecgFrequencyRanges  = [
-            [0, 12],
-            [0, 0],
-            [38, 96],
-            ]
+        self.animalsFrequencyRanges = mode_frequency_ranges(ANIMAL_MODE, 0)
+
+        self.ecgFrequencyRanges = mode_frequency_ranges(ECG_MODE, 0)
         self.mediaDuration = 0
         self.mediaPausePosition = 0
-        self.playheadLineOriginal=0
-        self.playheadLineOutput=0
         self.file_index_music = 1
         self.file_index_animal = 1
         self.ecgSignal = r"C:\Users\hazem\Downloads\AudioAlchemy-Equalizer-main"
 
-        self.playheadUpdateTimer = QTimer(self)  # bta3 elplayhead fluniform
-        self.playheadUpdateInterval = 100
-
-        self.originalTimer = QTimer(self)  # bta3 elprogress bar flaudio
-        self.originalTimer.start(100)
+        # Playhead lines, progress slider and time labels advance together, once per display frame
+        self.frameClock = FrameClock(self)
+        self.frameClock.frame.connect(self.renderFrame)
+        self.progressLabelSeconds = None
+
+        # Multi-hour ECG records are equalized one analysis window at a time (see holter.py)
+        self.holterRecord = None
+        self.holterWindow = None
+        self.analysisKey = None
+        self.holterViewTimer = QTimer(self)
+        self.holterViewTimer.setSingleShot(True)
+        self.holterViewTimer.setInterval(HOLTER_VIEW_DELAY_MS)
+        self.holterViewTimer.timeout.connect(self.followHolterView)
+        self.originalSignalWidget.getPlotItem().getViewBox().sigXRangeChanged.connect(self.holterViewChanged)
 
         self.menu_actions = {
             self.actionOpenUniformSignal: self.open_signal,
@@ -263,24 +362,23 @@ class MainApp(QMainWindow, FORM_CLASS):
         self.muteOriginalButton.clicked.connect(self.toggleMuteOriginal)
         self.spectrogramRadioButton.toggled.connect(self.toggleSpectrogramVisibility)
         self.modeComboBox.currentIndexChanged.connect(self.modeChanged)
+        self.channelComboBox.currentIndexChanged.connect(self.channelChanged)
         self.smootherComboBox.currentIndexChanged.connect(lambda index: self.initiate_wave(index))
         self.changeWindowButton.clicked.connect(lambda _: self.tabWidget.setCurrentIndex(1))
         self.confirmButton.pressed.connect(self.converted)
-        self.speedSlider.valueChanged.connect(lambda: self.updatePlayheadSpeed(self.speedSlider.value()))
         self.replayButton.clicked.connect(self.replayToggle)
-        self.mediaPlayer = QtMultimedia.QMediaPlayer()
+        self.mediaPlayer = EqualizedPlayer(self, engine=PLAYBACK_ENGINE)
         self.mediaPlayer.setVolume(self.currentVolume)
         self.mediaPlayer.pause()
-        self.mediaPlayer.positionChanged.connect(self.updatePlayheadPosition)
-        self.originalProgressSlider.sliderMoved[int].connect(lambda: self.mediaPlayer.setPosition(self.originalProgressSlider.value()))
+        self.mediaPlayer.stateChanged.connect(self.updateFrameClock)
+        self.originalProgressSlider.sliderMoved[int].connect(self.seekMedia)
         self.originalVolumeSpinBox.valueChanged[int].connect(lambda: self.originalVolumeChange())
-        self.originalProgressSlider.valueChanged[int].connect(self.updatePlayheadPosition)
         self.stopButton.clicked.connect(self.stopMedia)
         self.audioListWidget.itemSelectionChanged.connect(self.plotSelectedSignal)
         self.deleteButton.clicked.connect(self.deleteSelectedItem)
-        self.playheadUpdateTimer.timeout.connect(self.updatePlayheadPosition)
-        self.originalTimer.timeout.connect(self.originalMediaProgress)
-        self.constructAudioButton.clicked.connect(lambda: self.new_song_save(self.fs, self.reconstructed_signal))
+        self.actionProfilerStats.triggered.connect(self.showProfilerPanel)
+        self.actionSavePreset.triggered.connect(self.savePreset)
+        self.constructAudioButton.clicked.connect(self.new_song_save)
         ############## Buttons and checkboxes connections ##############
 
     # Get the current working directory
@@ -317,16 +415,7 @@ class MainApp(QMainWindow, FORM_CLASS):
 
     def playMedia(self):
         try:
-            self.currentSelection = self.audioListWidget.currentRow()
-            self.mode = self.modeComboBox.currentText()
-
-            if self.mode == "Animal Sounds Mode":
-                self.currentSound = self.animalSounds[self.currentSelection]
-            elif self.mode == "Musical Instruments Mode":
-                self.currentSound = self.musicTracks[self.currentSelection]
-
             if self.originalProgressSlider.value() == 0:
-                self.setMediaContent()
                 self.originalMediaProgress()
 
             if self.stopButton.isEnabled():
@@ -337,10 +426,6 @@ class MainApp(QMainWindow, FORM_CLASS):
         except Exception as e:
             print(f"Play media error: {e}")
 
-    def setMediaContent(self):
-        mediaURL = QMediaContent(QUrl.fromLocalFile(self.currentSound))
-        self.mediaPlayer.setMedia(mediaURL)
-
     def startMedia(self):
         self.mediaPlayer.setPosition(self.originalProgressSlider.value())
         self.mediaPlayer.play()
@@ -353,8 +438,7 @@ class MainApp(QMainWindow, FORM_CLASS):
     def toggleMediaControls(self, playing):
         self.stopButton.setEnabled(playing)
         self.playPauseButton.setIcon(self.pauseIcon if playing else self.playIcon)
-        self.playheadUpdateTimer.start(self.playheadUpdateInterval)
-        self.originalTimer.start(self.playheadUpdateInterval)
+        self.updateFrameClock()
 
     def setupSliders(self, num_sliders=10):
         self.sliders = []
@@ -377,55 +461,59 @@ class MainApp(QMainWindow, FORM_CLASS):
 
             slider.setTickPosition(QSlider.TickPosition.TicksRight)
             slider.setTickInterval(1)
+            slider.valueChanged.connect(lambda value, idx=i: self.sliderValueChanged(idx, value))
+            slider.valueChanged.connect(lambda value, lcd=lcd: lcd.display(value))
+            slider.sliderReleased.connect(self.refineOutput)
             self.sliders.append(slider)
             self.lcds.append(lcd)
             self.labels.append(label)
 
-    def slider_mode(self):
-        self.mode = self.modeComboBox.currentText()
-        mode_params = self.mode_parameters.get(self.mode, {})  # Get mode-specific parameters
-        selected_item = self.audioListWidget.currentItem()
-        # print(selected_item)
-        # for i in range(self.ecgSignals) :
-        #     if self.ecgSignals[i] == self.Normal_csv_path:
-        #         print("hazem")
-        #         self.ecgFrequencyRanges[0] = [0, 0]
-        #         break
-        #     else:
-        #         self.ecgFrequencyRanges[0] = [0, 12]
-
-        num_sliders = mode_params.get("sliders", 0)
-        for index, (slider, lcd, label) in enumerate(
-                zip(self.sliders[:num_sliders], self.lcds[:num_sliders], self.labels[:num_sliders])):
-            slider.valueChanged.connect(lambda value, idx=index: self.sliderValueChanged(idx, value))
-            slider.valueChanged.connect(lambda value, lcd=lcd: lcd.display(value))
-
     def sliderValueChanged(self, slider_idx, value):  # refactor tmam
-        mode_params = self.mode_parameters.get(self.modeComboBox.currentText(), {})
-        frequency_ranges = mode_params.get("frequency_ranges", None)
+        if not self.engine.loaded or slider_idx >= len(self.engine.bands):
+            return
 
-        if frequency_ranges:
-            min_frequency, max_frequency = frequency_ranges[slider_idx]
-            min_idx = np.argmin(np.abs(self.frequencies - min_frequency))
-            max_idx = np.argmin(np.abs(self.frequencies - max_frequency))
-        else:
-            frequency_step = (len(self.frequencies) / 2) // 10
-            min_frequency = slider_idx * frequency_step
-            max_frequency = ((slider_idx + 1) * frequency_step) + 2 if slider_idx == 9 else (
-                                                                                                    slider_idx + 1) * frequency_step
-            min_idx = int(min_frequency)
-            max_idx = int(max_frequency)
-
-        self.freqRangeSmoothing = self.frequencies[min_idx:max_idx]
+        self.profiler.action("slider")
+        self.freqRangeSmoothing = self.engine.band_frequencies(slider_idx)
         self.initiate_wave(self.smootherComboBox.currentIndex())
-        self.slider_changes[min_idx:max_idx] = value * self.smoothing_window
-        self.new_magnitudes = self.fft_magnitudes * self.slider_changes
+        if self.sliders[slider_idx].isSliderDown():
+            self.recomputeScheduler.setInteractive(True)
+            self.refineTimer.start()
+        self.recomputeScheduler.submit(slider_idx, value, self.windowSpec())
+        self.mediaPlayer.setGainCurve(self.recomputeScheduler.gainCurve())
+
+    def refineOutput(self):
+        self.refineTimer.stop()
+        self.recomputeScheduler.setInteractive(False)
+
+    def displayRecomputedSignal(self, generation, gains, reconstructed_signal, key):
+        # A newer slider event is already queued; its result will follow
+        if generation != self.recomputeScheduler.generation:
+            return
+
+        self.plotEqualizedSpectrum(gains)
+        self.reconstructSignalFromFFT(reconstructed_signal, key)
+
+    def displayPreviewSignal(self, generation, gains, proxy, factor):
+        if generation != self.recomputeScheduler.generation:
+            return
+
+        self.plotEqualizedSpectrum(gains)
+        # Drawn in place of the output until the full reconstruction replaces it
+        proxy = channel_view(proxy, self.viewChannel())
+        self.outputCurve.setData(self.timeVector[::factor][:len(proxy)], proxy)
+        view = self.outputSpectrogramWidget
+        if view.data is not None and self.spectrogramRadioButton.isChecked():
+            view.setGains(self.recomputeScheduler.gainCurve()(view.data.frequencies))
+
+    def plotEqualizedSpectrum(self, gains):
+        np.multiply(self.fft_magnitudes, gains, out=self.new_magnitudes)
         self.plotFrequencyDomain(self.frequencies, self.new_magnitudes)
         if self.smootherComboBox.currentIndex() != 0:  # gded
-            self.frequencyWidget.plot(self.freqRangeSmoothing, self.smoothing_window * max(self.new_magnitudes),
-                                      pen='r')  # gded
+            self.smoothingOverlay.setData(self.freqRangeSmoothing, self.smoothing_window * max(self.new_magnitudes))
             if self.smoothing_list[-1] != self.smoothing_list[len(self.smoothing_list) - 2]:
                 self.smootherComboBox.setCurrentIndex(0)
+        else:
+            self.smoothingOverlay.clear()
 
 
     def playPauseToggling(self):
@@ -438,15 +526,14 @@ class MainApp(QMainWindow, FORM_CLASS):
     def playSignal(self):
         self.playing = not self.playing
 
-        if self.playing or (self.mediaPlayer.state() == QMediaPlayer.PlayingState):
+        if self.playing or (self.mediaPlayer.isPlaying()):
             self.playPauseButton.setIcon(self.pauseIcon)
             self.stopButton.setEnabled(1)
-            self.playheadUpdateTimer.start(self.playheadUpdateInterval)
-            self.originalTimer.start(self.playheadUpdateInterval)
 
         else:
             self.stopButton.setEnabled(0)
             self.playPauseButton.setIcon(self.playIcon)
+        self.updateFrameClock()
 
     def stopMedia(self):
         if self.stopButton.isEnabled():
@@ -459,60 +546,84 @@ class MainApp(QMainWindow, FORM_CLASS):
             self.playPauseButton.setIcon(self.playIcon)
             self.stopButton.setEnabled(0)
             self.originalProgressSlider.setValue(0)
-            self.playheadLineOriginal.setValue(0)
-            self.playheadLineOutput.setValue(0)
+            self.elapsedTime = 0
+            self.setPlayhead(0)
+            self.progressLabelSeconds = None
             self.originalStartLabel.setText(f"0:00 /")
             self.originalEndLabel.setText(f"0:00")
+            self.updateFrameClock()
 
     def replayToggle(self):
         self.elapsedTime = 0
         mode = self.modeComboBox.currentText()
         if mode=="Uniform Range Mode" or mode=="ECG Abnormalities Mode":
             # Reset the playhead position to the beginning
-            self.playheadLineOriginal.setPos(self.elapsedTime)
-            self.playheadLineOutput.setPos(self.elapsedTime)
+            self.setPlayhead(self.elapsedTime)
         elif mode == "Animal Sounds Mode" or mode == "Musical Instruments Mode":
             self.mediaPlayer.stop()
             self.stopButton.setEnabled(1)
+            self.progressLabelSeconds = None
             self.originalStartLabel.setText(f"0:00 /")
             self.originalEndLabel.setText(f"{self.mediaDuration}")
             self.originalProgressSlider.setValue(0)
             self.mediaPlayer.play()
 
-    def updatePlayheadSpeed(self, speed):
-        self.playheadUpdateInterval = speed
-        # Update the playhead update interval for the QTimer
-        self.playheadUpdateTimer.setInterval(self.playheadUpdateInterval)
-        self.originalTimer.setInterval(self.playheadUpdateInterval)
+    def updatePlaybackRate(self, value):
+        # Speed scales how fast the playhead of Uniform/ECG signals advances, not how often it is drawn
+        self.playbackRate = value / SPEED_SLIDER_SCALE
+        self.speedLCD.display(self.playbackRate)
 
-    def updatePlayheadPosition(self):
-        if self.playing or (self.mediaPlayer.state() == QMediaPlayer.PlayingState):
-            # Update the elapsed time based on the playhead update interval
-            mode = self.modeComboBox.currentText()
-            if mode == "Uniform Range Mode" or mode=="ECG Abnormalities Mode":
-                self.elapsedTime += self.playheadUpdateInterval / 1000.0  # Convert milliseconds to seconds
-            else:
-                self.elapsedTime = self.originalProgressSlider.value() / 1000.0
+    def updateFrameClock(self, *_):
+        if self.playing or self.mediaPlayer.isPlaying():
+            self.frameClock.start()
+        else:
+            self.frameClock.stop()
 
+    def renderFrame(self, elapsed):
+        # Everything that follows playback is updated here, so the plots repaint once per frame
+        mode = self.modeComboBox.currentText()
+        if mode == "Uniform Range Mode" or mode == "ECG Abnormalities Mode":
+            if not self.playing:
+                self.frameClock.stop()
+                return
+            self.elapsedTime += elapsed * self.playbackRate
             if self.elapsedTime > self.originalSignalDuration:
                 self.elapsedTime = self.originalSignalDuration
                 self.playing = False  # Stop playing when the end is reached
                 self.playPauseButton.setIcon(self.playIcon)
-
-            # Update the position of the playhead line directly
-            self.playheadLineOriginal.setPos(self.elapsedTime)
-            self.playheadLineOutput.setPos(self.elapsedTime)
+                self.frameClock.stop()
+        else:
+            if not self.mediaPlayer.isPlaying():
+                self.frameClock.stop()
+                return
+            # Audio follows the output device's clock
+            self.originalMediaProgress()
+            self.elapsedTime = self.originalProgressSlider.value() / 1000.0
+        self.setPlayhead(self.elapsedTime)
+
+    def setPlayhead(self, seconds):
+        self.playheadLineOriginal.setPos(seconds)
+        self.playheadLineOutput.setPos(seconds)
+
+    def seekMedia(self, position):
+        self.mediaPlayer.setPosition(position)
+        self.elapsedTime = position / 1000.0
+        self.setPlayhead(self.elapsedTime)
 
     def originalMediaProgress(self):
-        if self.mediaPlayer.state()==QMediaPlayer.PlayingState:
-            self.originalProgressSlider.setMinimum(0)
-            self.originalProgressSlider.setMaximum(self.mediaPlayer.duration())
-            sliderValue=self.mediaPlayer.position()
-            self.originalProgressSlider.setValue(sliderValue)
-            self.currentTime=time.strftime('%M:%S',time.localtime(self.mediaPlayer.position()/1000))
-            self.mediaDuration=time.strftime('%M:%S',time.localtime(self.mediaPlayer.duration()/1000))
-            self.originalStartLabel.setText(f"{self.currentTime}")
-            self.originalEndLabel.setText(f"{self.mediaDuration}")
+        if self.mediaPlayer.isPlaying():
+            position = self.mediaPlayer.position()
+            duration = self.mediaPlayer.duration()
+            if self.originalProgressSlider.maximum() != duration:
+                self.originalProgressSlider.setRange(0, duration)
+            self.originalProgressSlider.setValue(position)
+            # The labels show whole seconds, so they are only reformatted when a second has passed
+            if self.progressLabelSeconds != (position // 1000, duration // 1000):
+                self.progressLabelSeconds = (position // 1000, duration // 1000)
+                self.currentTime=time.strftime('%M:%S',time.localtime(position/1000))
+                self.mediaDuration=time.strftime('%M:%S',time.localtime(duration/1000))
+                self.originalStartLabel.setText(f"{self.currentTime}")
+                self.originalEndLabel.setText(f"{self.mediaDuration}")
 
     def originalVolumeChange(self):
         try:
@@ -543,6 +654,8 @@ class MainApp(QMainWindow, FORM_CLASS):
         data_list, *buttons = data_dict.get(self.mode, data_dict['default'])
 
         if selectedIndex >= 0:
+            self.signalCache.discard_path(self.audioListWidget.item(selectedIndex).text())
+            self.reconstructionCache.discard_path(self.audioListWidget.item(selectedIndex).text())
             del data_list[selectedIndex]
             if not data_list:
                 for button in buttons:
@@ -559,6 +672,8 @@ class MainApp(QMainWindow, FORM_CLASS):
             for i in range(self.outputSpectrogramLayout.count()):
                 widget = self.outputSpectrogramLayout.itemAt(i).widget()
                 widget.setVisible(True)
+            # Output updates are skipped while hidden
+            self.updateOutputSpectrogram()
 
         else:
             for i in range(self.originalSpectrogramLayout.count()):
@@ -568,42 +683,97 @@ class MainApp(QMainWindow, FORM_CLASS):
                 widget = self.outputSpectrogramLayout.itemAt(i).widget()
                 widget.hide()
 
-    def plotOriginalSignal(self, t, signal, fs):
+    def savePreset(self):
+        # Presets replay the current slider gains and windows with `python -m batch`
+        file_path, _ = QFileDialog.getSaveFileName(self, caption="Save EQ Preset", filter="EQ Presets (*.json)")
+        if file_path:
+            save_preset(file_path, self.modeComboBox.currentText(), self.recomputeScheduler.bandSettings)
+
+    def showProfilerPanel(self):
+        if self.profilerPanel is None:
+            self.profilerPanel = ProfilerPanel(self.profiler, self)
+        self.profilerPanel.show()
+        self.profilerPanel.raise_()
+
+    @profiled("plot_signal")
+    def plotOriginalSignal(self, t, signal, fs, analysis=None):
         self.mode=self.modeComboBox.currentText()
-        self.originalSignalWidget.clear()
+        self.timeVector = t
         self.originalSignalDuration = t[-1] - t[0]
         min_magnitude = np.min(signal)
-        self.originalSignalWidget.plotItem.getViewBox().setLimits(yMin=min_magnitude, yMax=-(min_magnitude))
+        self.setViewLimits(self.originalSignalWidget, yMin=min_magnitude, yMax=-(min_magnitude))
         if self.mode == "ECG Abnormalities Mode":
             max_magnitude = np.max(t)
             max_magnitude_signal = np.max(signal)
-            self.originalSignalWidget.plotItem.getViewBox().setLimits(xMin=0, xMax=(max_magnitude))
-            self.originalSignalWidget.plotItem.getViewBox().setLimits(yMin=min_magnitude, yMax=(max_magnitude_signal))
-        self.originalSignalWidget.plot(t, signal, pen='g')
-        self.originalSignalWidget.setLabel('left', 'Amplitude')
-        self.originalSignalWidget.setLabel('bottom', 'Time (s)')
-        self.originalSignalWidget.showGrid(True, True)
-        self.computeFFT(signal, fs)
-        self.playheadLineOriginal = pg.InfiniteLine(pos=self.playheadPosition, angle=90, movable=True, pen=pg.mkPen('r'))
-        self.originalSignalWidget.addItem(self.playheadLineOriginal)
-
-    def new_song_save(self,fs,reconstructed_signal):
-        reconstructed_signal = np.real(reconstructed_signal)
-        sample_rate = fs
+            self.setViewLimits(self.originalSignalWidget, xMin=0, xMax=(max_magnitude))
+            self.setViewLimits(self.originalSignalWidget, yMin=min_magnitude, yMax=(max_magnitude_signal))
+        self.originalCurve.setData(t, signal)
+        self.setPlayhead(self.playheadPosition)
+        self.computeFFT(signal, fs, analysis)
+
+    def new_song_save(self):
+        if self.engine.analysis is None:
+            return
         self.mode=self.modeComboBox.currentText()
         if self.mode == "Musical Instruments Mode":
             output_file = f'reconstructed_audio{self.file_index_music}.wav'
+        else:
+            output_file = f'reconstructed_audio{self.file_index_animal}.wav'
+        filters = [f"{label} (*.{container.lower()})" for label, container, _, _ in EXPORT_FORMATS.values()]
+        output_file, selected_filter = QFileDialog.getSaveFileName(self, caption="Export Equalized Audio",
+                                                                   directory=output_file, filter=";;".join(filters))
+        if not output_file:
+            return
+        export_format = list(EXPORT_FORMATS)[filters.index(selected_filter)] if selected_filter in filters else "wav16"
+        root, typed = path.splitext(output_file)
+        if typed.lower() in AUDIO_EXTENSIONS:
+            # Replace the extension of a typed or picked file name instead of appending to it
+            output_file = root
+        output_file += "." + EXPORT_FORMATS[export_format][1].lower()
+
+        # Equalized and written block by block on a worker, with the latest slider settings (the gains the
+        # engine applies, never a drag preview); the list entry appears once the file is complete
+        gainCurve = self.recomputeScheduler.gainCurve()
+        if self.holterRecord is not None:
+            record = self.holterRecord
+            blocks = (block for _, block in record.equalized_blocks(record.frame_gains(gainCurve)))
+            fs, channels, length = record.fs, 1, record.length
+        else:
+            analysis = self.engine.analysis
+            signal = analysis.signal
+            inputBlocks = (signal[..., start:start + BLOCK_SIZE] for start in range(0, analysis.length, BLOCK_SIZE))
+            blocks = equalize_blocks(inputBlocks, analysis.fs, gainCurve)
+            fs, channels, length = analysis.fs, analysis.channels, analysis.length
+        self.exportMode = self.mode
+        self.exportProgressBar.setValue(0)
+        self.exportProgressBar.show()
+        self.cancelExportButton.show()
+        self.audioExporter.export(output_file, blocks, fs, channels, length, export_format,
+                                  self.actionDitherExports.isChecked())
+
+    def onExportFinished(self, output_file):
+        self.hideExportProgress()
+        if self.exportMode == "Musical Instruments Mode":
             self.musicTracks.append(output_file)
-            self.audioListWidget.addItem(output_file)
             self.file_index_music += 1
-        elif self.mode == "Animal Sounds Mode":
-            output_file = f'reconstructed_audio{self.file_index_animal}.wav'
+        else:
             self.animalSounds.append(output_file)
-            self.audioListWidget.addItem(output_file)
             self.file_index_animal += 1
+        if self.modeComboBox.currentText() == self.exportMode:
+            self.audioListWidget.addItem(output_file)
+        self.statusBar().showMessage(f"Exported {output_file}", 5000)
+
+    def onExportFailed(self, output_file, message):
+        self.hideExportProgress()
+        self.statusBar().showMessage(f"Could not export {output_file}: {message}", 10000)
+
+    def cancelExport(self):
+        self.audioExporter.cancel()
+        self.hideExportProgress()
 
-        ifft_file = np.float64(reconstructed_signal)
-        sf.write(output_file, ifft_file, sample_rate)
+    def hideExportProgress(self):
+        self.exportProgressBar.hide()
+        self.cancelExportButton.hide()
 
     def updatePlayheadForMode(self):
         # Check the current mode and update the playhead for the corresponding widget
@@ -616,9 +786,9 @@ class MainApp(QMainWindow, FORM_CLASS):
             self.playMedia()
 
     def plotSelectedSignal(self):
-            self.slider_mode()
             selected_item = self.audioListWidget.currentItem()
             if selected_item:
+                self.profiler.action("select")
                 selectedFilePath = selected_item.text()
 
                 if selectedFilePath==self.ecgSignal:
@@ -627,52 +797,200 @@ class MainApp(QMainWindow, FORM_CLASS):
                     self.ecgFrequencyRanges[0] = [0,12]
 
             self.clearWidgets()
-
-        # Check if the selected file path is a .wav file
-            if selectedFilePath.lower().endswith('.wav'):
-                # Load and plot the signal from the selected .wav file
-                signal, self.fs = librosa.load(selectedFilePath, sr=None)
-
-                timeVector = np.arange(len(signal)) / self.fs
-                self.plotOriginalSignal(timeVector, signal, self.fs)
-            # Check if the selected file path is a .csv file
-            elif selectedFilePath.lower().endswith('.csv'):
-                df = pd.read_csv(selectedFilePath)
-                list_of_columns = df.columns
-                time = df[list_of_columns[0]].to_numpy()
-                data = df[list_of_columns[1]].to_numpy()
-                max_freq = (1 / (time[1] - time[0])) / 2
-                sampling_frequency = 2 * max_freq
-                self.plotOriginalSignal(time, data, sampling_frequency)
-
-    def computeFFT(self, signal, fs):
-        N = len(signal)
-        if self.mode == "Uniform Range Mode" or self.mode == "ECG Abnormalities Mode":
-            self.frequencies = np.fft.fftfreq(N, 1 / fs)
-            self.fft_result = np.fft.fft(signal)
+            mode = self.modeComboBox.currentText()
+            cacheKey = SignalCache.key(selectedFilePath, mode)
+            self.cacheKey = cacheKey
+            if cacheKey is None:
+                return
+            analysis = self.signalCache.get(cacheKey)
+            if analysis is not None:
+                self.showAnalysis(analysis)
+            else:
+                # Decoded and analysed in the background; audio draws its first seconds as soon as they are decoded
+                self.loadProgressBar.setValue(0)
+                self.loadProgressBar.show()
+                self.fileLoader.load(selectedFilePath, mode, cacheKey)
+            self.prefetchNeighbours(mode)
+
+    def prefetchNeighbours(self, mode):
+        row = self.audioListWidget.currentRow()
+        entries = []
+        for neighbour in (row + 1, row - 1):
+            item = self.audioListWidget.item(neighbour) if neighbour >= 0 else None
+            key = SignalCache.key(item.text(), mode) if item else None
+            if key is not None:
+                entries.append((item.text(), mode, key))
+        self.fileLoader.prefetch(entries)
+
+    def plotSignalPreview(self, key, samples, fs):
+        if key != self.cacheKey:
+            return
+        self.fs = fs
+        self.originalCurve.setData(np.arange(samples.shape[-1]) / fs, channel_view(samples))
+
+    def onSignalLoaded(self, key, analysis):
+        self.loadProgressBar.hide()
+        if key == self.cacheKey:
+            self.showAnalysis(analysis)
+
+    def onSignalFailed(self, file_path, message):
+        self.loadProgressBar.hide()
+        self.statusBar().showMessage(f"Could not load {file_path}: {message}", 10000)
+
+    def showAnalysis(self, analysis):
+        if isinstance(analysis, HolterRecord):
+            self.showHolterRecord(analysis)
+            return
+        self.leaveHolterView()
+        self.fs = analysis.fs
+        self.setChannelChoices(analysis.channels)
+        signal = channel_view(analysis.signal, self.viewChannel())
+        time = analysis.time if analysis.time is not None else np.arange(analysis.length) / analysis.fs
+        self.plotOriginalSignal(time, signal, analysis.fs, analysis)
+        # Only audio analyses come without a time column
+        if analysis.time is None:
+            self.mediaPlayer.setSource(signal, self.fs, self.recomputeScheduler.gainCurve())
+
+    def showHolterRecord(self, record):
+        # The whole record is drawn from its LOD summary; only the window under the view is equalized
+        self.mode = self.modeComboBox.currentText()
+        self.recomputeScheduler.cancel()
+        self.fs = record.fs
+        self.holterRecord = record
+        self.holterWindow = None
+        self.setChannelChoices(1)
+        self.timeVector = record.time
+        self.originalSignalDuration = record.duration
+        self.setHolterLimits()
+        self.outputSignalWidget.setXLink(self.originalSignalWidget)
+        self.outputSignalWidget.getPlotItem().getViewBox().enableAutoRange(x=False)
+        self.originalCurve.setData(record.time, record.samples, record.pyramid)
+        self.setPlayhead(self.playheadPosition)
+        # Open zoomed in on the first window, the only one processed so far
+        first = record.window_time(0)
+        self.originalSignalWidget.setXRange(first[0], first[-1], padding=0)
+        self.showHolterWindow(0)
+
+    def showHolterWindow(self, index):
+        record = self.holterRecord
+        self.holterWindow = index
+        self.analysisKey = self.cacheKey + ("window", index)
+        analysis = self.signalCache.get(self.analysisKey)
+        if analysis is None:
+            with self.profiler.stage("fft"):
+                analysis = record.analysis(index, self.engine.dtype)
+            self.signalCache.put(self.analysisKey, analysis)
+        # Slider settings carry over from window to window
+        bandSettings = self.recomputeScheduler.bandSettings.copy()
+        self.recomputeScheduler.cancel()
+        self.engine.load_analysis(analysis)
+        self.recomputeScheduler.restore(bandSettings)
+        self.recomputeScheduler.signalKey = self.analysisKey
+        self.frequencies = self.engine.frequencies
+        self.fft_magnitudes = analysis.magnitudes
+        self.new_magnitudes = self.fft_magnitudes * self.engine.gains
+        self.plotFrequencyDomain(self.frequencies, self.new_magnitudes)
+        self.reconstructSignalFromFFT()
+        start, stop = record.window_span(index)
+        self.requestSpectrogram(record.samples[start:stop], record.fs)
+
+    def setHolterLimits(self):
+        record = self.holterRecord
+        lo, hi = record.bounds
+        for widget in (self.originalSignalWidget, self.outputSignalWidget):
+            self.setViewLimits(widget, xMin=float(record.time[0]), xMax=float(record.time[-1]), yMin=lo, yMax=hi)
+
+    def holterViewChanged(self, *_):
+        if self.holterRecord is not None:
+            self.holterViewTimer.start()
+
+    def followHolterView(self):
+        if self.holterRecord is None:
+            return
+        x_min, x_max = self.originalSignalWidget.getPlotItem().getViewBox().viewRange()[0]
+        index = self.holterRecord.window_at((x_min + x_max) / 2)
+        if index != self.holterWindow:
+            self.showHolterWindow(index)
+
+    def leaveHolterView(self):
+        if self.holterRecord is None:
+            return
+        self.holterRecord = None
+        self.holterWindow = None
+        self.holterViewTimer.stop()
+        self.outputSignalWidget.setXLink(None)
+        for widget in (self.originalSignalWidget, self.outputSignalWidget):
+            widget.getPlotItem().getViewBox().enableAutoRange(x=True)
+
+    def setChannelChoices(self, channels):
+        previous = self.channelComboBox.currentIndex()
+        names = ["Left", "Right"] if channels == 2 else [f"Channel {index + 1}" for index in range(channels)]
+        self.channelComboBox.blockSignals(True)
+        self.channelComboBox.clear()
+        self.channelComboBox.addItem("Mid")
+        if channels > 1:
+            self.channelComboBox.addItems(names)
+        self.channelComboBox.setCurrentIndex(previous if 0 <= previous <= channels and channels > 1 else 0)
+        self.channelComboBox.blockSignals(False)
+        self.channelComboBox.setEnabled(channels > 1)
+
+    def viewChannel(self):
+        """Channel shown in the viewers, or None for the mid signal."""
+        index = self.channelComboBox.currentIndex()
+        return index - 1 if index > 0 else None
+
+    def channelChanged(self):
+        # Every channel is already equalized; only the views change
+        analysis = self.engine.analysis
+        if analysis is None or analysis.channels == 1:
+            return
+        channel = self.viewChannel()
+        signal = channel_view(analysis.signal, channel)
+        self.originalCurve.setData(self.timeVector, signal)
+        self.fft_magnitudes = analysis.channel_magnitudes(channel)
+        self.new_magnitudes = self.fft_magnitudes * self.engine.gains
+        self.plotFrequencyDomain(self.frequencies, self.new_magnitudes)
+        self.reconstructSignalFromFFT(self.reconstructed_signal, self.reconstructionKey)
+        self.requestSpectrogram(signal, analysis.fs)
+        self.mediaPlayer.setSource(signal, self.fs, self.recomputeScheduler.gainCurve())
+
+    def computeFFT(self, signal, fs, analysis=None):
+        self.recomputeScheduler.cancel()
+        if analysis is not None:
+            self.engine.load_analysis(analysis)
         else:
-            self.frequencies = np.fft.rfftfreq(N, 1 / fs)
-            self.fft_result = np.fft.rfft(signal)
-
-        self.fft_magnitudes = np.abs(self.fft_result)
-        self.phases = np.angle(self.fft_result)
-        self.slider_changes = np.ones(len(self.fft_magnitudes))
-        self.slider_changes_zeros = np.zeros_like(self.fft_magnitudes)
+            if self.mode == "ECG Abnormalities Mode":
+                self.ecgFrequencyRanges[0] = [0, 0] if len(signal) == self.Normal else [0, 12]
+            frequency_ranges = self.mode_parameters.get(self.mode, {}).get("frequency_ranges", None)
+            with self.profiler.stage("fft"):
+                self.engine.load(signal, fs, self.mode, frequency_ranges)
+        self.recomputeScheduler.signalKey = self.cacheKey if analysis is not None else None
+        self.analysisKey = self.cacheKey
+        self.frequencies = self.engine.frequencies
+        self.fft_magnitudes = self.engine.analysis.channel_magnitudes(self.viewChannel())
+        self.new_magnitudes = self.fft_magnitudes * self.engine.gains
         self.plotFrequencyDomain(self.frequencies, self.fft_magnitudes)
-        self.updateSpectrogram(signal, fs, 1)
+        self.reconstructSignalFromFFT()
+        self.requestSpectrogram(signal, fs)
+
     def restrictions (self,widget,xmin,xmax):
-        mode = self.modeComboBox.currentText()
-        if mode == "Uniform Range Mode":
-          widget.plotItem.getViewBox().setLimits(xMin=xmin, xMax=xmax)
-        elif mode == "Animal Sounds Mode" or '"Musical Instruments Mode"':
-            widget.plotItem.getViewBox().setLimits(xMin=xmin, xMax=xmax)
-        else :
-            widget.plotItem.getViewBox().setLimits(xMin=xmin, xMax=xmax)
+        self.setViewLimits(widget, xMin=xmin, xMax=xmax)
+
+    def setViewLimits(self, widget, **limits):
+        # setLimits re-clamps and repaints the view, so it is only called for limits that moved
+        applied = self.viewLimits.setdefault(widget, {})
+        changed = {name: value for name, value in limits.items() if applied.get(name) != value}
+        if changed:
+            applied.update(changed)
+            widget.plotItem.getViewBox().setLimits(**changed)
+    @profiled("plot_frequency")
     def plotFrequencyDomain(self, frequency_components, frequency_magnitudes):
-        self.frequencyWidget.clear()
         mode = self.modeComboBox.currentText()
         self.deleteButton.setEnabled(1)
-        if mode == "Uniform Range Mode":
+        if self.holterRecord is not None:
+            # The time axes span the whole record (see setHolterLimits)
+            self.restrictions( self.frequencyWidget,0,205)
+        elif mode == "Uniform Range Mode":
             self.restrictions( self.frequencyWidget,0,105)
             self.restrictions( self.originalSignalWidget,0,5.2)
             self.restrictions( self.outputSignalWidget,0,5.2)
@@ -686,67 +1004,75 @@ class MainApp(QMainWindow, FORM_CLASS):
 
         else :
             self.restrictions( self.frequencyWidget,0,205)
-        min_magnitude = np.max(frequency_magnitudes)
-        self.frequencyWidget.plotItem.getViewBox().setLimits(yMin=-80, yMax=(min_magnitude+100))
-        self.frequencyWidget.plot(frequency_components, frequency_magnitudes, pen='b')
-        self.frequencyWidget.setLabel('left', 'Magnitude')
-        self.frequencyWidget.setLabel('bottom', 'Frequency (Hz)')
-        self.frequencyWidget.showGrid(True, True)
-        self.frequencyWidget.setYRange(0, max(frequency_magnitudes) * 1.2)
-        self.reconstructSignalFromFFT()
-
-    def reconstructSignalFromFFT(self):
+        peak = float(np.max(frequency_magnitudes))
+        self.setViewLimits(self.frequencyWidget, yMin=-80, yMax=(peak+100))
+        self.frequencyCurve.setData(frequency_components, frequency_magnitudes)
+        # A slider tick outside the loudest band leaves the range alone
+        if peak != self.frequencyPeak:
+            self.frequencyPeak = peak
+            self.frequencyWidget.setYRange(0, peak * 1.2)
+
+    def reconstructSignalFromFFT(self, reconstructed_signal=None, key=None):
         self.mode = self.modeComboBox.currentText()
-        t = self.originalSignalWidget.getPlotItem().listDataItems()[0].getData()[0]
-        modified_signal = self.frequencyWidget.getPlotItem().listDataItems()[0].getData()[1]
-        combined_fft = modified_signal * np.exp(1j * self.phases)
-        if self.mode == "Uniform Range Mode" or self.mode == "ECG Abnormalities Mode":
-            self.reconstructed_signal = np.fft.ifft(combined_fft)
-            if self.Normal ==len( self.reconstructed_signal):
-                self.ecgFrequencyRanges[0] = [0, 0]
-            else:
-                self.ecgFrequencyRanges[0] = [0, 12]
-
-        else:
-            self.reconstructed_signal = np.fft.irfft(combined_fft)
-        min_magnitude = np.min(self.reconstructed_signal)
-        self.outputSignalWidget.plotItem.getViewBox().setLimits(yMin=min_magnitude, yMax=-(min_magnitude))
-        if self.mode == "ECG Abnormalities Mode":
+        t = self.timeVector
+        if reconstructed_signal is None:
+            key, reconstructed_signal = self.recomputeScheduler.reconstruct()
+        self.reconstructed_signal = reconstructed_signal
+        self.reconstructionKey = key
+        reconstructed_signal = channel_view(reconstructed_signal, self.viewChannel())
+        if self.holterRecord is not None:
+            # The engine holds one window's frame; keep the window itself, at its place in the record
+            t, reconstructed_signal = self.holterRecord.window_output(self.holterWindow, reconstructed_signal)
+        min_magnitude = np.min(reconstructed_signal)
+        self.setViewLimits(self.outputSignalWidget, yMin=min_magnitude, yMax=-(min_magnitude))
+        if self.holterRecord is not None:
+            self.setHolterLimits()
+        elif self.mode == "ECG Abnormalities Mode":
             max_magnitude = np.max(t)
-            max_magnitude_signal = np.max(self.reconstructed_signal)
-            self.outputSignalWidget.plotItem.getViewBox().setLimits(xMin=0, xMax=(max_magnitude))
-            self.outputSignalWidget.plotItem.getViewBox().setLimits(yMin=min_magnitude, yMax=(max_magnitude_signal))
-        self.plotReconstructedSignal(t, self.reconstructed_signal)
+            max_magnitude_signal = np.max(reconstructed_signal)
+            self.setViewLimits(self.outputSignalWidget, xMin=0, xMax=(max_magnitude))
+            self.setViewLimits(self.outputSignalWidget, yMin=min_magnitude, yMax=(max_magnitude_signal))
+        self.plotReconstructedSignal(t, reconstructed_signal)
 
+    @profiled("plot_signal")
     def plotReconstructedSignal(self, t, reconstructed_signal):
         reconstructed_signal = np.real(reconstructed_signal)
-        self.outputSignalWidget.clear()
-        self.outputSignalWidget.plot(t, reconstructed_signal, pen='y')
-        self.outputSignalWidget.setLabel('left', 'Amplitude')
-        self.outputSignalWidget.setLabel('bottom', 'Time (s)')
-        self.outputSignalWidget.showGrid(True, True)
-        self.playheadLineOutput = pg.InfiniteLine(pos=self.playheadPosition, angle=90, movable=True, pen=pg.mkPen('r')) #new
-        self.outputSignalWidget.addItem(self.playheadLineOutput)
-        fs = (1 / (t[1] - t[0]))
-        self.updateSpectrogram(reconstructed_signal, fs, 2)
-
-    def updateSpectrogram(self, data, fs, choice):
-        if choice == 2:
-            self.clearLayout(self.outputSpectrogramLayout)
-        else:
-            self.clearLayout(self.originalSpectrogramLayout)
-
-        fig, ax = plt.subplots()
-        spec = ax.specgram(data, Fs=fs, cmap='viridis')
-        cbar = fig.colorbar(spec[3], ax=ax)
-        # Add the updated spectrogram to the layout
-        canvas = FigureCanvas(fig)
-        if choice == 2:
-            self.outputSpectrogramLayout.addWidget(canvas)
+        # The LOD pyramid of an output seen before comes from the reconstruction cache
+        lodKey = self.reconstructionKey + ("lod", self.viewChannel()) if self.reconstructionKey else None
+        pyramid = self.reconstructionCache.get(lodKey) if lodKey else None
+        self.outputCurve.setData(t, reconstructed_signal, pyramid)
+        if lodKey and pyramid is None:
+            pyramid = self.outputCurve.pyramid
+            # Mono pyramids draw the cached reconstruction itself: charged to its entry and evicted with it
+            pyramid.shared = np.may_share_memory(pyramid.samples, self.reconstructed_signal)
+            self.reconstructionCache.put(lodKey, pyramid, owner=self.reconstructionKey if pyramid.shared else None)
+        self.updateOutputSpectrogram()
+
+    def requestSpectrogram(self, signal, fs):
+        # The STFT of the original is computed once per file; the output is derived from it
+        self.spectrogramWorker.cancel()
+        self.originalSpectrogramWidget.clearSpectrogram()
+        self.outputSpectrogramWidget.clearSpectrogram()
+        key = self.analysisKey + ("spectrogram", self.viewChannel()) if self.analysisKey else None
+        data = self.signalCache.get(key) if key else None
+        if data is not None:
+            self.showSpectrograms(key, data)
         else:
-            self.originalSpectrogramLayout.addWidget(canvas)
-
-        self.toggleSpectrogramVisibility(self.spectrogramRadioButton.isChecked())
+            self.spectrogramWorker.request(key, signal, fs)
+
+    def showSpectrograms(self, key, data):
+        if key:
+            self.signalCache.put(key, data)
+        self.originalSpectrogramWidget.setSpectrogram(data)
+        self.outputSpectrogramWidget.setSpectrogram(data, self.recomputeScheduler.gainCurve()(data.frequencies))
+
+    @profiled("spectrogram")
+    def updateOutputSpectrogram(self):
+        view = self.outputSpectrogramWidget
+        if view.data is None or not self.spectrogramRadioButton.isChecked():
+            return
+        # Scales the original's image into one reused buffer; only the gain curve is per setting
+        view.setGains(self.recomputeScheduler.gainCurve()(view.data.frequencies))
 
     def clearLayout(self, layout):
         while layout.count():
@@ -775,10 +1101,9 @@ class MainApp(QMainWindow, FORM_CLASS):
         self.compose_wave(index)
 
     def converted(self):
-        self.smoothing_window = self.smoothedSignalWidget.getPlotItem().listDataItems()[0].getData()[1]
+        self.smoothing_window = self.smoothingCurve.getData()[1]
         if self.smootherComboBox.currentIndex() != 0:  # gded
-            self.frequencyWidget.plot(self.freqRangeSmoothing, self.smoothing_window * max(self.new_magnitudes),
-                                      pen='r')  # gded
+            self.smoothingOverlay.setData(self.freqRangeSmoothing, self.smoothing_window * max(self.new_magnitudes))
         self.tabWidget.setCurrentIndex(0)
 
 
@@ -792,22 +1117,23 @@ class MainApp(QMainWindow, FORM_CLASS):
 
     def compose_wave(self, index):
         x = self.freqRangeSmoothing
-        if index == 0:
-            self.smoothing_window = np.ones_like(x)
-        elif index == 1:
-            self.smoothing_window = np.hamming(len(x))
-        elif index == 2:
-            self.smoothing_window = np.hanning(len(x))
+        if index == 3:
+            self.smoothing_window = make_window(index, x, self.mu, self.std)
         else:
-            self.smoothing_window = np.exp(-(x - self.mu)**2 / (2 * self.std**2))
+            self.smoothing_window = make_window(index, x)
 
-        self.smoothedSignalWidget.clear()
-        self.smoothedSignalWidget.plot(x, self.smoothing_window, pen="g")
+        self.smoothingCurve.setData(x, self.smoothing_window)
+
+    def windowSpec(self):
+        # (index, mu, std) lets the engine rebuild the window on any frequency grid
+        index = self.smootherComboBox.currentIndex()
+        if index == 3:
+            return (index, self.mu, self.std)
+        return (index, None, None)
 
     def updateGaussianWindow(self):
         self.mu = self.meanSlider.value()
         self.std = self.standardDeviationSlider.value() / 10.0
-        self.smoothedSignalWidget.clear()
         self.compose_wave(3)
 
     def setLabelImage(self, label, icon, width=55, height=18, offset_x=1, offset_y=1):
@@ -892,7 +1218,6 @@ class MainApp(QMainWindow, FORM_CLASS):
 
     def modeChanged(self):
         selectedMode = self.modeComboBox.currentText()
-        self.slider_mode()
         # Call the corresponding method based on the selected mode
         if selectedMode == "Uniform Range Mode":
             self.uniformRangeMode()
@@ -909,14 +1234,42 @@ class MainApp(QMainWindow, FORM_CLASS):
 
         self.clearWidgets()
 
+    def setupPlotItems(self):
+        # Every viewer owns its items for good; updates go through setData instead of clear-and-replot
+        for widget, bottom in ((self.originalSignalWidget, 'Time (s)'), (self.outputSignalWidget, 'Time (s)'),
+                               (self.frequencyWidget, 'Frequency (Hz)')):
+            widget.setLabel('left', 'Magnitude' if widget is self.frequencyWidget else 'Amplitude')
+            widget.setLabel('bottom', bottom)
+            widget.showGrid(True, True)
+        self.viewLimits = {}
+        self.frequencyPeak = None
+        self.frequencyCurve = self.frequencyWidget.plot(pen='b')
+        # Spectra have a point per bin; draw about one min/max pair per pixel of the visible part
+        self.frequencyCurve.setDownsampling(auto=True, method='peak')
+        self.frequencyCurve.setClipToView(True)
+        self.smoothingOverlay = self.frequencyWidget.plot(pen='r')
+        self.smoothingCurve = self.smoothedSignalWidget.plot(pen='g')
+        self.playheadLineOriginal = pg.InfiniteLine(pos=0, angle=90, movable=True, pen=pg.mkPen('r'))
+        self.playheadLineOutput = pg.InfiniteLine(pos=0, angle=90, movable=True, pen=pg.mkPen('r'))
+        self.originalSignalWidget.addItem(self.playheadLineOriginal)
+        self.outputSignalWidget.addItem(self.playheadLineOutput)
+
     def clearWidgets(self):
-        self.originalSignalWidget.clear()
-        self.outputSignalWidget.clear()
-        self.frequencyWidget.clear()
-        for i in reversed(range(self.outputSpectrogramLayout.count())):
-         self.outputSpectrogramLayout.itemAt(i).widget().setParent(None)
-        for i in reversed(range(self.originalSpectrogramLayout.count())):
-         self.originalSpectrogramLayout.itemAt(i).widget().setParent(None)
+        self.originalCurve.clear()
+        self.outputCurve.clear()
+        self.frequencyCurve.clear()
+        self.smoothingOverlay.clear()
+        self.frequencyPeak = None
+        self.spectrogramWorker.cancel()
+        self.fileLoader.cancel()
+        self.loadProgressBar.hide()
+        self.originalSpectrogramWidget.clearSpectrogram()
+        self.outputSpectrogramWidget.clearSpectrogram()
+
+    def closeEvent(self, event):
+        # The player's audio thread has to finish before Qt tears the window down
+        self.mediaPlayer.close()
+        super().closeEvent(event)
 
 
 def main():
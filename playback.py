@@ -0,0 +1,331 @@
+import numpy as np
+from PyQt5.QtCore import QIODevice, QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtMultimedia import QAudio, QAudioFormat, QAudioOutput
+
+from engine import unity_gain
+from streaming import StftEqualizer
+
+# 2048-sample frames keep the gain latency around one 23 ms hop at 44.1 kHz
+PLAYBACK_FRAME_LENGTH = 2048
+RAMP_FRAMES = 2
+# Blocks are rendered on the audio thread as the output asks for them, so GUI stalls cannot
+# starve it; the buffer only covers that thread's own scheduling and bounds the gain latency
+BUFFER_SECONDS = 0.05
+# How often the audio thread reports the heard position
+NOTIFY_INTERVAL_MS = 10
+
+
+class EqualizedStream(QIODevice):
+    """
+    Pull-mode 16-bit mono PCM source that equalizes a signal as the audio output reads it.
+
+    `readData` runs on the thread of the QAudioOutput reading the stream and
+    renders just enough STFT hops for each request. The gain curve is read
+    from `player.gainCurve` before every block, so the GUI hands over a new
+    curve by assigning it, without locking. `samplesRead` counts the samples
+    handed to the output since `start`.
+    """
+
+    def __init__(self, player, signal, equalizer, start, parent=None):
+        super().__init__(parent)
+        self.player = player
+        self.signal = signal
+        self.equalizer = equalizer
+        self.start = start
+        self.cursor = start
+        self.samplesRead = 0
+        self.finished = False
+        self.queued = np.zeros(0, dtype=np.int16)
+        self.gainCurve = player.gainCurve
+        equalizer.set_gain_curve(self.gainCurve)
+        equalizer.reset()
+
+    def isSequential(self):
+        return True
+
+    def bytesAvailable(self):
+        return 0 if self.finished and not len(self.queued) else 2 * self.equalizer.hop + super().bytesAvailable()
+
+    def readData(self, maxlen):
+        need = maxlen // 2
+        while len(self.queued) < need and not self.finished:
+            self._render()
+        data, self.queued = self.queued[:need], self.queued[need:]
+        self.samplesRead += len(data)
+        return data.tobytes()
+
+    def writeData(self, data):
+        return -1
+
+    def _render(self):
+        gainCurve = self.player.gainCurve
+        if gainCurve is not self.gainCurve:
+            self.gainCurve = gainCurve
+            self.equalizer.set_gain_curve(gainCurve)
+        hop = self.equalizer.hop
+        block = self.signal[self.cursor:self.cursor + hop]
+        self.cursor += len(block)
+        if len(block):
+            chunk = self.equalizer.process(block)
+        else:
+            chunk = self.equalizer.flush()
+            self.finished = True
+        pcm = np.clip(chunk * 32767, -32768, 32767).astype(np.int16)
+        self.queued = np.concatenate([self.queued, pcm])
+
+
+class _AudioWorker(QObject):
+    """Owns the QAudioOutput and its stream on the player's audio thread; driven by queued signals."""
+    # Both carry the serial of the start they belong to
+    heard = pyqtSignal(int, int)
+    drained = pyqtSignal(int)
+
+    def __init__(self, player):
+        super().__init__()
+        self.player = player
+        self.output = None
+        self.stream = None
+        self.serial = 0
+
+    @pyqtSlot(int, float)
+    def open(self, fs, volume):
+        self.close()
+        audioFormat = QAudioFormat()
+        audioFormat.setSampleRate(fs)
+        audioFormat.setChannelCount(1)
+        audioFormat.setSampleSize(16)
+        audioFormat.setCodec("audio/pcm")
+        audioFormat.setByteOrder(QAudioFormat.LittleEndian)
+        audioFormat.setSampleType(QAudioFormat.SignedInt)
+        self.output = QAudioOutput(audioFormat, self)
+        self.output.setBufferSize(int(fs * BUFFER_SECONDS) * 2)
+        self.output.setNotifyInterval(NOTIFY_INTERVAL_MS)
+        self.output.notify.connect(self._report)
+        self.output.stateChanged.connect(self._onStateChanged)
+        self.output.setVolume(volume)
+
+    @pyqtSlot()
+    def close(self):
+        self.stop()
+        if self.output is not None:
+            self.output.deleteLater()
+            self.output = None
+
+    @pyqtSlot(int, object, object, int)
+    def start(self, serial, signal, equalizer, sample):
+        if self.output is None:
+            return
+        self.stop()
+        self.serial = serial
+        self.stream = EqualizedStream(self.player, signal, equalizer, sample, self)
+        self.stream.open(QIODevice.ReadOnly)
+        self.output.start(self.stream)
+
+    @pyqtSlot()
+    def suspend(self):
+        if self.output is not None:
+            self.output.suspend()
+            self._report()
+
+    @pyqtSlot()
+    def resume(self):
+        if self.output is not None and self.output.state() == QAudio.SuspendedState:
+            self.output.resume()
+
+    @pyqtSlot()
+    def stop(self):
+        if self.output is not None:
+            self.output.stop()
+        if self.stream is not None:
+            self.stream.close()
+            self.stream.deleteLater()
+            self.stream = None
+
+    @pyqtSlot(float)
+    def setVolume(self, volume):
+        if self.output is not None:
+            self.output.setVolume(volume)
+
+    def _report(self):
+        stream = self.stream
+        if stream is None:
+            return
+        # processedUSecs counts audio handed to the device on some backends, which runs
+        # ahead of what is heard by up to a buffer; count what is still queued there instead
+        backlog = max(self.output.bufferSize() - self.output.bytesFree(), 0) // 2
+        self.heard.emit(self.serial, stream.start + max(stream.samplesRead - backlog, 0))
+
+    def _onStateChanged(self, state):
+        # The device drained everything after the last rendered block
+        if state == QAudio.IdleState and self.stream is not None and self.stream.finished \
+                and not len(self.stream.queued):
+            self.stop()
+            self.drained.emit(self.serial)
+
+
+class EqualizedPlayer(QObject):
+    """
+    Audio output that equalizes the loaded signal just ahead of the playhead.
+
+    The QAudioOutput lives on a thread of its own and pulls PCM from an
+    EqualizedStream, which renders blocks through a StftEqualizer only when
+    the output asks for them, so drawing on the GUI thread never starves
+    playback and a gain change is heard after roughly the output buffer plus
+    one STFT hop, ramped over a few frames to avoid clicks. With
+    `engine="iir"` the biquad filter bank of iir.py renders instead, which
+    adds no latency of its own. Positions are the samples read from the
+    stream minus those still waiting in the output buffer, as reported by
+    the audio thread; the STFT output is trimmed to line up sample for
+    sample with its input, so it needs no further correction.
+
+    Mirrors the subset of the QMediaPlayer API the main window uses
+    (play/pause/stop, position/duration in ms, setPosition, setVolume,
+    setMuted, positionChanged). Call `close` before the application quits
+    to stop the audio thread.
+    """
+    positionChanged = pyqtSignal(int)
+    stateChanged = pyqtSignal(bool)
+    _open = pyqtSignal(int, float)
+    _start = pyqtSignal(int, object, object, int)
+    _suspend = pyqtSignal()
+    _resume = pyqtSignal()
+    _stop = pyqtSignal()
+    _close = pyqtSignal()
+    _volume = pyqtSignal(float)
+
+    def __init__(self, parent=None, frame_length=PLAYBACK_FRAME_LENGTH, engine="stft"):
+        super().__init__(parent)
+        self.frame_length = frame_length
+        self.engine = engine
+        self.signal = None
+        self.fs = None
+        self.equalizer = None
+        self.gainCurve = unity_gain
+        self.volume = 50
+        self.muted = False
+        self.playFrom = 0
+        self.heardSample = 0
+        self.active = False
+        self.suspended = False
+        self.serial = 0
+
+        self.audioThread = QThread(self)
+        self.audio = _AudioWorker(self)
+        self.audio.moveToThread(self.audioThread)
+        self._open.connect(self.audio.open)
+        self._start.connect(self.audio.start)
+        self._suspend.connect(self.audio.suspend)
+        self._resume.connect(self.audio.resume)
+        self._stop.connect(self.audio.stop)
+        self._close.connect(self.audio.close)
+        self._volume.connect(self.audio.setVolume)
+        self.audio.heard.connect(self._onHeard)
+        self.audio.drained.connect(self._onDrained)
+        self.audioThread.start()
+
+    def setSource(self, signal, fs, gain_curve=None):
+        self.stop()
+        self.signal = signal
+        self.fs = int(fs)
+        if gain_curve is not None:
+            self.gainCurve = gain_curve
+        if self.engine == "iir":
+            from iir import IirEqualizer
+
+            self.equalizer = IirEqualizer(self.fs, self.gainCurve)
+        else:
+            self.equalizer = StftEqualizer(self.fs, self.gainCurve, self.frame_length, RAMP_FRAMES)
+        self._open.emit(self.fs, self._outputVolume())
+
+    def setGainCurve(self, gain_curve):
+        # Picked up by the stream before its next block
+        self.gainCurve = gain_curve
+
+    def isPlaying(self):
+        return self.active and not self.suspended
+
+    def duration(self):
+        if self.signal is None:
+            return 0
+        return int(len(self.signal) * 1000 / self.fs)
+
+    def position(self):
+        if self.signal is None:
+            return 0
+        sample = self.heardSample if self.active else self.playFrom
+        return int(min(sample * 1000 / self.fs, self.duration()))
+
+    def play(self):
+        if self.signal is None:
+            return
+        if self.active and self.suspended:
+            self.suspended = False
+            self._resume.emit()
+        else:
+            self._startAt(self.playFrom)
+        self.stateChanged.emit(True)
+
+    def pause(self):
+        if not self.active:
+            return
+        self.playFrom = self.heardSample
+        self.suspended = True
+        self._suspend.emit()
+        self.stateChanged.emit(False)
+
+    def stop(self):
+        self._stop.emit()
+        self.active = False
+        self.suspended = False
+        self.playFrom = 0
+        self.stateChanged.emit(False)
+        self.positionChanged.emit(0)
+
+    def close(self):
+        """Stop playback and the audio thread."""
+        self._close.emit()
+        self.audioThread.quit()
+        self.audioThread.wait()
+
+    def setPosition(self, ms):
+        if self.signal is None:
+            return
+        self.playFrom = int(np.clip(ms * self.fs / 1000, 0, len(self.signal)))
+        if self.isPlaying():
+            self._startAt(self.playFrom)
+        elif self.active:
+            # Paused: drop what was buffered so resuming starts at the new spot
+            self._stop.emit()
+            self.active = False
+            self.suspended = False
+        self.positionChanged.emit(self.position())
+
+    def setVolume(self, volume):
+        self.volume = volume
+        self._volume.emit(self._outputVolume())
+
+    def setMuted(self, muted):
+        self.muted = muted
+        self._volume.emit(self._outputVolume())
+
+    def _outputVolume(self):
+        return 0.0 if self.muted else self.volume / 100
+
+    def _startAt(self, sample):
+        self.heardSample = sample
+        self.active = True
+        self.suspended = False
+        self.serial += 1
+        self._start.emit(self.serial, self.signal, self.equalizer, sample)
+
+    def _onHeard(self, serial, sample):
+        # Reports of an earlier start can still arrive after a seek or stop
+        if serial == self.serial and self.isPlaying():
+            self.heardSample = sample
+            self.positionChanged.emit(self.position())
+
+    def _onDrained(self, serial):
+        if serial == self.serial and self.isPlaying():
+            self.active = False
+            self.playFrom = 0
+            self.stateChanged.emit(False)
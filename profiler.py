@@ -0,0 +1,179 @@
+import csv
+import functools
+import json
+import platform
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+STAGE_FIELDS = ["stage", "calls", "total_ms", "self_ms", "mean_ms", "max_ms", "last_ms", "alloc_bytes", "max_alloc_bytes"]
+
+
+class _StageStats:
+    __slots__ = ("calls", "total", "self_time", "max", "last", "alloc", "max_alloc")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.self_time = 0.0
+        self.max = 0.0
+        self.last = 0.0
+        self.alloc = 0
+        self.max_alloc = 0
+
+
+class Profiler:
+    """
+    Per-stage wall time, allocation and call counters for the equalizer hot path.
+
+    Stages may nest; `self_ms` excludes time spent in nested stages on the same
+    thread. Allocation sizes are the tracemalloc peak inside a stage and are only
+    collected with `track_allocations=True`, since tracing slows every
+    allocation. Stages running concurrently on the recompute thread share the
+    tracemalloc peak, so allocation figures are approximate in that case.
+
+    Actions (a slider tick, a file selection) count how many recomputes each
+    user interaction ends up triggering.
+    """
+
+    def __init__(self, enabled=True, track_allocations=False):
+        self.enabled = enabled
+        self.track_allocations = track_allocations
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._counter_sources = {}
+        self.reset()
+        if track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def reset(self):
+        with self._lock:
+            self._stages = {}
+            self._actions = {}
+            self._current_action = None
+
+    @contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        stack = self._local.__dict__.setdefault("stack", [])
+        frame = {"children": 0.0, "child_peak": 0, "base": 0}
+        if self.track_allocations:
+            current, peak = tracemalloc.get_traced_memory()
+            # reset_peak() below would hide the enclosing stage's peak so far
+            if stack:
+                stack[-1]["child_peak"] = max(stack[-1]["child_peak"], peak)
+            frame["base"] = current
+            tracemalloc.reset_peak()
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            allocated = 0
+            if self.track_allocations:
+                allocated = max(tracemalloc.get_traced_memory()[1], frame["child_peak"]) - frame["base"]
+            if stack:
+                stack[-1]["children"] += elapsed
+                stack[-1]["child_peak"] = max(stack[-1]["child_peak"], allocated + frame["base"])
+            self._record(name, elapsed, elapsed - frame["children"], max(allocated, 0))
+
+    def _record(self, name, elapsed, self_time, allocated):
+        with self._lock:
+            stats = self._stages.setdefault(name, _StageStats())
+            stats.calls += 1
+            stats.total += elapsed
+            stats.self_time += self_time
+            stats.max = max(stats.max, elapsed)
+            stats.last = elapsed
+            stats.alloc += allocated
+            stats.max_alloc = max(stats.max_alloc, allocated)
+
+    def action(self, kind):
+        """Start a new user action; later recomputes are attributed to it."""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self._actions.setdefault(kind, {"count": 0, "recomputes": 0, "max_recomputes": 0})
+            stats["count"] += 1
+            self._current_action = [kind, 0]
+
+    def count_recompute(self):
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._current_action is None:
+                return
+            kind, count = self._current_action
+            self._current_action[1] = count + 1
+            stats = self._actions[kind]
+            stats["recomputes"] += 1
+            stats["max_recomputes"] = max(stats["max_recomputes"], count + 1)
+
+    def add_counters(self, name, source):
+        """Include the dict returned by `source()` (e.g. cache hit/miss counters) in every report."""
+        self._counter_sources[name] = source
+
+    def counters(self):
+        return {name: source() for name, source in self._counter_sources.items()}
+
+    def stage_rows(self):
+        with self._lock:
+            rows = []
+            for name, stats in self._stages.items():
+                rows.append({
+                    "stage": name,
+                    "calls": stats.calls,
+                    "total_ms": stats.total * 1000,
+                    "self_ms": stats.self_time * 1000,
+                    "mean_ms": stats.total * 1000 / stats.calls,
+                    "max_ms": stats.max * 1000,
+                    "last_ms": stats.last * 1000,
+                    "alloc_bytes": stats.alloc,
+                    "max_alloc_bytes": stats.max_alloc,
+                })
+            return rows
+
+    def action_rows(self):
+        with self._lock:
+            rows = []
+            for kind, stats in self._actions.items():
+                rows.append(dict(action=kind, recomputes_per_action=stats["recomputes"] / stats["count"], **stats))
+            return rows
+
+    def to_dict(self):
+        return {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "track_allocations": self.track_allocations,
+            "stages": self.stage_rows(),
+            "actions": self.action_rows(),
+            "counters": self.counters(),
+        }
+
+    def dump_json(self, file_path):
+        with open(file_path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
+
+    def dump_csv(self, file_path):
+        with open(file_path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=STAGE_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.stage_rows())
+
+
+def profiled(stage):
+    """Method decorator timing calls through the instance's `profiler` attribute."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.stage(stage):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,80 @@
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import (QDialog, QFileDialog, QHBoxLayout, QLabel, QPushButton, QTableWidget,
+                             QTableWidgetItem, QVBoxLayout)
+
+COLUMNS = [("Stage", "stage"), ("Calls", "calls"), ("Total ms", "total_ms"), ("Self ms", "self_ms"),
+           ("Mean ms", "mean_ms"), ("Max ms", "max_ms"), ("Max alloc MB", "max_alloc_bytes")]
+
+
+class ProfilerPanel(QDialog):
+    """Small live view of a Profiler with JSON/CSV export."""
+
+    def __init__(self, profiler, parent=None):
+        super().__init__(parent)
+        self.profiler = profiler
+        self.setWindowTitle("Performance Stats")
+        self.resize(620, 300)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels([title for title, _ in COLUMNS])
+        self.table.verticalHeader().setVisible(False)
+        self.actionsLabel = QLabel()
+
+        resetButton = QPushButton("Reset")
+        jsonButton = QPushButton("Export JSON")
+        csvButton = QPushButton("Export CSV")
+        resetButton.clicked.connect(self.resetStats)
+        jsonButton.clicked.connect(lambda: self.export("JSON Files (*.json)", self.profiler.dump_json))
+        csvButton.clicked.connect(lambda: self.export("CSV Files (*.csv)", self.profiler.dump_csv))
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(resetButton)
+        buttons.addStretch(1)
+        buttons.addWidget(jsonButton)
+        buttons.addWidget(csvButton)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.table)
+        layout.addWidget(self.actionsLabel)
+        layout.addLayout(buttons)
+
+        self.refreshTimer = QTimer(self)
+        self.refreshTimer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.refreshTimer.start(500)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.refreshTimer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        rows = self.profiler.stage_rows()
+        self.table.setRowCount(len(rows))
+        for row, stats in enumerate(rows):
+            for column, (_, key) in enumerate(COLUMNS):
+                value = stats[key]
+                if key == "max_alloc_bytes":
+                    text = f"{value / 2**20:.1f}" if self.profiler.track_allocations else "-"
+                elif isinstance(value, float):
+                    text = f"{value:.2f}"
+                else:
+                    text = str(value)
+                self.table.setItem(row, column, QTableWidgetItem(text))
+
+        actions = [f"{stats['action']}: {stats['count']} actions, {stats['recomputes_per_action']:.2f} recomputes/action "
+                   f"(max {stats['max_recomputes']})" for stats in self.profiler.action_rows()]
+        counters = [f"{name}: " + ", ".join(f"{key} {value}" for key, value in values.items())
+                    for name, values in self.profiler.counters().items()]
+        self.actionsLabel.setText("\n".join(actions + counters) or "No user actions recorded yet")
+
+    def resetStats(self):
+        self.profiler.reset()
+        self.refresh()
+
+    def export(self, file_filter, writer):
+        file_path, _ = QFileDialog.getSaveFileName(self, caption="Export Performance Stats", filter=file_filter)
+        if file_path:
+            writer(file_path)
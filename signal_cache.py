@@ -0,0 +1,147 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def array_bytes(value):
+    """Memory held by the numpy arrays of a value (an array, a container, or an object exposing `nbytes`)."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (list, tuple)):
+        return sum(array_bytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(array_bytes(item) for item in value.values())
+    return getattr(value, "nbytes", 0)
+
+
+class ByteLRUCache:
+    """
+    Least-recently-used cache bounded by the array memory of its values.
+
+    Values larger than the whole budget are not stored. An entry put with an
+    `owner` key is dropped together with that entry, so a value that holds
+    another entry's arrays without counting them (a view, or a structure
+    built around them) never outlives the entry that pays for them. Safe to
+    share between the GUI thread and workers.
+    """
+
+    def __init__(self, budget_bytes):
+        self.budget_bytes = budget_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # key -> (value, size, owner key or None)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    @property
+    def nbytes(self):
+        return self._bytes
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, owner=None):
+        """
+        Store `value`, evicting least recently used entries to fit it.
+
+        With `owner`, the value is only stored while that key is cached and
+        is dropped with it. Returns whether the value was stored.
+        """
+        size = array_bytes(value)
+        with self._lock:
+            if key in self._entries:
+                # A new value may not share the old one's arrays, so its dependents go too
+                self._pop(key)
+            if size > self.budget_bytes or (owner is not None and owner not in self._entries):
+                return False
+            if owner is not None:
+                # Both are in use; make room from other entries first
+                self._entries.move_to_end(owner)
+            while self._entries and self._bytes + size > self.budget_bytes:
+                self.evictions += self._pop(next(iter(self._entries)))
+            if owner is not None and owner not in self._entries:
+                return False
+            self._entries[key] = (value, size, owner)
+            self._bytes += size
+            return True
+
+    def _pop(self, key):
+        """Remove `key` and every entry it owns (lock held); returns the number of entries removed."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+        dependents = [other for other, (_, _, owner) in self._entries.items() if owner == key]
+        return 1 + sum(self._pop(other) for other in dependents if other in self._entries)
+
+    def discard(self, predicate):
+        """Drop every entry whose key matches `predicate`, with the entries they own."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                if key in self._entries:
+                    self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "budget_bytes": self.budget_bytes,
+        }
+
+
+class SignalCache(ByteLRUCache):
+    """Decoded samples plus their SignalAnalysis, keyed by file identity and mode."""
+
+    @staticmethod
+    def key(file_path, mode):
+        """Cache key of a file in a mode, or None when the file cannot be stat'ed."""
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, mode)
+
+    def discard_path(self, file_path):
+        file_path = os.path.abspath(file_path)
+        self.discard(lambda key: key[0] == file_path)
+
+
+class ReconstructionCache(SignalCache):
+    """
+    Equalized outputs, and the plot data derived from them, keyed by file, mode and gains.
+
+    Keys extend a SignalCache key with a digest of the per-bin gain vector
+    that multiplies the spectrum, so every slider and smoothing-window
+    combination that produces the same gains, in whatever order it was
+    reached, finds the same entry.
+    """
+
+    @staticmethod
+    def gain_key(signal_key, gains):
+        if signal_key is None:
+            return None
+        return signal_key + (hashlib.blake2b(np.ascontiguousarray(gains), digest_size=16).hexdigest(),)
@@ -0,0 +1,123 @@
+"""
+Spectrograms drawn into a reused pyqtgraph image from a cached power spectrum.
+
+`compute_spectrogram` matches the defaults the matplotlib `specgram` plots
+used (256-sample Hann frames, 128-sample overlap, one-sided PSD in dB) and
+is run once per file, off the GUI thread. The output spectrogram is derived
+from it by applying the current gain curve per frequency row: a gain G(f)
+scales power by |G(f)|², i.e. adds 20·log10|G(f)| dB, so a slider move costs
+one broadcast add instead of a new STFT. Within the 256-bin frequency
+resolution this is the spectrogram of the equalized signal.
+"""
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import QRectF
+
+from fft_backend import rfft
+
+NFFT = 256
+NOVERLAP = 128
+# Frames transformed at once, which bounds the float64 working memory
+CHUNK_FRAMES = 4096
+# Colour scale span below the loudest cell; silence would otherwise flatten it
+DYNAMIC_RANGE_DB = 120
+MIN_GAIN = 1e-10
+
+
+class SpectrogramData:
+    """Power spectrum in dB of one signal, shaped (frames, frequencies)."""
+
+    def __init__(self, frequencies, times, db, fs, hop):
+        self.frequencies = frequencies
+        self.times = times
+        self.db = db
+        self.fs = fs
+        self.hop = hop
+        peak = float(np.max(db)) if db.size else 0.0
+        self.levels = (max(float(np.min(db)) if db.size else 0.0, peak - DYNAMIC_RANGE_DB), peak)
+
+    @property
+    def nbytes(self):
+        return self.frequencies.nbytes + self.times.nbytes + self.db.nbytes
+
+    @property
+    def rect(self):
+        """Image extent in (seconds, Hz), with every cell centred on its frame time and bin frequency."""
+        bin_width = self.fs / NFFT
+        start = self.times[0] - self.hop / (2 * self.fs) if len(self.times) else 0
+        return QRectF(start, -bin_width / 2, len(self.times) * self.hop / self.fs, len(self.frequencies) * bin_width)
+
+
+def compute_spectrogram(signal, fs, nfft=NFFT, noverlap=NOVERLAP):
+    signal = np.asarray(signal, dtype=np.float64)
+    if len(signal) < nfft:
+        signal = np.pad(signal, (0, nfft - len(signal)))
+    hop = nfft - noverlap
+    window = np.hanning(nfft)
+    frames = np.lib.stride_tricks.sliding_window_view(signal, nfft)[::hop]
+    frequencies = np.fft.rfftfreq(nfft, 1 / fs)
+    times = (np.arange(len(frames)) * hop + nfft / 2) / fs
+
+    # One-sided PSD as in matplotlib.mlab: doubled except DC (and Nyquist for even nfft)
+    scale = np.full(len(frequencies), 2 / (fs * np.sum(window ** 2)))
+    scale[0] /= 2
+    if nfft % 2 == 0:
+        scale[-1] /= 2
+
+    db = np.empty((len(frames), len(frequencies)), dtype=np.float32)
+    for start in range(0, len(frames), CHUNK_FRAMES):
+        spectrum = rfft(frames[start:start + CHUNK_FRAMES] * window, axis=1)
+        power = (spectrum.real ** 2 + spectrum.imag ** 2) * scale
+        db[start:start + CHUNK_FRAMES] = 10 * np.log10(np.maximum(power, 1e-30))
+    return SpectrogramData(frequencies, times, db, fs, hop)
+
+
+class SpectrogramView(pg.PlotWidget):
+    """Time/frequency image with a colour bar, updated in place rather than rebuilt."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.data = None
+        self._buffer = None
+        self.image = pg.ImageItem(axisOrder="col-major")
+        self.image.setAutoDownsample(True)
+        self.addItem(self.image)
+        self.colorBar = pg.ColorBarItem(colorMap=pg.colormap.get("viridis"), interactive=False)
+        self.colorBar.setImageItem(self.image, insert_in=self.getPlotItem())
+        self.setLabel('left', 'Frequency (Hz)')
+        self.setLabel('bottom', 'Time (s)')
+
+    def setSpectrogram(self, data, gains=None):
+        self.data = data
+        self._buffer = None
+        self.image.setRect(data.rect)
+        self.colorBar.setLevels(data.levels)
+        self.setLimits(xMin=data.rect.left(), xMax=data.rect.right(), yMin=data.rect.top(), yMax=data.rect.bottom())
+        self.setGains(gains)
+        self.autoRange()
+
+    def setGains(self, gains=None):
+        """Show the spectrogram scaled by per-bin `gains` (evaluated at `data.frequencies`); None shows it as is."""
+        if self.data is None:
+            return
+        if gains is None:
+            image = self.data.db
+        else:
+            if self._buffer is None:
+                self._buffer = np.empty_like(self.data.db)
+            image = self.gainImage(gains, out=self._buffer)
+        self.showImage(image)
+
+    def gainImage(self, gains, out=None):
+        """The dB image setGains shows for `gains`, in a new array unless `out` is given."""
+        offset = 20 * np.log10(np.maximum(np.abs(gains), MIN_GAIN)).astype(np.float32)
+        return np.add(self.data.db, offset, out=out)
+
+    def showImage(self, image):
+        """Show an image from gainImage for the current data."""
+        self.image.setImage(image, autoLevels=False, levels=self.data.levels)
+
+    def clearSpectrogram(self):
+        self.data = None
+        self._buffer = None
+        self.image.clear()
@@ -0,0 +1,163 @@
+"""
+Block-based STFT overlap-add equalization with bounded memory.
+
+Frames use a periodic sqrt-Hann analysis/synthesis window at 50 % overlap,
+which sums to exactly one, so unity gains reproduce the input to rounding.
+Gains come from a gain-vs-frequency function such as
+`EqualizerEngine.gain_curve()`, so the same band gains and smoothing windows
+are applied on the frame grid instead of the whole-file grid.
+
+Tolerance against `EqualizerEngine.reconstruct()` (RMS difference over the
+input RMS), measured with the default 8192-sample frames:
+
+- Tones at least 50 Hz from every band edge: below 0.15 % in music, animal
+  and uniform mode for every band at gains 0, 0.5, 2 and 5, with rectangle,
+  hamming, hanning and gaussian windows, excluding one frame at either end
+  of the file. This is the bound that catches errors in the overlap-add
+  itself.
+- Within one frame of the start and end of a file the whole-file transform
+  is circular while frames see silence past the ends, so a track loud at
+  both ends differs more there (xylo-contrabass-drums.wav: 0.24 % inside,
+  6.5 % over the whole file with a hanning window at gain 5).
+- Energy within a few frame bins (fs / 8192 Hz each) of a band edge meets a
+  gain step the frames cannot resolve, because the analysis window spreads
+  it over neighbouring bins. On the bundled music tracks (music mode) and
+  animals.wav (animal mode), excluding the file ends, the worst band at
+  gain 0 or 5 differs by at most 1.9 % with hamming and hanning windows
+  (7ram.wav 0.3 %, animals.wav 1.8 %) and by at most 7.3 % with a rectangle
+  window, whose edges are steps at full height (pianoAshraf.wav 7.1 %,
+  ringtone.wav 7.2 %, animals.wav 7.2 %; 7ram.wav 1.1 %). Longer frames do
+  not reliably reduce this part.
+
+Unity gains reproduce the input to rounding (< 1e-9).
+"""
+import numpy as np
+
+from fft_backend import irfft, rfft
+
+FRAME_LENGTH = 8192
+
+
+class StftEqualizer:
+    """
+    Stateful overlap-add processor behind equalize_blocks.
+
+    Blocks are mono or (channels, samples); every channel is framed and
+    transformed in the same vectorized calls along the last axis, with one
+    gain vector for all of them. Gains may be replaced between calls; with `ramp_frames` the change is
+    spread linearly over that many frames so live playback does not click.
+    Output lags input by one hop internally but is trimmed so the output
+    sample count always matches the input.
+    """
+
+    def __init__(self, fs, gain_curve, frame_length=FRAME_LENGTH, ramp_frames=0):
+        self.frame_length = frame_length
+        self.hop = frame_length // 2
+        self.window = np.sqrt(np.hanning(frame_length + 1)[:-1])
+        self.frequencies = np.fft.rfftfreq(frame_length, 1 / fs)
+        self.gains = gain_curve(self.frequencies)
+        self.ramp_frames = ramp_frames
+        self._ramp = None
+        self.reset()
+
+    def reset(self):
+        # Sized by the first block, which fixes the channel layout
+        self._pending = None
+        self._overlap = None
+        self._skip = self.hop
+        self._remaining = 0
+        if self._ramp is not None:
+            # Nothing plays on from before a reset, so a pending gain change applies at once
+            self.gains = self._ramp[1]
+        self._ramp = None
+
+    def _start(self, leading_shape):
+        # One hop of leading zeros so the first input sample is covered by two frames
+        self._pending = np.zeros(leading_shape + (self.hop,))
+        self._overlap = np.zeros(leading_shape + (self.hop,))
+
+    def set_gain_curve(self, gain_curve):
+        target = gain_curve(self.frequencies)
+        if self.ramp_frames:
+            self._ramp = (self.gains.copy(), target, 0)
+        else:
+            self.gains = target
+
+    def process(self, block):
+        """Feed input samples, return the output samples that became final (possibly none)."""
+        if self._pending is None:
+            self._start(block.shape[:-1])
+        self._remaining += block.shape[-1]
+        self._pending = np.concatenate([self._pending, block], axis=-1)
+        if self._pending.shape[-1] < self.frame_length:
+            return np.zeros(self._pending.shape[:-1] + (0,))
+        chunk, self._pending = self._run(self._pending)
+        return self._trim(chunk)
+
+    def flush(self):
+        """Pad the tail with zeros and return every outstanding output sample."""
+        if self._remaining <= 0:
+            return np.zeros(0) if self._pending is None else np.zeros(self._pending.shape[:-1] + (0,))
+        leading_shape = self._pending.shape[:-1]
+        padding = self.frame_length + (-(self._pending.shape[-1] + self.frame_length) % self.hop)
+        chunk, _ = self._run(np.concatenate([self._pending, np.zeros(leading_shape + (padding,))], axis=-1))
+        chunk = self._trim(chunk)[..., :self._remaining]
+        self._remaining -= chunk.shape[-1]
+        self._pending = np.zeros(leading_shape + (self.hop,))
+        return chunk
+
+    def _frame_gains(self, count):
+        if self._ramp is None:
+            return self.gains
+        start, target, step = self._ramp
+        alpha = np.minimum(1, (step + 1 + np.arange(count)) / self.ramp_frames)[:, None]
+        if step + count >= self.ramp_frames:
+            self.gains, self._ramp = target, None
+        else:
+            self._ramp = (start, target, step + count)
+        return start + (target - start) * alpha
+
+    def _run(self, samples):
+        hop = self.hop
+        count = (samples.shape[-1] - hop) // hop
+        frames = np.lib.stride_tricks.sliding_window_view(samples, self.frame_length, axis=-1)[..., :count * hop:hop, :]
+        spectra = rfft(frames * self.window, axis=-1)
+        spectra *= self._frame_gains(count)
+        output = irfft(spectra, n=self.frame_length, axis=-1)
+        output *= self.window
+        heads = output[..., :hop]
+        heads[..., 0, :] += self._overlap
+        heads[..., 1:, :] += output[..., :-1, hop:]
+        self._overlap = output[..., -1, hop:].copy()
+        return heads.reshape(heads.shape[:-2] + (-1,)), samples[..., count * hop:]
+
+    def _trim(self, chunk):
+        if self._skip:
+            dropped = min(self._skip, chunk.shape[-1])
+            self._skip -= dropped
+            chunk = chunk[..., dropped:]
+        self._remaining -= chunk.shape[-1]
+        return chunk
+
+
+def equalize_blocks(blocks, fs, gain_curve, frame_length=FRAME_LENGTH):
+    """
+    Equalize a stream of sample blocks, yielding output blocks as soon as they are final.
+
+    Parameters:
+    - blocks (iterable): Mono or (channels, samples) arrays of any length.
+    - fs (float): Sample rate.
+    - gain_curve (callable): Maps an array of frequencies (Hz) to real gains.
+    - frame_length (int): Even STFT frame length.
+
+    The output has exactly as many samples as the input; peak memory is a few
+    frames plus one input block.
+    """
+    equalizer = StftEqualizer(fs, gain_curve, frame_length)
+    for block in blocks:
+        chunk = equalizer.process(block)
+        if chunk.shape[-1]:
+            yield chunk
+    chunk = equalizer.flush()
+    if chunk.shape[-1]:
+        yield chunk
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from engine import MUSIC_MODE, EqualizerEngine, mode_frequency_ranges
+from iir import equalize_blocks
+
+FS = 44100
+N = 2 * FS
+BLOCK = 4096
+
+
+def tone_gain(output, signal, frequency):
+    """Gain of `output` over `signal` at one tone's frequency, after the filters' transients have died down."""
+    settled = slice(FS // 2, None)
+    spectrum_bins = np.fft.rfftfreq(N - FS // 2, 1 / FS)
+    index = np.argmin(np.abs(spectrum_bins - frequency))
+    return np.abs(np.fft.rfft(output[settled]))[index] / np.abs(np.fft.rfft(signal[settled]))[index]
+
+
+def equalized(signal, band, gain):
+    engine = EqualizerEngine()
+    engine.load(signal, FS, MUSIC_MODE, mode_frequency_ranges(MUSIC_MODE, N))
+    engine.set_gain(band, gain)
+    blocks = (signal[start:start + BLOCK] for start in range(0, N, BLOCK))
+    return engine.reconstruct(), np.concatenate(list(equalize_blocks(blocks, FS, engine.gain_curve())))
+
+
+# Well inside each band: low-shelf passband, then the geometric centres of the peaking bands
+@pytest.mark.parametrize("band, frequency", [(0, 100), (1, 1414), (2, 2449), (3, 4472)])
+@pytest.mark.parametrize("gain", [0.5, 2, 5])
+def test_band_gain_matches_engine_inside_band(band, frequency, gain):
+    signal = np.sin(2 * np.pi * frequency * np.arange(N) / FS)
+    reference, output = equalized(signal, band, gain)
+    # Shapes differ at the edges (see iir.py), but inside a band both apply the slider value
+    assert tone_gain(output, signal, frequency) == pytest.approx(tone_gain(reference, signal, frequency), rel=0.05)
+
+
+@pytest.mark.parametrize("band, frequency", [(1, 1414), (2, 2449), (3, 4472)])
+def test_muted_band_is_cut_by_at_least_25_db(band, frequency):
+    signal = np.sin(2 * np.pi * frequency * np.arange(N) / FS)
+    _, output = equalized(signal, band, 0)
+    assert tone_gain(output, signal, frequency) < 10 ** (-25 / 20)
+
+
+def test_unity_gains_reproduce_input():
+    signal = np.random.default_rng(0).standard_normal(N)
+    _, output = equalized(signal, 0, 1)
+    assert np.max(np.abs(output - signal)) < 1e-9
@@ -0,0 +1,36 @@
+import numpy as np
+
+from signal_cache import ByteLRUCache
+
+
+def block(kib):
+    return np.zeros(kib * 128)  # float64: 8 bytes a sample
+
+
+def test_evicts_least_recently_used_within_budget():
+    cache = ByteLRUCache(3 * 1024)
+    for key in "abc":
+        assert cache.put(key, block(1))
+    assert cache.nbytes == 3 * 1024
+    cache.get("a")
+    cache.put("d", block(1))
+    assert "b" not in cache and all(key in cache for key in "acd")
+    # Replacing an entry charges its new size only
+    cache.put("a", block(2))
+    assert cache.nbytes <= cache.budget_bytes
+    assert cache.nbytes == sum(size for _, size, _ in cache._entries.values())
+    assert not cache.put("huge", block(4))
+    assert cache.stats()["evictions"] == 2
+
+
+def test_owned_entries_go_with_their_owner():
+    cache = ByteLRUCache(3 * 1024)
+    samples = block(2)
+    cache.put("output", samples)
+    # A view of another entry's arrays adds nothing of its own
+    assert cache.put("view", samples[:0], owner="output")
+    assert not cache.put("orphan", samples[:0], owner="missing")
+    cache.put("other", block(1))
+    cache.put("newer", block(1))
+    assert "output" not in cache and "view" not in cache
+    assert cache.nbytes == 2 * 1024
@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+from engine import MUSIC_MODE, UNIFORM_MODE, EqualizerEngine, band_edges_hz, mode_frequency_ranges
+from streaming import FRAME_LENGTH, equalize_blocks
+
+FS = 44100
+BLOCK = 65536
+
+
+def tones(mode, n, margin=50, count=12, seed=1):
+    """Sum of `count` sines at least `margin` Hz from every band edge of `mode`."""
+    rng = np.random.default_rng(seed)
+    edges = np.ravel(band_edges_hz(mode, n, FS, mode_frequency_ranges(mode, n)))
+    freqs = []
+    while len(freqs) < count:
+        f = rng.uniform(20, min(FS / 2 - 100, edges.max() + 2000))
+        if np.min(np.abs(edges - f)) >= margin:
+            freqs.append(f)
+    t = np.arange(n) / FS
+    return sum(np.sin(2 * np.pi * f * t + rng.uniform(0, 2 * np.pi)) for f in freqs) / 4
+
+
+def streamed(signal, gain_curve):
+    blocks = (signal[..., start:start + BLOCK] for start in range(0, signal.shape[-1], BLOCK))
+    return np.concatenate(list(equalize_blocks(blocks, FS, gain_curve)), axis=-1)
+
+
+def relative_error(output, reference, signal):
+    # The whole-file transform is circular and frames are not, so leave out one frame at either end
+    inside = slice(FRAME_LENGTH, -FRAME_LENGTH)
+    return np.sqrt(np.mean((output - reference)[..., inside] ** 2)) / np.sqrt(np.mean(signal ** 2))
+
+
+@pytest.mark.parametrize("mode", [MUSIC_MODE, UNIFORM_MODE])
+@pytest.mark.parametrize("window", [None, (2, None, None)])
+def test_matches_engine_away_from_band_edges(mode, window):
+    n = 5 * FS
+    signal = tones(mode, n)
+    engine = EqualizerEngine()
+    engine.load(signal, FS, mode, mode_frequency_ranges(mode, n))
+    for band in range(len(engine.bands)):
+        for gain in (0, 5):
+            engine.reset_gains()
+            engine.set_gain(band, gain, window)
+            error = relative_error(streamed(signal, engine.gain_curve()), engine.reconstruct(), signal)
+            # streaming.py states 0.15 % for tones 50 Hz or more from every edge
+            assert error < 0.0015, (band, gain, error)
+
+
+def test_unity_gains_reproduce_stereo_input():
+    signal = np.random.default_rng(0).standard_normal((2, 3 * BLOCK + 123))
+    engine = EqualizerEngine()
+    engine.load(signal, FS, MUSIC_MODE, mode_frequency_ranges(MUSIC_MODE, signal.shape[-1]))
+    output = streamed(signal, engine.gain_curve())
+    assert output.shape == signal.shape
+    assert np.max(np.abs(output - signal)) < 1e-9
@@ -0,0 +1,470 @@
+from collections import OrderedDict
+
+import numpy as np
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from audio_io import BLOCK_SIZE, open_audio
+from csv_io import read_csv
+from engine import SignalAnalysis, band_gain_curve, mode_frequency_ranges, unity_gain
+from export import write_blocks
+from holter import HolterRecord, is_holter
+from profiler import Profiler
+from spectrogram import compute_spectrogram
+
+# Share of a load's progress bar spent decoding; the FFT takes the rest
+DECODE_PROGRESS = 80
+
+
+class _RecomputeJob(QRunnable):
+    def __init__(self, scheduler, serial, generation, updates, preview=False):
+        super().__init__()
+        self.scheduler = scheduler
+        self.serial = serial
+        self.generation = generation
+        self.updates = updates
+        self.preview = preview
+
+    def run(self):
+        scheduler = self.scheduler
+        try:
+            engine = scheduler.engine
+            profiler = scheduler.profiler
+            with profiler.stage("gain"):
+                for band_index, (value, window) in self.updates.items():
+                    engine.set_gain(band_index, value, window)
+            # Gains are always applied so later jobs start from the right state,
+            # but the expensive part is skipped once newer events have arrived
+            if self.generation == scheduler.generation and self.preview and not scheduler.isCached():
+                with profiler.stage("preview"):
+                    proxy = engine.reconstruct_proxy()
+                if self.generation == scheduler.generation:
+                    scheduler.previewReady.emit(self.generation, engine.gains.copy(), proxy, engine.proxy_factor)
+            elif self.generation == scheduler.generation:
+                key, reconstructed_signal = scheduler.reconstruct()
+                if self.generation == scheduler.generation:
+                    scheduler.resultReady.emit(self.generation, engine.gains.copy(), reconstructed_signal, key)
+        except Exception as e:
+            print(f"Recompute error: {e}")
+        finally:
+            scheduler._jobDone.emit(self.serial)
+
+
+class _SpectrogramJob(QRunnable):
+    def __init__(self, worker, serial, key, signal, fs):
+        super().__init__()
+        self.worker = worker
+        self.serial = serial
+        self.key = key
+        self.signal = signal
+        self.fs = fs
+
+    def run(self):
+        worker = self.worker
+        # Another file was selected while this one waited in the queue
+        if self.serial != worker.serial:
+            return
+        try:
+            with worker.profiler.stage("spectrogram_stft"):
+                data = compute_spectrogram(self.signal, self.fs)
+            worker._computed.emit(self.serial, self.key, data)
+        except Exception as e:
+            print(f"Spectrogram error: {e}")
+
+
+class SpectrogramWorker(QObject):
+    """
+    Computes original-signal spectrograms on a background thread.
+
+    Only the latest request is delivered; `key` is handed back untouched so
+    the caller can cache the result.
+
+    Signals:
+    - ready(key, spectrogram_data)
+    """
+    ready = pyqtSignal(object, object)
+    _computed = pyqtSignal(int, object, object)
+
+    def __init__(self, parent=None, profiler=None):
+        super().__init__(parent)
+        self.profiler = profiler or Profiler(enabled=False)
+        self.serial = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._computed.connect(self._onComputed)
+
+    def request(self, key, signal, fs):
+        self.serial += 1
+        self._pool.start(_SpectrogramJob(self, self.serial, key, signal, fs))
+
+    def cancel(self):
+        self.serial += 1
+
+    def _onComputed(self, serial, key, data):
+        if serial == self.serial:
+            self.ready.emit(key, data)
+
+
+class RecomputeScheduler(QObject):
+    """
+    Runs slider-driven engine updates on one background thread.
+
+    Bursts of slider events are collapsed into the latest value per band, only
+    one job is in flight at a time, and results superseded by newer events are
+    dropped instead of being handed back to the GUI thread. With a
+    ReconstructionCache, outputs are stored under `signalKey` and the current
+    gains, and returning to a setting seen before skips the inverse FFT.
+
+    While `setInteractive(True)` (a slider is being dragged) jobs reconstruct
+    the engine's decimated proxy instead of the full output, unless the
+    output is cached; `setInteractive(False)` queues one full reconstruction
+    of the latest gains to replace the last preview.
+
+    Signals:
+    - resultReady(generation, gains, reconstructed_signal, key), with the
+      per-bin slider gains so the caller can scale whichever channel view it
+      shows, and the reconstruction cache key of the output (or None)
+    - previewReady(generation, gains, proxy, factor), the output decimated
+      by `factor` (see EqualizerEngine.reconstruct_proxy)
+    """
+    resultReady = pyqtSignal(int, object, object, object)
+    previewReady = pyqtSignal(int, object, object, int)
+    _jobDone = pyqtSignal(int)
+
+    def __init__(self, engine, parent=None, profiler=None, cache=None):
+        super().__init__(parent)
+        self.engine = engine
+        self.profiler = profiler or Profiler(enabled=False)
+        self.cache = cache
+        self.signalKey = None
+        self.generation = 0
+        self.interactive = False
+        self.bandSettings = OrderedDict()
+        self._pending = {}
+        self._previewed = False
+        self._refine = False
+        self._serial = 0
+        self._running = None
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._jobDone.connect(self._onJobDone)
+
+    def submit(self, band_index, value, window=None):
+        # Re-insert so the dict keeps last-writer order for overlapping bands
+        self._pending.pop(band_index, None)
+        self._pending[band_index] = (value, window)
+        self.bandSettings.pop(band_index, None)
+        self.bandSettings[band_index] = (value, window)
+        self.generation += 1
+        if self._running is None:
+            self._startNext()
+
+    def setInteractive(self, interactive):
+        """Switch between proxy previews (while dragging) and full reconstructions."""
+        if interactive == self.interactive:
+            return
+        self.interactive = interactive
+        if not interactive and self._previewed:
+            # The shown output is a preview; supersede it with the full one
+            self._refine = True
+            self.generation += 1
+            if self._running is None:
+                self._startNext()
+
+    def cancel(self):
+        """Drop pending updates and wait for the in-flight job, e.g. before the engine loads a new signal."""
+        self._pending.clear()
+        self._previewed = False
+        self._refine = False
+        self.bandSettings.clear()
+        self.generation += 1
+        self._pool.waitForDone()
+        self._running = None
+
+    def restore(self, band_settings):
+        """Apply band settings to an engine that just loaded another part of the same signal (a Holter window)."""
+        for band_index, (value, window) in band_settings.items():
+            self.engine.set_gain(band_index, value, window)
+        self.bandSettings = OrderedDict(band_settings)
+
+    def isCached(self):
+        """Whether the output for the engine's current gains is in the reconstruction cache."""
+        key = self.cache.gain_key(self.signalKey, self.engine.gains) if self.cache is not None else None
+        return key is not None and key in self.cache
+
+    def reconstruct(self):
+        """(cache key, engine output) for the engine's current gains, reusing a cached output when there is one."""
+        engine = self.engine
+        key = self.cache.gain_key(self.signalKey, engine.gains) if self.cache is not None else None
+        reconstructed_signal = self.cache.get(key) if key else None
+        if reconstructed_signal is None:
+            with self.profiler.stage("reconstruct"):
+                reconstructed_signal = engine.reconstruct()
+            self.profiler.count_recompute()
+            if key:
+                self.cache.put(key, reconstructed_signal)
+        return key, reconstructed_signal
+
+    def gainCurve(self):
+        """Gain-vs-frequency function of the latest submitted gains, without waiting for the worker."""
+        engine = self.engine
+        if not engine.loaded:
+            return unity_gain
+        return band_gain_curve(engine.mode, engine.length, engine.fs, engine.frequency_ranges, self.bandSettings)
+
+    def _startNext(self):
+        updates, self._pending = self._pending, {}
+        preview = self.interactive and self.engine.proxy_factor > 1
+        self._previewed = preview
+        self._refine = False
+        self._serial += 1
+        self._running = self._serial
+        self._pool.start(_RecomputeJob(self, self._serial, self.generation, updates, preview))
+
+    def _onJobDone(self, serial):
+        if serial != self._running:
+            return
+        self._running = None
+        if self._pending or self._refine:
+            self._startNext()
+
+
+class _Cancelled(Exception):
+    pass
+
+
+class _LoadJob(QRunnable):
+    def __init__(self, loader, key, file_path, mode):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+        self.file_path = file_path
+        self.mode = mode
+
+    def run(self):
+        loader = self.loader
+        try:
+            self._check()
+            # Another job (e.g. a prefetch) finished the same file meanwhile
+            analysis = loader.cache.get(self.key) if self.key in loader.cache else None
+            if analysis is not None:
+                loader._finished.emit(self.key, analysis)
+                return
+            with loader.profiler.stage("decode"):
+                signal, fs, time = self._decode()
+            self._check()
+            ranges = mode_frequency_ranges(self.mode, signal.shape[-1])
+            if time is not None and is_holter(self.mode, signal.shape[-1], fs):
+                # Windows are analysed when viewed; loading only builds the plot summary
+                with loader.profiler.stage("summary"):
+                    analysis = HolterRecord(time, signal, fs, self.mode, ranges)
+            else:
+                with loader.profiler.stage("fft"):
+                    analysis = SignalAnalysis(signal, fs, self.mode, ranges, time=time, dtype=loader.dtype)
+            loader.cache.put(self.key, analysis)
+            loader._finished.emit(self.key, analysis)
+        except _Cancelled:
+            loader._finished.emit(self.key, None)
+        except Exception as e:
+            loader._failed.emit(self.key, self.file_path, str(e))
+
+    def _check(self):
+        # Neither the selection nor a prefetch wants this file any more
+        if not self.loader.wanted(self.key):
+            raise _Cancelled()
+
+    def _decode(self):
+        if self.file_path.lower().endswith(".csv"):
+            time, signal, fs = read_csv(self.file_path)
+            return signal, fs, time
+        source = open_audio(self.file_path)
+        n = len(source)
+        # Multichannel files keep their channels, shaped (channels, samples)
+        signal = np.empty(source.channel_shape(n, mono=False), dtype=source.dtype)
+        # The preview span is decoded first, as a block of its own, and shown while the rest decodes
+        preview = min(int(self.loader.preview_seconds * source.fs), n)
+        edges = sorted(set(range(0, n, max(n // 20, BLOCK_SIZE))) | {preview, n})
+        for start, stop in zip(edges, edges[1:]):
+            self._check()
+            signal[..., start:stop] = source.read(start, stop, mono=False)
+            self.loader._progress.emit(self.key, DECODE_PROGRESS * stop // n)
+            if stop == preview:
+                self.loader._previewed.emit(self.key, signal[..., :preview], source.fs)
+        return signal, source.fs, None
+
+
+class FileLoader(QObject):
+    """
+    Decodes and analyses list entries on a worker pool into the signal cache.
+
+    `load` makes a file the current one; its result is delivered through
+    `loaded`, and a newer `load` cancels it between decode blocks. `prefetch`
+    speculatively analyses other files (e.g. the list neighbours) at a lower
+    priority so selecting them later is a cache hit; prefetches no longer
+    named in the latest call are cancelled the same way. A prefetch that is
+    still running when its file gets selected is simply promoted.
+
+    Audio is decoded once, here: with `preview_seconds` the current load
+    also hands over the start of the file as soon as that much is decoded.
+
+    Signals:
+    - progress(percent) of the current load
+    - previewed(key, samples, fs), the first `preview_seconds` of an audio
+      file, mono or (channels, samples)
+    - loaded(key, analysis)
+    - failed(file_path, message)
+    """
+    progress = pyqtSignal(int)
+    previewed = pyqtSignal(object, object, float)
+    loaded = pyqtSignal(object, object)
+    failed = pyqtSignal(str, str)
+    _progress = pyqtSignal(object, int)
+    _previewed = pyqtSignal(object, object, float)
+    _finished = pyqtSignal(object, object)
+    _failed = pyqtSignal(object, str, str)
+
+    def __init__(self, cache, parent=None, profiler=None, dtype=np.float64, threads=2, preview_seconds=0):
+        super().__init__(parent)
+        self.cache = cache
+        self.profiler = profiler or Profiler(enabled=False)
+        self.dtype = dtype
+        self.preview_seconds = preview_seconds
+        self.current = None
+        self._prefetching = set()
+        self._running = {}
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(threads)
+        self._progress.connect(self._onProgress)
+        self._previewed.connect(self._onPreviewed)
+        self._finished.connect(self._onFinished)
+        self._failed.connect(self._onFailed)
+
+    def wanted(self, key):
+        # Read from worker threads; a stale answer only delays a cancellation by one block
+        return key == self.current or key in self._prefetching
+
+    def load(self, file_path, mode, key):
+        self.current = key
+        if key not in self._running:
+            self._start(key, file_path, mode, priority=1)
+
+    def prefetch(self, entries):
+        """Analyse (file_path, mode, key) entries that are not cached yet, replacing earlier prefetches."""
+        self._prefetching = {key for _, _, key in entries}
+        for file_path, mode, key in entries:
+            if key not in self._running and key not in self.cache:
+                self._start(key, file_path, mode, priority=0)
+
+    def cancel(self):
+        self.current = None
+        self._prefetching = set()
+
+    def _start(self, key, file_path, mode, priority):
+        self._running[key] = (file_path, mode)
+        self._pool.start(_LoadJob(self, key, file_path, mode), priority)
+
+    def _onProgress(self, key, percent):
+        if key == self.current:
+            self.progress.emit(percent)
+
+    def _onPreviewed(self, key, samples, fs):
+        if key == self.current:
+            self.previewed.emit(key, samples, fs)
+
+    def _onFinished(self, key, analysis):
+        file_path, mode = self._running.pop(key)
+        if analysis is None:
+            # Cancelled, but selected or prefetched again before the job noticed
+            if self.wanted(key):
+                self._start(key, file_path, mode, priority=int(key == self.current))
+            return
+        if key == self.current:
+            self.progress.emit(100)
+            self.loaded.emit(key, analysis)
+
+    def _onFailed(self, key, file_path, message):
+        self._running.pop(key, None)
+        if key == self.current:
+            self.failed.emit(file_path, message)
+
+
+class _ExportJob(QRunnable):
+    def __init__(self, exporter, serial, file_path, blocks, fs, channels, length, export_format, dither):
+        super().__init__()
+        self.exporter = exporter
+        self.serial = serial
+        self.file_path = file_path
+        self.blocks = blocks
+        self.fs = fs
+        self.channels = channels
+        self.length = length
+        self.export_format = export_format
+        self.dither = dither
+
+    def run(self):
+        exporter = self.exporter
+
+        def progress(fraction):
+            exporter._progress.emit(self.serial, int(100 * fraction))
+
+        try:
+            with exporter.profiler.stage("export"):
+                done = write_blocks(self.file_path, self.blocks, self.fs, self.channels, self.length,
+                                    self.export_format, self.dither, progress=progress,
+                                    cancelled=lambda: self.serial != exporter.serial)
+            if done:
+                exporter._finished.emit(self.serial, self.file_path)
+        except Exception as e:
+            exporter._failed.emit(self.serial, self.file_path, str(e))
+
+
+class AudioExporter(QObject):
+    """
+    Writes equalized audio on a background thread, one export at a time.
+
+    `export` takes the output as an iterable of blocks, which the worker
+    pulls (and so computes, for a generator) one at a time; a newer export
+    or `cancel` stops the running one between blocks and deletes its
+    partial file.
+
+    Signals:
+    - progress(percent)
+    - finished(file_path)
+    - failed(file_path, message)
+    """
+    progress = pyqtSignal(int)
+    finished = pyqtSignal(str)
+    failed = pyqtSignal(str, str)
+    _progress = pyqtSignal(int, int)
+    _finished = pyqtSignal(int, str)
+    _failed = pyqtSignal(int, str, str)
+
+    def __init__(self, parent=None, profiler=None):
+        super().__init__(parent)
+        self.profiler = profiler or Profiler(enabled=False)
+        self.serial = 0
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._progress.connect(self._onProgress)
+        self._finished.connect(self._onFinished)
+        self._failed.connect(self._onFailed)
+
+    def export(self, file_path, blocks, fs, channels, length, export_format="wav16", dither=False):
+        """Write `length` samples of `channels`-channel audio from `blocks` (see export.write_blocks)."""
+        self.serial += 1
+        self._pool.start(_ExportJob(self, self.serial, file_path, blocks, fs, channels, length, export_format,
+                                    dither))
+
+    def cancel(self):
+        self.serial += 1
+
+    def _onProgress(self, serial, percent):
+        if serial == self.serial:
+            self.progress.emit(percent)
+
+    def _onFinished(self, serial, file_path):
+        if serial == self.serial:
+            self.finished.emit(file_path)
+
+    def _onFailed(self, serial, file_path, message):
+        if serial == self.serial:
+            self.failed.emit(file_path, message)